@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark the exact and MinHash dedupe engines.
+
+Usage:
+    python3 benchmarks/bench_dedupe.py [--sizes 25,50,100,...] [--repeat N]
+
+Generates synthetic X-post-length items (about 1 in 5 a light edit of an
+earlier one), times find_duplicates with each engine and reports MinHash
+recall against the exact result. Use it to place MINHASH_MIN_ITEMS at the
+crossover. A second table compares string n-gram sets with the integer
+shingles the engines use: memory held and all-pairs Jaccard time.
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dedupe, schema
+
+# Real posts draw on a large vocabulary; a few hundred themed words plus
+# random filler keeps unrelated items about as dissimilar as real ones
+_vocab_rng = random.Random(42)
+WORDS = (
+    "claude code skill agent prompt model context window tool plugin release "
+    "update benchmark latency token cost workflow repo commit review bug fix "
+    "feature python rust typescript api server client cache deploy test eval "
+    "reddit thread post comment upvote trend week month launch demo video"
+).split() + [
+    "".join(_vocab_rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(_vocab_rng.randint(3, 9)))
+    for _ in range(3000)
+]
+
+
+def make_items(n: int, seed: int = 0) -> list:
+    """Build n synthetic XItems, roughly 20% near-duplicates of earlier ones."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        if texts and rng.random() < 0.2:
+            words = rng.choice(texts).split()
+            # Light edit: swap one word, append one
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            words.append(rng.choice(WORDS))
+            texts.append(" ".join(words))
+        else:
+            texts.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30))))
+    return [schema.XItem(id=f"X{i}", text=t, url="", author_handle="") for i, t in enumerate(texts)]
+
+
+def time_engine(items: list, engine: str, repeat: int) -> tuple:
+    best = float("inf")
+    pairs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pairs = dedupe.find_duplicates(items, 0.7, engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best, pairs
+
+
+def _string_jaccard(set1, set2):
+    # The pre-integer-shingle implementation, kept for comparison
+    if not set1 or not set2:
+        return 0.0
+    intersection = len(set1 & set2)
+    union = len(set1 | set2)
+    return intersection / union if union > 0 else 0.0
+
+
+def bench_shingles(items: list) -> tuple:
+    """Measure memory and all-pairs Jaccard time for both shingle forms.
+
+    Returns:
+        Tuple of (str_bytes, int_bytes, str_seconds, int_seconds)
+    """
+    texts = [dedupe.get_item_text(item) for item in items]
+    results = []
+    for build, jaccard in (
+        (dedupe.get_ngrams, _string_jaccard),
+        (dedupe.get_shingles, dedupe.jaccard_similarity),
+    ):
+        tracemalloc.start()
+        sets = [build(t) for t in texts]
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for i in range(len(sets)):
+            for j in range(i + 1, len(sets)):
+                jaccard(sets[i], sets[j])
+        results.append((held, time.perf_counter() - start))
+    (str_bytes, str_t), (int_bytes, int_t) = results
+    return str_bytes, int_bytes, str_t, int_t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="25,50,100,200,400,800,1600")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| items | exact (ms) | minhash (ms) | speedup | recall |")
+    print("|------:|-----------:|-------------:|--------:|-------:|")
+    for n in (int(x) for x in args.sizes.split(",")):
+        items = make_items(n)
+        exact_t, exact_pairs = time_engine(items, "exact", args.repeat)
+        minhash_t, minhash_pairs = time_engine(items, "minhash", args.repeat)
+        recall = len(set(minhash_pairs) & set(exact_pairs)) / len(exact_pairs) if exact_pairs else 1.0
+        print(f"| {n} | {exact_t * 1000:.1f} | {minhash_t * 1000:.1f} | "
+              f"{exact_t / minhash_t:.2f}x | {recall:.3f} |")
+
+    print()
+    print("| items | str n-grams (KiB) | int shingles (KiB) | str jaccard (ms) | int jaccard (ms) |")
+    print("|------:|------------------:|-------------------:|-----------------:|-----------------:|")
+    for n in (int(x) for x in args.sizes.split(",")):
+        if n > 800:
+            continue  # all-pairs loop gets slow
+        str_bytes, int_bytes, str_t, int_t = bench_shingles(make_items(n))
+        print(f"| {n} | {str_bytes / 1024:.0f} | {int_bytes / 1024:.0f} | "
+              f"{str_t * 1000:.1f} | {int_t * 1000:.1f} |")
+
+
+if __name__ == "__main__":
+    main()
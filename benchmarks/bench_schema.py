@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark memory held by schema items, slotted vs __dict__-backed.
+
+Usage:
+    python3 benchmarks/bench_schema.py [--sizes 10000,100000] [--repeat N]
+
+Builds synthetic Reddit and X items (with Engagement, SubScores and, for
+Reddit, two comments) from the slotted schema classes and from plain
+dataclass copies of them, and reports bytes held per item and build time.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema
+
+
+def _plain_copy(cls):
+    """The same dataclass without slots (the pre-slots layout)."""
+    specs = []
+    for f in fields(cls):
+        if f.default_factory is not MISSING:
+            specs.append((f.name, f.type, field(default_factory=f.default_factory)))
+        elif f.default is not MISSING:
+            specs.append((f.name, f.type, field(default=f.default)))
+        else:
+            specs.append((f.name, f.type))
+    return make_dataclass(cls.__name__, specs)
+
+
+SLOTTED = {
+    name: getattr(schema, name)
+    for name in ("Engagement", "Comment", "SubScores", "RedditItem", "XItem")
+}
+PLAIN = {name: _plain_copy(cls) for name, cls in SLOTTED.items()}
+
+
+def make_items(classes: dict, n: int) -> list:
+    """Build n/2 Reddit and n/2 X items from the given class set."""
+    Engagement, Comment, SubScores = classes["Engagement"], classes["Comment"], classes["SubScores"]
+    items = []
+    for i in range(n // 2):
+        items.append(classes["RedditItem"](
+            id=f"R{i}",
+            title=f"Thread title number {i}",
+            url=f"https://www.reddit.com/r/test/comments/{i:x}/",
+            subreddit="test",
+            date="2026-01-15",
+            date_confidence="high",
+            engagement=Engagement(score=i % 5000, num_comments=i % 300, upvote_ratio=0.9),
+            top_comments=[
+                Comment(score=10, date="2026-01-15", author="a", excerpt="First", url=""),
+                Comment(score=5, date="2026-01-16", author="b", excerpt="Second", url=""),
+            ],
+            subs=SubScores(relevance=80, recency=60, engagement=40),
+            score=70,
+        ))
+        items.append(classes["XItem"](
+            id=f"X{i}",
+            text=f"Post text number {i}",
+            url=f"https://x.com/user/status/{i}",
+            author_handle="user",
+            date="2026-01-15",
+            date_confidence="high",
+            engagement=Engagement(likes=i % 1000, reposts=i % 100, replies=i % 10, quotes=0),
+            subs=SubScores(relevance=80, recency=60, engagement=40),
+            score=70,
+        ))
+    return items
+
+
+def measure(classes: dict, n: int, repeat: int) -> tuple:
+    """Returns (bytes held per item, best build seconds)."""
+    best = float("inf")
+    held = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        items = make_items(classes, n)
+        best = min(best, time.perf_counter() - start)
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del items
+    return held / n, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not hasattr(schema.RedditItem, "__slots__"):
+        print("This Python has no dataclass slots (3.10+): both columns use __dict__\n")
+
+    print("| items | dict (B/item) | slots (B/item) | saved | dict build (ms) | slots build (ms) |")
+    print("|------:|--------------:|---------------:|------:|----------------:|-----------------:|")
+    for n in (int(x) for x in args.sizes.split(",")):
+        plain_bytes, plain_t = measure(PLAIN, n, args.repeat)
+        slot_bytes, slot_t = measure(SLOTTED, n, args.repeat)
+        print(f"| {n} | {plain_bytes:.0f} | {slot_bytes:.0f} | {1 - slot_bytes / plain_bytes:.0%} | "
+              f"{plain_t * 1000:.1f} | {slot_t * 1000:.1f} |")
+
+
+if __name__ == "__main__":
+    main()
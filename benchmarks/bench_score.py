@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark the Python and NumPy scoring engines.
+
+Usage:
+    python3 benchmarks/bench_score.py [--sizes 100,1000,...] [--repeat N]
+
+Generates synthetic Reddit and X items with realistic gaps (missing
+engagement, missing dates), times score_items with each available engine
+and checks that both engines produce identical scores. Use it to place
+NUMPY_MIN_ITEMS at the crossover.
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dates, schema, score
+
+
+def _maybe(rng: random.Random, value, p_none: float = 0.1):
+    return None if rng.random() < p_none else value
+
+
+def make_items(source: str, n: int, seed: int = 0) -> list:
+    """Build n synthetic items for source ('reddit' or 'x')."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        date = _maybe(rng, f"2026-01-{rng.randint(1, 31):02d}")
+        confidence = rng.choice(["high", "med", "low"])
+        if source == "reddit":
+            engagement = _maybe(rng, schema.Engagement(
+                score=_maybe(rng, rng.randint(0, 5000)),
+                num_comments=_maybe(rng, rng.randint(0, 900)),
+                upvote_ratio=_maybe(rng, rng.random()),
+            ))
+            items.append(schema.RedditItem(
+                id=f"R{i}", title="", url="", subreddit="", date=date,
+                date_confidence=confidence, engagement=engagement, relevance=rng.random(),
+            ))
+        else:
+            engagement = _maybe(rng, schema.Engagement(
+                likes=_maybe(rng, rng.randint(0, 50000)),
+                reposts=_maybe(rng, rng.randint(0, 5000)),
+                replies=_maybe(rng, rng.randint(0, 500)),
+                quotes=_maybe(rng, rng.randint(0, 100)),
+            ))
+            items.append(schema.XItem(
+                id=f"X{i}", text="", url="", author_handle="", date=date,
+                date_confidence=confidence, engagement=engagement, relevance=rng.random(),
+            ))
+    return items
+
+
+def time_engine(items: list, source: str, engine: str, ctx, repeat: int) -> tuple:
+    best = float("inf")
+    scored = []
+    for _ in range(repeat):
+        batch = copy.deepcopy(items)
+        start = time.perf_counter()
+        score.score_items(batch, source, ctx, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        scored = [(item.score, item.subs.relevance, item.subs.recency, item.subs.engagement) for item in batch]
+    return best, scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="100,1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+    engines = ["python"] + (["numpy"] if score.np is not None else [])
+    if score.np is None:
+        print("NumPy not installed: timing the Python engine only\n")
+
+    print("| source | items | " + " | ".join(f"{e} (ms)" for e in engines) + " | identical |")
+    print("|-------:|------:|" + "|".join("------:" for _ in engines) + "|----------:|")
+    for source in ("reddit", "x"):
+        for n in (int(x) for x in args.sizes.split(",")):
+            items = make_items(source, n)
+            results = [time_engine(items, source, e, ctx, args.repeat) for e in engines]
+            identical = all(r[1] == results[0][1] for r in results)
+            print(f"| {source} | {n} | " + " | ".join(f"{r[0] * 1000:.1f}" for r in results)
+                  + f" | {'yes' if identical else 'NO'} |")
+
+
+if __name__ == "__main__":
+    main()
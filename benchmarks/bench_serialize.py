@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark Report serialization: the old stdlib path vs serialize backends.
+
+Usage:
+    python3 benchmarks/bench_serialize.py [--sizes 1000,10000] [--repeat N]
+
+Builds a synthetic Report with n Reddit and n X items and times the write
+side (to_dict + encode, as write_outputs/--emit=json do) and the read side
+(decode + Report.from_dict, as a cache hit does). "stdlib indent=2" is the
+pre-serialize code path; the other columns use serialize with each
+importable backend writing compact JSON.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema, serialize
+
+
+def make_report(n: int) -> schema.Report:
+    report = schema.create_report("benchmark topic", "2026-01-01", "2026-01-31", "both")
+    for i in range(n):
+        report.reddit.append(schema.RedditItem(
+            id=f"R{i}",
+            title=f"Thread title number {i} about the benchmark topic",
+            url=f"https://www.reddit.com/r/test/comments/{i:x}/",
+            subreddit="test",
+            date="2026-01-15",
+            date_confidence="high",
+            engagement=schema.Engagement(score=i % 5000, num_comments=i % 300, upvote_ratio=0.93),
+            top_comments=[
+                schema.Comment(score=10, date="2026-01-15", author="a", excerpt="A useful comment", url=""),
+            ],
+            comment_insights=["People like it"],
+            relevance=0.8,
+            why_relevant="Directly about the topic",
+            subs=schema.SubScores(relevance=80, recency=60, engagement=40),
+            score=70,
+        ))
+        report.x.append(schema.XItem(
+            id=f"X{i}",
+            text=f"Post text number {i} about the benchmark topic, with some more words",
+            url=f"https://x.com/user/status/{i}",
+            author_handle="user",
+            date="2026-01-15",
+            date_confidence="high",
+            engagement=schema.Engagement(likes=i % 1000, reposts=i % 100, replies=i % 10, quotes=1),
+            relevance=0.7,
+            why_relevant="Mentions the topic",
+            subs=schema.SubScores(relevance=70, recency=60, engagement=30),
+            score=60,
+        ))
+    return report
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    backends = [b for b in serialize.BACKENDS if serialize._available(b)]
+    columns = ["stdlib indent=2"] + backends
+    print("| items | side | " + " | ".join(f"{c} (ms)" for c in columns) + " |")
+    print("|------:|-----:|" + "|".join("-----:" for _ in columns) + "|")
+    for n in (int(x) for x in args.sizes.split(",")):
+        report = make_report(n)
+        old_text = json.dumps(report.to_dict(), indent=2)
+
+        write = [best_of(lambda: json.dumps(report.to_dict(), indent=2), args.repeat)]
+        read = [best_of(lambda: schema.Report.from_dict(json.loads(old_text)), args.repeat)]
+        for backend in backends:
+            data = serialize.dumps_bytes(report.to_dict(), backend=backend)
+            write.append(best_of(lambda: serialize.dumps_bytes(report.to_dict(), backend=backend), args.repeat))
+            read.append(best_of(lambda: schema.Report.from_dict(serialize.loads(data, backend=backend)), args.repeat))
+
+        for side, times in (("write", write), ("read", read)):
+            print(f"| {2 * n} | {side} | " + " | ".join(f"{t * 1000:.1f}" for t in times) + " |")
+
+
+if __name__ == "__main__":
+    main()
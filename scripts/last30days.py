@@ -12,13 +12,18 @@ Options:
     --quick             Faster research with fewer sources (8-12 each)
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
     --debug             Enable verbose debug logging
+    --refresh           Bypass the report cache and fetch fresh data
+    --cache-ttl=HOURS   Reuse cached reports younger than HOURS (default: 24)
+    --budget=SECONDS    Return partial results once SECONDS have elapsed
+    --hedge-after=SECS  Start Reddit fallback queries if the main one is still
+                        running after SECS (default: only when it comes back sparse)
 """
 
 import argparse
 import json
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -28,7 +33,9 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib import (
     bird_x,
+    cache,
     dates,
+    deadline as deadline_mod,
     dedupe,
     entity_extract,
     env,
@@ -40,6 +47,7 @@ from lib import (
     render,
     schema,
     score,
+    serialize,
     ui,
     websearch,
     xai_x,
@@ -55,6 +63,56 @@ def load_fixture(name: str) -> dict:
     return {}
 
 
+def _merge_by_url(items: list, new_items: list):
+    """Append new_items whose canonical URL isn't already in items (in place)."""
+    existing_urls = {dedupe.canonical_url(item.get("url", "")) for item in items}
+    for item in new_items:
+        key = dedupe.canonical_url(item.get("url", ""))
+        if key not in existing_urls:
+            items.append(item)
+            existing_urls.add(key)
+
+
+def _launch_hedges(
+    executor: ThreadPoolExecutor,
+    main_future,
+    run_query,
+    topic: str,
+    fallbacks: list,
+    hedge_after: float,
+    deadline: deadline_mod.Deadline,
+) -> dict:
+    """Start Reddit fallback queries without waiting for the main one.
+
+    Hedges launch once hedge_after seconds pass with the main query still
+    in flight (straight away for topics that were sparse last time), or as
+    soon as it returns with fewer items than a fallback's threshold. At most
+    openai_reddit.get_hedge_max_queries() are started per run.
+
+    Returns:
+        Dict of future -> query for the launched hedges
+    """
+    delay = 0 if cache.is_sparse_topic(topic) else hedge_after
+    wait([main_future], timeout=delay)
+
+    candidates = fallbacks
+    if main_future.done():
+        try:
+            count = len(openai_reddit.parse_reddit_response(main_future.result()))
+        except Exception:
+            return {}  # The cascade never runs after a failed main query
+        candidates = [(query, min_items) for query, min_items in fallbacks if count < min_items]
+
+    if deadline.expired():
+        if candidates:
+            deadline.mark_cut_short()
+        return {}
+    return {
+        executor.submit(run_query, query): query
+        for query, _ in candidates[:openai_reddit.get_hedge_max_queries()]
+    }
+
+
 def _search_reddit(
     topic: str,
     config: dict,
@@ -63,27 +121,52 @@ def _search_reddit(
     to_date: str,
     depth: str,
     mock: bool,
+    deadline: deadline_mod.Deadline = None,
+    hedge_after: float = None,
 ) -> tuple:
     """Search Reddit via OpenAI (runs in thread).
 
+    Sparse results fall back to a core-subject query, then a
+    subreddit-targeted one. With hedge_after set, fallbacks are started
+    speculatively (see _launch_hedges) and merged by URL as they arrive;
+    any beyond the hedge cap still run in sequence. Fallback queries are
+    skipped once the deadline has passed.
+
     Returns:
         Tuple of (reddit_items, raw_openai, error)
     """
     raw_openai = None
     reddit_error = None
+    deadline = deadline or deadline_mod.Deadline()
 
     if mock:
         raw_openai = load_fixture("openai_sample.json")
-    else:
-        try:
-            raw_openai = openai_reddit.search_reddit(
-                config["OPENAI_API_KEY"],
-                selected_models["openai"],
-                topic,
-                from_date,
-                to_date,
-                depth=depth,
+        return openai_reddit.parse_reddit_response(raw_openai or {}), raw_openai, reddit_error
+
+    def run_query(query):
+        return openai_reddit.search_reddit(
+            config["OPENAI_API_KEY"],
+            selected_models["openai"],
+            query,
+            from_date,
+            to_date,
+            depth=depth,
+            deadline=deadline,
+        )
+
+    fallbacks = openai_reddit.get_fallback_queries(topic)
+
+    executor = ThreadPoolExecutor(max_workers=1 + len(fallbacks))
+    try:
+        main_future = executor.submit(run_query, topic)
+        hedges = {}
+        if hedge_after is not None:
+            hedges = _launch_hedges(
+                executor, main_future, run_query, topic, fallbacks, hedge_after, deadline,
             )
+
+        try:
+            raw_openai = main_future.result()
         except http.HTTPError as e:
             raw_openai = {"error": str(e)}
             reddit_error = f"API error: {e}"
@@ -91,46 +174,46 @@ def _search_reddit(
             raw_openai = {"error": str(e)}
             reddit_error = f"{type(e).__name__}: {e}"
 
-    # Parse response
-    reddit_items = openai_reddit.parse_reddit_response(raw_openai or {})
+        # Parse response
+        reddit_items = openai_reddit.parse_reddit_response(raw_openai or {})
+        if hedge_after is not None and not reddit_error:
+            # Only hedging reads the yield back (see _launch_hedges)
+            cache.save_topic_yield(topic, len(reddit_items))
 
-    # Quick retry with simpler query if few results
-    if len(reddit_items) < 5 and not mock and not reddit_error:
-        core = openai_reddit._extract_core_subject(topic)
-        if core.lower() != topic.lower():
+        def merge_hedge(future):
             try:
-                retry_raw = openai_reddit.search_reddit(
-                    config["OPENAI_API_KEY"],
-                    selected_models["openai"],
-                    core,
-                    from_date, to_date,
-                    depth=depth,
-                )
-                retry_items = openai_reddit.parse_reddit_response(retry_raw)
-                # Add items not already found (by URL)
-                existing_urls = {item.get("url") for item in reddit_items}
-                for item in retry_items:
-                    if item.get("url") not in existing_urls:
-                        reddit_items.append(item)
+                _merge_by_url(reddit_items, openai_reddit.parse_reddit_response(future.result()))
             except Exception:
                 pass
 
-    # Subreddit-targeted fallback if still < 3 results
-    if len(reddit_items) < 3 and not mock and not reddit_error:
-        sub_query = openai_reddit._build_subreddit_query(topic)
+        # Hedged fallbacks: merge by URL as they arrive. A hedge whose
+        # threshold the main result already meets is merged only if it has
+        # finished by now; the rest are abandoned rather than awaited.
+        thresholds = dict(fallbacks)
+        needed = {future for future, query in hedges.items() if len(reddit_items) < thresholds[query]}
+        for future in hedges:
+            if future not in needed and future.done():
+                merge_hedge(future)
         try:
-            sub_raw = openai_reddit.search_reddit(
-                config["OPENAI_API_KEY"],
-                selected_models["openai"],
-                sub_query,
-                from_date, to_date,
-                depth=depth,
-            )
-            sub_items = openai_reddit.parse_reddit_response(sub_raw)
-            existing_urls = {item.get("url") for item in reddit_items}
-            for item in sub_items:
-                if item.get("url") not in existing_urls:
-                    reddit_items.append(item)
+            for future in as_completed(needed, timeout=deadline.remaining()):
+                merge_hedge(future)
+        except FuturesTimeoutError:
+            deadline.mark_cut_short()  # unfinished hedges are dropped
+    finally:
+        # Hedges still running past the deadline are abandoned, not awaited
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Sequential cascade for fallbacks that weren't hedged
+    for query, min_items in fallbacks:
+        if query in hedges.values() or len(reddit_items) >= min_items:
+            continue
+        if reddit_error:
+            break
+        if deadline.expired():
+            deadline.mark_cut_short()
+            break
+        try:
+            _merge_by_url(reddit_items, openai_reddit.parse_reddit_response(run_query(query)))
         except Exception:
             pass
 
@@ -146,11 +229,13 @@ def _search_x(
     depth: str,
     mock: bool,
     x_source: str = "xai",
+    deadline: deadline_mod.Deadline = None,
 ) -> tuple:
     """Search X via Bird CLI or xAI (runs in thread).
 
     Args:
         x_source: 'bird' or 'xai' - which backend to use
+        deadline: Run-wide time budget (caps request timeouts)
 
     Returns:
         Tuple of (x_items, raw_response, error)
@@ -171,6 +256,7 @@ def _search_x(
                 from_date,
                 to_date,
                 depth=depth,
+                deadline=deadline,
             )
         except Exception as e:
             raw_response = {"error": str(e)}
@@ -193,6 +279,7 @@ def _search_x(
             from_date,
             to_date,
             depth=depth,
+            deadline=deadline,
         )
     except http.HTTPError as e:
         raw_response = {"error": str(e)}
@@ -206,127 +293,278 @@ def _search_x(
     return x_items, raw_response, x_error
 
 
-def _run_supplemental(
+def _supplemental_caps(depth: str) -> tuple:
+    """Phase 2 caps for a research depth.
+
+    Returns:
+        Tuple of (max_handles, max_subreddits, count_per)
+    """
+    if depth == "default":
+        return 3, 3, 3
+    return 5, 5, 5  # deep
+
+
+def _supplemental_reddit(
     topic: str,
     reddit_items: list,
-    x_items: list,
     from_date: str,
     to_date: str,
     depth: str,
-    x_source: str,
-    progress: ui.ProgressDisplay = None,
-) -> tuple:
-    """Run Phase 2 supplemental searches based on entities from Phase 1.
+    deadline: deadline_mod.Deadline = None,
+) -> list:
+    """Run the Reddit half of Phase 2: search subreddits seen in Phase 1.
 
-    Extracts handles/subreddits from initial results, then runs targeted
-    searches to find additional content the broad search missed.
+    Needs only the enriched Reddit items (subreddit cross-references come
+    from comments), so it starts without waiting for X.
 
     Args:
         topic: Original search topic
-        reddit_items: Phase 1 Reddit items (raw dicts)
-        x_items: Phase 1 X items (raw dicts)
+        reddit_items: Phase 1 Reddit items (raw dicts, enriched)
         from_date: Start date
         to_date: End date
         depth: Research depth
-        x_source: 'bird' or 'xai'
-        progress: Optional progress display
+        deadline: Run-wide time budget
 
     Returns:
-        Tuple of (supplemental_reddit, supplemental_x)
+        New Reddit items not already in reddit_items
     """
-    # Depth-dependent caps
-    if depth == "default":
-        max_handles = 3
-        max_subs = 3
-        count_per = 3
-    else:  # deep
-        max_handles = 5
-        max_subs = 5
-        count_per = 5
-
-    # Extract entities from Phase 1 results
-    entities = entity_extract.extract_entities(
-        reddit_items, x_items,
-        max_handles=max_handles,
-        max_subreddits=max_subs,
-    )
+    _, max_subs, count_per = _supplemental_caps(depth)
+    subreddits = entity_extract.extract_entities(
+        reddit_items, [], max_subreddits=max_subs,
+    )["reddit_subreddits"]
+    if not subreddits:
+        return []
+
+    sys.stderr.write(f"[Phase 2] Drilling into r/{', r/'.join(subreddits[:3])}\n")
+    sys.stderr.flush()
+
+    try:
+        raw_reddit = openai_reddit.search_subreddits(
+            subreddits, topic, from_date, to_date, count_per, deadline=deadline,
+        )
+        # Filter out threads already found in Phase 1 (under any URL form)
+        existing_urls = {dedupe.canonical_url(item.get("url", "")) for item in reddit_items}
+        supplemental = [
+            item for item in raw_reddit
+            if dedupe.canonical_url(item.get("url", "")) not in existing_urls
+        ]
+        # Engagement came with the listing; only comments are fetched,
+        # and only for a few threads
+        return reddit_enrich.enrich_reddit_items(
+            supplemental,
+            comment_threads=reddit_enrich.SUPPLEMENTAL_COMMENT_THREADS.get(depth, 0),
+            deadline=deadline,
+        )
+    except Exception as e:
+        sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
+        return []
+
 
-    has_handles = entities["x_handles"] and x_source == "bird"
-    has_subs = entities["reddit_subreddits"]
+def _supplemental_x(
+    topic: str,
+    x_items: list,
+    from_date: str,
+    depth: str,
+    x_source: str,
+    deadline: deadline_mod.Deadline = None,
+) -> list:
+    """Run the X half of Phase 2: search handles seen in Phase 1 (Bird only).
+
+    Args:
+        topic: Original search topic
+        x_items: Phase 1 X items (raw dicts)
+        from_date: Start date
+        depth: Research depth
+        x_source: 'bird' or 'xai'
+        deadline: Run-wide time budget
+
+    Returns:
+        New X items not already in x_items
+    """
+    if x_source != "bird":
+        return []
 
-    if not has_handles and not has_subs:
-        return [], []
+    max_handles, _, count_per = _supplemental_caps(depth)
+    handles = entity_extract.extract_entities(
+        [], x_items, max_handles=max_handles,
+    )["x_handles"]
+    if not handles:
+        return []
 
-    parts = []
-    if has_handles:
-        parts.append(f"@{', @'.join(entities['x_handles'][:3])}")
-    if has_subs:
-        parts.append(f"r/{', r/'.join(entities['reddit_subreddits'][:3])}")
-    sys.stderr.write(f"[Phase 2] Drilling into {' + '.join(parts)}\n")
+    sys.stderr.write(f"[Phase 2] Drilling into @{', @'.join(handles[:3])}\n")
     sys.stderr.flush()
 
-    supplemental_reddit = []
-    supplemental_x = []
+    try:
+        raw_x = bird_x.search_handles(
+            handles, topic, from_date, count_per, deadline=deadline,
+        )
+        existing_urls = {dedupe.canonical_url(item.get("url", "")) for item in x_items}
+        return [
+            item for item in raw_x
+            if dedupe.canonical_url(item.get("url", "")) not in existing_urls
+        ]
+    except Exception as e:
+        sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
+        return []
 
-    # Collect existing URLs to avoid adding duplicates before dedupe
-    existing_urls = set()
-    for item in reddit_items:
-        existing_urls.add(item.get("url", ""))
-    for item in x_items:
-        existing_urls.add(item.get("url", ""))
 
-    # Run supplemental searches in parallel
-    reddit_future = None
-    x_future = None
+def _reddit_pipeline(
+    topic: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mock: bool,
+    progress: ui.ProgressDisplay = None,
+    deadline: deadline_mod.Deadline = None,
+    hedge_after: float = None,
+) -> tuple:
+    """Reddit chain: search, enrich, then Phase 2 (runs in thread).
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        if has_subs:
-            reddit_future = executor.submit(
-                openai_reddit.search_subreddits,
-                entities["reddit_subreddits"],
-                topic,
-                from_date,
-                to_date,
-                count_per,
-            )
+    Each step starts as soon as the previous one finishes, independent of
+    how far the X chain has got.
 
-        if has_handles:
-            x_future = executor.submit(
-                bird_x.search_handles,
-                entities["x_handles"],
-                topic,
-                from_date,
-                count_per,
+    Returns:
+        Tuple of (reddit_items, raw_openai, raw_reddit_enriched, reddit_error,
+        truncated, supplemental_count)
+    """
+    raw_reddit_enriched = []
+    truncated = []
+    supplemental = []
+    deadline = deadline or deadline_mod.Deadline()
+
+    # Each step gets its own scope of the budget: a step counts as truncated
+    # only if it dropped work, not merely because time ran out after it ended
+    search_deadline = deadline.scope()
+    if progress:
+        progress.start_reddit()
+    try:
+        reddit_items, raw_openai, reddit_error = _search_reddit(
+            topic, config, selected_models, from_date, to_date, depth, mock, search_deadline,
+            hedge_after,
+        )
+        if reddit_error and progress:
+            progress.show_error(f"Reddit error: {reddit_error}")
+    except Exception as e:
+        reddit_items, raw_openai = [], None
+        reddit_error = f"{type(e).__name__}: {e}"
+        if progress:
+            progress.show_error(f"Reddit error: {e}")
+    if progress:
+        progress.end_reddit(len(reddit_items))
+    if search_deadline.cut_short:
+        truncated.append("Reddit search")
+
+    # Enrich Reddit items with real data (parallel, per-item error handling)
+    if reddit_items:
+        if progress:
+            progress.start_reddit_enrich(1, len(reddit_items))
+
+        enrich_failures = []
+
+        def _on_enrich_error(item, e):
+            # Log but don't crash - the unenriched item is kept
+            if not isinstance(e, http.DeadlineExceededError):
+                enrich_failures.append(item)
+            if progress:
+                progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
+
+        enrich_deadline = deadline.scope()
+        reddit_items = reddit_enrich.enrich_reddit_items(
+            reddit_items,
+            mock_thread_data=load_fixture("reddit_thread_sample.json") if mock else None,
+            on_progress=progress.update_reddit_enrich if progress else None,
+            on_error=_on_enrich_error,
+            comment_threads=reddit_enrich.COMMENT_THREADS.get(depth),
+            deadline=enrich_deadline,
+        )
+        raw_reddit_enriched.extend(reddit_items)
+        if enrich_deadline.cut_short:
+            truncated.append("Reddit enrichment")
+
+        # Items left unenriched by an open circuit make this an errored run
+        # (shown in the report, never cached). Items the budget cut off are
+        # reported as truncation only.
+        circuit = http.get_circuit_error("reddit") if enrich_failures else None
+        if circuit:
+            degraded = f"Reddit enrichment degraded: {circuit}"
+            reddit_error = f"{reddit_error}; {degraded}" if reddit_error else degraded
+        if progress:
+            progress.end_reddit_enrich()
+            if circuit:
+                progress.show_error(degraded)
+
+    # Phase 2: subreddit drill-down. Skip on --quick (speed matters) and mock mode
+    if depth != "quick" and not mock and reddit_items:
+        if deadline.expired():
+            truncated.append("Reddit supplemental search skipped")
+        else:
+            phase2_deadline = deadline.scope()
+            supplemental = _supplemental_reddit(
+                topic, reddit_items, from_date, to_date, depth, phase2_deadline,
             )
+            reddit_items = reddit_items + supplemental
+            if phase2_deadline.cut_short:
+                truncated.append("Reddit supplemental search")
 
-        if reddit_future:
-            try:
-                raw_reddit = reddit_future.result()
-                # Filter out URLs already found in Phase 1
-                supplemental_reddit = [
-                    item for item in raw_reddit
-                    if item.get("url", "") not in existing_urls
-                ]
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
+    return reddit_items, raw_openai, raw_reddit_enriched, reddit_error, truncated, len(supplemental)
 
-        if x_future:
-            try:
-                raw_x = x_future.result()
-                supplemental_x = [
-                    item for item in raw_x
-                    if item.get("url", "") not in existing_urls
-                ]
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
 
-    if supplemental_reddit or supplemental_x:
-        sys.stderr.write(
-            f"[Phase 2] +{len(supplemental_reddit)} Reddit, +{len(supplemental_x)} X\n"
+def _x_pipeline(
+    topic: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mock: bool,
+    x_source: str = "xai",
+    progress: ui.ProgressDisplay = None,
+    deadline: deadline_mod.Deadline = None,
+) -> tuple:
+    """X chain: search, then Phase 2 handle drill-down (runs in thread).
+
+    Returns:
+        Tuple of (x_items, raw_xai, x_error, truncated, supplemental_count)
+    """
+    truncated = []
+    supplemental = []
+    deadline = deadline or deadline_mod.Deadline()
+
+    search_deadline = deadline.scope()
+    if progress:
+        progress.start_x()
+    try:
+        x_items, raw_xai, x_error = _search_x(
+            topic, config, selected_models, from_date, to_date, depth, mock, x_source, search_deadline,
         )
-        sys.stderr.flush()
+        if x_error and progress:
+            progress.show_error(f"X error: {x_error}")
+    except Exception as e:
+        x_items, raw_xai = [], None
+        x_error = f"{type(e).__name__}: {e}"
+        if progress:
+            progress.show_error(f"X error: {e}")
+    if progress:
+        progress.end_x(len(x_items))
+    if search_deadline.cut_short:
+        truncated.append("X search")
+
+    # Phase 2: handle drill-down, started the moment X results land
+    if depth != "quick" and not mock and x_items and x_source == "bird":
+        if deadline.expired():
+            truncated.append("X supplemental search skipped")
+        else:
+            phase2_deadline = deadline.scope()
+            supplemental = _supplemental_x(
+                topic, x_items, from_date, depth, x_source, phase2_deadline,
+            )
+            x_items = x_items + supplemental
+            if phase2_deadline.cut_short:
+                truncated.append("X supplemental search")
 
-    return supplemental_reddit, supplemental_x
+    return x_items, raw_xai, x_error, truncated, len(supplemental)
 
 
 def run_research(
@@ -340,13 +578,20 @@ def run_research(
     mock: bool = False,
     progress: ui.ProgressDisplay = None,
     x_source: str = "xai",
+    deadline: deadline_mod.Deadline = None,
+    hedge_after: float = None,
 ) -> tuple:
     """Run the research pipeline.
 
+    Reddit and X each run as an independent chain (search -> enrich ->
+    Phase 2), so total latency is the slower chain rather than the sum of
+    the phases.
+
     Returns:
-        Tuple of (reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error)
+        Tuple of (reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, truncated)
 
-    Note: web_needed is True when web search should be performed by the assistant.
+    Note: truncated lists the steps cut short because the deadline ran out.
+    web_needed is True when web search should be performed by the assistant.
     The script outputs a marker and the assistant handles web search in its session.
     """
     reddit_items = []
@@ -356,6 +601,10 @@ def run_research(
     raw_reddit_enriched = []
     reddit_error = None
     x_error = None
+    truncated = []
+    supplemental_reddit = 0
+    supplemental_x = 0
+    deadline = deadline or deadline_mod.Deadline()
 
     # Check if WebSearch is needed (always needed in web-only mode)
     web_needed = sources in ("all", "web", "reddit-web", "x-web")
@@ -365,97 +614,55 @@ def run_research(
         if progress:
             progress.start_web_only()
             progress.end_web_only()
-        return reddit_items, x_items, True, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error
+        return reddit_items, x_items, True, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, truncated
 
     # Determine which searches to run
     run_reddit = sources in ("both", "reddit", "all", "reddit-web")
     run_x = sources in ("both", "x", "all", "x-web")
 
-    # Run Reddit and X searches in parallel
+    # Run the Reddit and X chains in parallel
     reddit_future = None
     x_future = None
 
     with ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit both searches
         if run_reddit:
-            if progress:
-                progress.start_reddit()
             reddit_future = executor.submit(
-                _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
+                _reddit_pipeline, topic, config, selected_models,
+                from_date, to_date, depth, mock, progress, deadline, hedge_after,
             )
 
         if run_x:
-            if progress:
-                progress.start_x()
             x_future = executor.submit(
-                _search_x, topic, config, selected_models,
-                from_date, to_date, depth, mock, x_source
+                _x_pipeline, topic, config, selected_models,
+                from_date, to_date, depth, mock, x_source, progress, deadline,
             )
 
         # Collect results
         if reddit_future:
             try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result()
-                if reddit_error and progress:
-                    progress.show_error(f"Reddit error: {reddit_error}")
+                (reddit_items, raw_openai, raw_reddit_enriched, reddit_error, notes,
+                 supplemental_reddit) = reddit_future.result()
+                truncated.extend(notes)
             except Exception as e:
                 reddit_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"Reddit error: {e}")
-            if progress:
-                progress.end_reddit(len(reddit_items))
 
         if x_future:
             try:
-                x_items, raw_xai, x_error = x_future.result()
-                if x_error and progress:
-                    progress.show_error(f"X error: {x_error}")
+                x_items, raw_xai, x_error, notes, supplemental_x = x_future.result()
+                truncated.extend(notes)
             except Exception as e:
                 x_error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"X error: {e}")
-            if progress:
-                progress.end_x(len(x_items))
-
-    # Enrich Reddit items with real data (sequential, but with error handling per-item)
-    if reddit_items:
-        if progress:
-            progress.start_reddit_enrich(1, len(reddit_items))
-
-        for i, item in enumerate(reddit_items):
-            if progress and i > 0:
-                progress.update_reddit_enrich(i + 1, len(reddit_items))
 
-            try:
-                if mock:
-                    mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
-                else:
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item)
-            except Exception as e:
-                # Log but don't crash - keep the unenriched item
-                if progress:
-                    progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-
-            raw_reddit_enriched.append(reddit_items[i])
-
-        if progress:
-            progress.end_reddit_enrich()
-
-    # Phase 2: Supplemental search based on entities from Phase 1
-    # Skip on --quick (speed matters) and mock mode
-    if depth != "quick" and not mock and (reddit_items or x_items):
-        sup_reddit, sup_x = _run_supplemental(
-            topic, reddit_items, x_items,
-            from_date, to_date, depth, x_source, progress,
-        )
-        if sup_reddit:
-            reddit_items.extend(sup_reddit)
-        if sup_x:
-            x_items.extend(sup_x)
+    # Both chains are done (and the spinner stopped), so this gets its own line
+    if supplemental_reddit or supplemental_x:
+        sys.stderr.write(f"[Phase 2] +{supplemental_reddit} Reddit, +{supplemental_x} X\n")
+        sys.stderr.flush()
 
-    return reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error
+    return reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, truncated
 
 
 def main():
@@ -509,9 +716,39 @@ def main():
         metavar="N",
         help="Number of days to look back (1-30, default: 30)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass the report cache and fetch fresh data",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=cache.DEFAULT_TTL_HOURS,
+        metavar="HOURS",
+        help=f"Reuse cached reports younger than HOURS (default: {cache.DEFAULT_TTL_HOURS})",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Return partial results once SECONDS have elapsed (default: no limit)",
+    )
+    parser.add_argument(
+        "--hedge-after",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Start Reddit fallback queries if the main query is still running after SECONDS "
+             "(immediately for topics that were sparse before; capped by LAST30DAYS_HEDGE_MAX_QUERIES)",
+    )
 
     args = parser.parse_args()
 
+    # Start the clock before any network work, including model selection
+    deadline = deadline_mod.Deadline(args.budget)
+
     # Enable debug logging if requested
     if args.debug:
         os.environ["LAST30DAYS_DEBUG"] = "1"
@@ -575,6 +812,8 @@ def main():
 
     # Get date range
     from_date, to_date = dates.get_date_range(args.days)
+    # One "today" for the whole run, so dates score reproducibly
+    date_ctx = dates.DateContext(from_date, to_date, today=to_date)
 
     # Check what keys are missing for promo messaging
     missing_keys = env.get_missing_keys(config)
@@ -583,6 +822,26 @@ def main():
     if missing_keys != 'none':
         progress.show_promo(missing_keys)
 
+    # Report cache: repeat queries skip the slow web-search APIs entirely.
+    # Mock runs never touch the cache so fixtures can't leak into real results.
+    web_needed = sources in ("all", "web", "reddit-web", "x-web")
+    cache_key = None
+    if not args.mock:
+        cache.ensure_cache_dir()
+        cache_key = cache.get_cache_key(
+            args.topic, from_date, to_date, sources,
+            depth=depth, x_source=x_source or "xai",
+        )
+        if not args.refresh:
+            cached = load_cached_report(cache_key, args.cache_ttl)
+            if cached:
+                progress.show_cached(cached.cache_age_hours)
+                cached_dict = cached.to_dict()
+                render.write_outputs(cached, report_dict=cached_dict)
+                output_result(cached, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days,
+                              report_dict=cached_dict)
+                return
+
     # Select models
     if args.mock:
         # Use mock models
@@ -619,7 +878,7 @@ def main():
         mode = sources
 
     # Run research
-    reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error = run_research(
+    reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, truncated = run_research(
         args.topic,
         sources,
         config,
@@ -630,14 +889,16 @@ def main():
         args.mock,
         progress,
         x_source=x_source or "xai",
+        deadline=deadline,
+        hedge_after=args.hedge_after,
     )
 
     # Processing phase
     progress.start_processing()
 
     # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
+    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date, date_ctx)
+    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date, date_ctx)
 
     # Hard date filter: exclude items with verified dates outside the range
     # This is the safety net - even if prompts let old content through, this filters it
@@ -645,14 +906,18 @@ def main():
     filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
 
     # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
+    scored_reddit = score.score_reddit_items(filtered_reddit, date_ctx)
+    scored_x = score.score_x_items(filtered_x, date_ctx)
 
     # Sort items
     sorted_reddit = score.sort_items(scored_reddit)
     sorted_x = score.sort_items(scored_x)
 
-    # Dedupe items
+    # Dedupe items: exact URL duplicates first (one index across sources),
+    # then near-duplicate text
+    url_index = {}
+    sorted_reddit = dedupe.dedupe_by_url(sorted_reddit, url_index)
+    sorted_x = dedupe.dedupe_by_url(sorted_x, url_index)
     deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
     deduped_x = dedupe.dedupe_x(sorted_x)
 
@@ -678,12 +943,19 @@ def main():
     report.x = deduped_x
     report.reddit_error = reddit_error
     report.x_error = x_error
+    report.truncated = truncated
 
     # Generate context snippet
     report.context_snippet_md = render.render_context_snippet(report)
 
-    # Write outputs
-    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
+    # Write outputs (the dict form is built once, for every consumer)
+    report_dict = report.to_dict()
+    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched, report_dict=report_dict)
+
+    # Cache the report, but never an errored or budget-truncated one (a
+    # transient outage shouldn't be replayed for the next 24 hours)
+    if cache_key and not reddit_error and not x_error and not truncated:
+        cache.save_cache(cache_key, report_dict)
 
     # Show completion
     if sources == "web":
@@ -692,7 +964,29 @@ def main():
         progress.show_complete(len(deduped_reddit), len(deduped_x))
 
     # Output result
-    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days)
+    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days,
+                  report_dict=report_dict)
+
+
+def load_cached_report(cache_key: str, ttl_hours: float) -> schema.Report:
+    """Load a cached report if one exists within the TTL.
+
+    Returns:
+        Report with from_cache/cache_age_hours set, or None on miss
+    """
+    data, age_hours = cache.load_cache_with_age(cache_key, ttl_hours)
+    if not data:
+        return None
+
+    try:
+        report = schema.Report.from_dict(data)
+    except (KeyError, TypeError):
+        # Stale cache format - treat as a miss
+        return None
+
+    report.from_cache = True
+    report.cache_age_hours = age_hours
+    return report
 
 
 def output_result(
@@ -704,12 +998,13 @@ def output_result(
     to_date: str = "",
     missing_keys: str = "none",
     days: int = 30,
+    report_dict: dict = None,
 ):
     """Output the result based on emit mode."""
     if emit_mode == "compact":
         print(render.render_compact(report, missing_keys=missing_keys))
     elif emit_mode == "json":
-        print(json.dumps(report.to_dict(), indent=2))
+        print(serialize.dumps(report_dict if report_dict is not None else report.to_dict(), pretty=True))
     elif emit_mode == "md":
         print(render.render_full_report(report))
     elif emit_mode == "context":
@@ -1,12 +1,16 @@
 """Bird CLI client for X (Twitter) search."""
 
 import json
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from .deadline import Deadline
+
 # Depth configurations: number of results to request
 DEPTH_CONFIG = {
     "quick": 12,
@@ -14,6 +18,12 @@ DEPTH_CONFIG = {
     "deep": 60,
 }
 
+# Phase 2 handle searches: per-handle timeout, concurrent Bird processes,
+# and one timeout shared by the whole batch
+HANDLE_SEARCH_TIMEOUT = 15
+HANDLE_SEARCH_CONCURRENCY = 3
+HANDLE_BATCH_TIMEOUT = 30
+
 
 def _log(msg: str):
     """Log to stderr."""
@@ -165,6 +175,32 @@ def get_bird_status() -> Dict[str, Any]:
     }
 
 
+def _bird_search_cmd(query: str, count: int) -> List[str]:
+    """Build the Bird CLI search command."""
+    return [
+        "bird", "search",
+        query,
+        "-n", str(count),
+        "--json",
+    ]
+
+
+def _parse_bird_output(returncode: int, stdout: str, stderr: str) -> Dict[str, Any]:
+    """Turn a finished Bird search process's output into a raw response."""
+    if returncode != 0:
+        error = stderr.strip() or "Bird search failed"
+        return {"error": error, "items": []}
+
+    output = stdout.strip()
+    if not output:
+        return {"items": []}
+
+    try:
+        return json.loads(output)
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON response: {e}", "items": []}
+
+
 def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
     """Run a single Bird CLI search and return raw response.
 
@@ -176,37 +212,117 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
     Returns:
         Raw Bird JSON response or error dict.
     """
-    cmd = [
-        "bird", "search",
-        query,
-        "-n", str(count),
-        "--json",
-    ]
-
     try:
         result = subprocess.run(
-            cmd,
+            _bird_search_cmd(query, count),
             capture_output=True,
             text=True,
             timeout=timeout,
         )
+        return _parse_bird_output(result.returncode, result.stdout, result.stderr)
 
-        if result.returncode != 0:
-            error = result.stderr.strip() or "Bird search failed"
-            return {"error": error, "items": []}
-
-        output = result.stdout.strip()
-        if not output:
-            return {"items": []}
+    except subprocess.TimeoutExpired:
+        return {"error": "Search timed out", "items": []}
+    except Exception as e:
+        return {"error": str(e), "items": []}
 
-        return json.loads(output)
 
+def _wait_bird_search(proc: subprocess.Popen, timeout: float) -> Dict[str, Any]:
+    """Wait for a Bird search started with Popen, killing it on timeout."""
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
         return {"error": "Search timed out", "items": []}
-    except json.JSONDecodeError as e:
-        return {"error": f"Invalid JSON response: {e}", "items": []}
     except Exception as e:
         return {"error": str(e), "items": []}
+    return _parse_bird_output(proc.returncode, stdout, stderr)
+
+
+def _race_bird_searches(queries: List[str], count: int, timeout: float) -> Tuple[int, Dict[str, Any]]:
+    """Run Bird searches concurrently and keep the most specific hit.
+
+    Queries are ordered most to least specific. Once a query returns
+    results, every less specific query still running is killed; a more
+    specific one that is still running is always waited for.
+
+    Args:
+        queries: Full query strings, most specific first
+        count: Number of results to request
+        timeout: Shared timeout in seconds
+
+    Returns:
+        Tuple of (index of the chosen query, raw response). With no hits
+        this is the last query's response, matching the sequential retries.
+    """
+    procs = []
+    try:
+        for query in queries:
+            try:
+                procs.append(subprocess.Popen(
+                    _bird_search_cmd(query, count),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                ))
+            except Exception as e:
+                procs.append(e)
+
+        with ThreadPoolExecutor(max_workers=len(procs)) as executor:
+            futures = [
+                executor.submit(_wait_bird_search, proc, timeout)
+                if isinstance(proc, subprocess.Popen) else None
+                for proc in procs
+            ]
+            try:
+                response = {"items": []}
+                for i, future in enumerate(futures):
+                    if future is None:
+                        response = {"error": str(procs[i]), "items": []}
+                    else:
+                        response = future.result()
+                    if parse_bird_response(response):
+                        return i, response
+                return len(queries) - 1, response
+            finally:
+                # Kill the losers; their waiting threads return at once
+                for proc in procs:
+                    if isinstance(proc, subprocess.Popen) and proc.poll() is None:
+                        proc.kill()
+    finally:
+        for proc in procs:
+            if isinstance(proc, subprocess.Popen):
+                proc.wait()
+
+
+def _query_variants(core_topic: str) -> List[str]:
+    """Get the search terms to try for a topic, most specific first.
+
+    The full core topic, then its first two words (3+ word topics), then
+    the strongest remaining token (often the product name).
+    """
+    variants = [core_topic]
+    core_words = core_topic.split()
+    if len(core_words) > 2:
+        variants.append(' '.join(core_words[:2]))
+
+    low_signal = {
+        'trendiest', 'trending', 'hottest', 'hot', 'popular', 'viral',
+        'best', 'top', 'latest', 'new', 'plugin', 'plugins',
+        'skill', 'skills', 'tool', 'tools',
+    }
+    candidates = [w for w in core_words if w not in low_signal]
+    if candidates:
+        strongest = max(candidates, key=len)
+        if strongest not in variants:
+            variants.append(strongest)
+    return variants
+
+
+def get_race_enabled() -> bool:
+    """Check LAST30DAYS_BIRD_RACE for racing query variants in search_x."""
+    return os.environ.get("LAST30DAYS_BIRD_RACE", "").lower() in ("1", "true", "yes")
 
 
 def search_x(
@@ -214,117 +330,161 @@ def search_x(
     from_date: str,
     to_date: str,
     depth: str = "default",
+    deadline: Optional[Deadline] = None,
+    race: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Search X using Bird CLI with automatic retry on 0 results.
 
+    By default the query variants from _query_variants run one after
+    another, each only if the previous returned nothing. In racing mode
+    they run concurrently and the most specific one with results wins, so
+    a zero-result topic costs one timeout instead of three.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD) - unused but kept for API compatibility
         depth: Research depth - "quick", "default", or "deep"
+        deadline: Run-wide time budget; caps each subprocess timeout and
+            skips the retries once it runs out
+        race: Race the query variants (default: get_race_enabled())
 
     Returns:
         Raw Bird JSON response or error dict.
     """
     count = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     timeout = 30 if depth == "quick" else 45 if depth == "default" else 60
+    deadline = deadline or Deadline()
+    if race is None:
+        race = get_race_enabled()
 
     # Extract core subject - X search is literal, not semantic
     core_topic = _extract_core_subject(topic)
-    query = f"{core_topic} since:{from_date}"
+    variants = _query_variants(core_topic)
 
+    if race and len(variants) > 1:
+        _log(f"Racing: {', '.join(repr(v) for v in variants)}")
+        winner, response = _race_bird_searches(
+            [f"{v} since:{from_date}" for v in variants], count, deadline.timeout(timeout),
+        )
+        if winner:
+            _log(f"0 results for '{core_topic}', using '{variants[winner]}'")
+        return _note_budget_timeout(response, deadline)
+
+    query = f"{core_topic} since:{from_date}"
     _log(f"Searching: {query}")
-    response = _run_bird_search(query, count, timeout)
+    response = _run_bird_search(query, count, deadline.timeout(timeout))
 
-    # Check if we got results
-    items = parse_bird_response(response)
+    # Retry with fewer keywords, then the strongest token, while there are 0 results
+    for variant in variants[1:]:
+        if parse_bird_response(response):
+            break
+        if deadline.expired():
+            deadline.mark_cut_short()
+            break
+        _log(f"0 results for '{core_topic}', retrying with '{variant}'")
+        query = f"{variant} since:{from_date}"
+        response = _run_bird_search(query, count, deadline.timeout(timeout))
+
+    return _note_budget_timeout(response, deadline)
 
-    # Retry with fewer keywords if 0 results and query has 3+ words
-    core_words = core_topic.split()
-    if not items and len(core_words) > 2:
-        shorter = ' '.join(core_words[:2])
-        _log(f"0 results for '{core_topic}', retrying with '{shorter}'")
-        query = f"{shorter} since:{from_date}"
-        response = _run_bird_search(query, count, timeout)
-        items = parse_bird_response(response)
-
-    # Last-chance retry: use strongest remaining token (often the product name)
-    if not items and core_words:
-        low_signal = {
-            'trendiest', 'trending', 'hottest', 'hot', 'popular', 'viral',
-            'best', 'top', 'latest', 'new', 'plugin', 'plugins',
-            'skill', 'skills', 'tool', 'tools',
-        }
-        candidates = [w for w in core_words if w not in low_signal]
-        if candidates:
-            strongest = max(candidates, key=len)
-            _log(f"0 results for '{core_topic}', retrying with strongest token '{strongest}'")
-            query = f"{strongest} since:{from_date}"
-            response = _run_bird_search(query, count, timeout)
 
+def _note_budget_timeout(response: Dict[str, Any], deadline: Deadline) -> Dict[str, Any]:
+    """Mark the deadline cut short if the search failed once it ran out."""
+    if isinstance(response, dict) and response.get("error") and deadline.expired():
+        deadline.mark_cut_short()
     return response
 
 
+def _search_handle(handle: str, query: str, count: int, timeout: float) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run one handle search (runs in thread).
+
+    Returns:
+        Tuple of (items, error message or None)
+    """
+    try:
+        result = subprocess.run(
+            _bird_search_cmd(query, count),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+        if result.returncode != 0:
+            return [], f"Handle search failed for @{handle}: {result.stderr.strip()}"
+
+        output = result.stdout.strip()
+        if not output:
+            return [], None
+
+        return parse_bird_response(json.loads(output)), None
+
+    except subprocess.TimeoutExpired:
+        return [], f"Handle search timed out for @{handle}"
+    except json.JSONDecodeError:
+        return [], f"Invalid JSON from handle search for @{handle}"
+    except Exception as e:
+        return [], f"Handle search error for @{handle}: {e}"
+
+
 def search_handles(
     handles: List[str],
     topic: str,
     from_date: str,
     count_per: int = 5,
+    deadline: Optional[Deadline] = None,
 ) -> List[Dict[str, Any]]:
     """Search specific X handles for topic-related content.
 
-    Runs targeted Bird searches using `from:handle topic` syntax.
-    Used in Phase 2 supplemental search after entity extraction.
+    Runs targeted Bird searches using `from:handle topic` syntax, up to
+    HANDLE_SEARCH_CONCURRENCY at a time, all sharing one
+    HANDLE_BATCH_TIMEOUT. Used in Phase 2 supplemental search after entity
+    extraction.
 
     Args:
         handles: List of X handles to search (without @)
         topic: Search topic (core subject, not full verbose query)
         from_date: Start date (YYYY-MM-DD)
         count_per: Results to request per handle
+        deadline: Run-wide time budget; remaining handles are skipped once
+            it runs out
 
     Returns:
-        List of raw item dicts (same format as parse_bird_response output).
+        List of raw item dicts (same format as parse_bird_response output),
+        in handle order.
     """
-    all_items = []
-    core_topic = _extract_core_subject(topic)
+    if not handles:
+        return []
 
-    for handle in handles:
-        handle = handle.lstrip("@")
+    core_topic = _extract_core_subject(topic)
+    deadline = deadline or Deadline()
+    batch = Deadline(HANDLE_BATCH_TIMEOUT)
+
+    def run(handle):
+        # Only the run-wide budget makes the run partial; the batch cap is
+        # this step's own limit
+        if deadline.expired():
+            deadline.mark_cut_short()
+            return [], f"Time budget exhausted, skipping @{handle}"
+        if batch.expired():
+            return [], f"Handle batch timeout, skipping @{handle}"
         query = f"from:{handle} {core_topic} since:{from_date}"
+        timeout = min(deadline.timeout(HANDLE_SEARCH_TIMEOUT), batch.timeout(HANDLE_SEARCH_TIMEOUT))
+        items, error = _search_handle(handle, query, count_per, timeout)
+        if error and deadline.expired():
+            deadline.mark_cut_short()
+        return items, error
 
-        cmd = [
-            "bird", "search",
-            query,
-            "-n", str(count_per),
-            "--json",
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=15,  # Short timeout per handle
-            )
-
-            if result.returncode != 0:
-                _log(f"Handle search failed for @{handle}: {result.stderr.strip()}")
-                continue
-
-            output = result.stdout.strip()
-            if not output:
-                continue
-
-            response = json.loads(output)
-            items = parse_bird_response(response)
-            all_items.extend(items)
-
-        except subprocess.TimeoutExpired:
-            _log(f"Handle search timed out for @{handle}")
-        except json.JSONDecodeError:
-            _log(f"Invalid JSON from handle search for @{handle}")
-        except Exception as e:
-            _log(f"Handle search error for @{handle}: {e}")
+    handles = [handle.lstrip("@") for handle in handles]
+    with ThreadPoolExecutor(max_workers=min(HANDLE_SEARCH_CONCURRENCY, len(handles))) as executor:
+        # map() yields in input order, so merging is deterministic
+        results = list(executor.map(run, handles))
+
+    all_items = []
+    for items, error in results:
+        if error:
+            _log(error)
+        all_items.extend(items)
 
     return all_items
 
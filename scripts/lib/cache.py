@@ -1,13 +1,14 @@
 """Caching utilities for last30days skill."""
 
 import hashlib
-import json
 import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from . import serialize
+
 CACHE_DIR = Path.home() / ".cache" / "last30days"
 DEFAULT_TTL_HOURS = 24
 MODEL_CACHE_TTL_DAYS = 7
@@ -15,11 +16,12 @@ MODEL_CACHE_TTL_DAYS = 7
 
 def ensure_cache_dir():
     """Ensure cache directory exists."""
-    global CACHE_DIR, MODEL_CACHE_FILE
+    global CACHE_DIR, MODEL_CACHE_FILE, TOPIC_YIELD_FILE
     env_dir = os.environ.get("LAST30DAYS_CACHE_DIR")
     if env_dir:
         CACHE_DIR = Path(env_dir)
         MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+        TOPIC_YIELD_FILE = CACHE_DIR / "topic_yield.json"
 
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -27,12 +29,24 @@ def ensure_cache_dir():
         # Fall back when default cache paths are unavailable in sandboxed envs.
         CACHE_DIR = Path(tempfile.gettempdir()) / "last30days" / "cache"
         MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+        TOPIC_YIELD_FILE = CACHE_DIR / "topic_yield.json"
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_cache_key(topic: str, from_date: str, to_date: str, sources: str) -> str:
-    """Generate a cache key from query parameters."""
-    key_data = f"{topic}|{from_date}|{to_date}|{sources}"
+def get_cache_key(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    sources: str,
+    depth: str = "default",
+    x_source: str = "",
+) -> str:
+    """Generate a cache key from query parameters.
+
+    Depth and X backend are part of the key because they change how many
+    items are fetched and where they come from.
+    """
+    key_data = f"{topic}|{from_date}|{to_date}|{sources}|{depth}|{x_source}"
     return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
 
@@ -41,7 +55,7 @@ def get_cache_path(cache_key: str) -> Path:
     return CACHE_DIR / f"{cache_key}.json"
 
 
-def is_cache_valid(cache_path: Path, ttl_hours: int = DEFAULT_TTL_HOURS) -> bool:
+def is_cache_valid(cache_path: Path, ttl_hours: float = DEFAULT_TTL_HOURS) -> bool:
     """Check if cache file exists and is within TTL."""
     if not cache_path.exists():
         return False
@@ -56,7 +70,7 @@ def is_cache_valid(cache_path: Path, ttl_hours: int = DEFAULT_TTL_HOURS) -> bool
         return False
 
 
-def load_cache(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> Optional[dict]:
+def load_cache(cache_key: str, ttl_hours: float = DEFAULT_TTL_HOURS) -> Optional[dict]:
     """Load data from cache if valid."""
     cache_path = get_cache_path(cache_key)
 
@@ -64,9 +78,8 @@ def load_cache(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> Optional[d
         return None
 
     try:
-        with open(cache_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return serialize.load(cache_path)
+    except (ValueError, OSError):
         return None
 
 
@@ -83,7 +96,7 @@ def get_cache_age_hours(cache_path: Path) -> Optional[float]:
         return None
 
 
-def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> tuple:
+def load_cache_with_age(cache_key: str, ttl_hours: float = DEFAULT_TTL_HOURS) -> tuple:
     """Load data from cache with age info.
 
     Returns:
@@ -97,9 +110,8 @@ def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> t
     age = get_cache_age_hours(cache_path)
 
     try:
-        with open(cache_path, 'r') as f:
-            return json.load(f), age
-    except (json.JSONDecodeError, OSError):
+        return serialize.load(cache_path), age
+    except (ValueError, OSError):
         return None, None
 
 
@@ -109,8 +121,7 @@ def save_cache(cache_key: str, data: dict):
     cache_path = get_cache_path(cache_key)
 
     try:
-        with open(cache_path, 'w') as f:
-            json.dump(data, f)
+        serialize.dump(data, cache_path)
     except OSError:
         pass  # Silently fail on cache write errors
 
@@ -135,9 +146,8 @@ def load_model_cache() -> dict:
         return {}
 
     try:
-        with open(MODEL_CACHE_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return serialize.load(MODEL_CACHE_FILE)
+    except (ValueError, OSError):
         return {}
 
 
@@ -145,8 +155,7 @@ def save_model_cache(data: dict):
     """Save model selection cache."""
     ensure_cache_dir()
     try:
-        with open(MODEL_CACHE_FILE, 'w') as f:
-            json.dump(data, f)
+        serialize.dump(data, MODEL_CACHE_FILE)
     except OSError:
         pass
 
@@ -163,3 +172,42 @@ def set_cached_model(provider: str, model: str):
     cache[provider] = model
     cache['updated_at'] = datetime.now(timezone.utc).isoformat()
     save_model_cache(cache)
+
+
+# Per-topic result counts from the main Reddit query, used to hedge
+# fallback queries straight away for topics known to be sparse
+TOPIC_YIELD_FILE = CACHE_DIR / "topic_yield.json"
+TOPIC_YIELD_MAX_ENTRIES = 500
+SPARSE_TOPIC_THRESHOLD = 5
+
+
+def _topic_yield_key(topic: str) -> str:
+    return " ".join(topic.lower().split())
+
+
+def load_topic_yields() -> dict:
+    """Load the topic yield history."""
+    try:
+        return serialize.load(TOPIC_YIELD_FILE)
+    except (ValueError, OSError):
+        return {}
+
+
+def save_topic_yield(topic: str, count: int):
+    """Record how many items the main Reddit query found for a topic."""
+    yields = load_topic_yields()
+    yields.pop(_topic_yield_key(topic), None)
+    yields[_topic_yield_key(topic)] = count
+    # Keep the most recently recorded topics
+    yields = dict(list(yields.items())[-TOPIC_YIELD_MAX_ENTRIES:])
+    ensure_cache_dir()
+    try:
+        serialize.dump(yields, TOPIC_YIELD_FILE)
+    except OSError:
+        pass
+
+
+def is_sparse_topic(topic: str) -> bool:
+    """Check whether the last search for a topic came back sparse."""
+    count = load_topic_yields().get(_topic_yield_key(topic))
+    return count is not None and count < SPARSE_TOPIC_THRESHOLD
@@ -1,7 +1,7 @@
 """Date utilities for last30days skill."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple, Union
 
 
 def get_date_range(days: int = 30) -> Tuple[str, str]:
@@ -15,6 +15,13 @@ def get_date_range(days: int = 30) -> Tuple[str, str]:
     return from_date.isoformat(), today.isoformat()
 
 
+def _to_utc(dt: datetime) -> datetime:
+    """Convert an aware datetime to UTC; label a naive one as UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse a date string in various formats.
 
@@ -30,6 +37,13 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     except (ValueError, TypeError):
         pass
 
+    # ISO fast path: one C-level parse instead of walking the formats below
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return _to_utc(datetime.fromisoformat(date_str))
+        except ValueError:
+            pass
+
     # Try ISO formats
     formats = [
         "%Y-%m-%d",
@@ -41,7 +55,7 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
 
     for fmt in formats:
         try:
-            return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
+            return _to_utc(datetime.strptime(date_str, fmt))
         except ValueError:
             continue
 
@@ -122,3 +136,72 @@ def recency_score(date_str: Optional[str], max_days: int = 30) -> int:
         return 0
 
     return int(100 * (1 - age / max_days))
+
+
+class DateContext:
+    """Per-run date state: the parsed range, one fixed "today", and lookups.
+
+    Every date string in the window gets its recency score and confidence
+    computed once up front, so per-item date work is a dict lookup. Strings
+    outside the window (or malformed) are computed on first sight and
+    memoized. Results match recency_score() and get_date_confidence() as of
+    the context's "today" (YYYY-MM-DD or date; default: current UTC date).
+    """
+
+    def __init__(
+        self,
+        from_date: str,
+        to_date: str,
+        today: Optional[Union[str, date]] = None,
+        max_days: int = 30,
+    ):
+        if today is None:
+            today = datetime.now(timezone.utc).date()
+        elif isinstance(today, str):
+            today = date.fromisoformat(today)
+        self.from_date = from_date
+        self.to_date = to_date
+        self.today = today
+        self.max_days = max_days
+        self._start = datetime.strptime(from_date, "%Y-%m-%d").date()
+        self._end = datetime.strptime(to_date, "%Y-%m-%d").date()
+
+        # Precompute every day that can score above 0 or be in range
+        self._table: Dict[Optional[str], Tuple[int, str]] = {None: (0, 'low'), "": (0, 'low')}
+        first = min(self._start, today - timedelta(days=max_days - 1))
+        last = max(self._end, today)
+        for offset in range((last - first).days + 1):
+            day = first + timedelta(days=offset)
+            self._table[day.isoformat()] = self._compute(day)
+
+    def _compute(self, day: Optional[date]) -> Tuple[int, str]:
+        if day is None:
+            return 0, 'low'
+        confidence = 'high' if self._start <= day <= self._end else 'low'
+        age = (self.today - day).days
+        if age < 0:
+            return 100, confidence  # Future date (treat as today)
+        if age >= self.max_days:
+            return 0, confidence
+        return int(100 * (1 - age / self.max_days)), confidence
+
+    def _lookup(self, date_str: Optional[str]) -> Tuple[int, str]:
+        try:
+            return self._table[date_str]
+        except KeyError:
+            pass
+        # Same lenient parse as days_ago()/get_date_confidence()
+        try:
+            day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            day = None
+        result = self._table[date_str] = self._compute(day)
+        return result
+
+    def recency_score(self, date_str: Optional[str]) -> int:
+        """Recency score (0-100), as recency_score() would give on self.today."""
+        return self._lookup(date_str)[0]
+
+    def confidence(self, date_str: Optional[str]) -> str:
+        """'high' if date_str falls in the range, else 'low'."""
+        return self._lookup(date_str)[1]
@@ -0,0 +1,51 @@
+"""Run-wide latency budget for last30days skill."""
+
+import time
+from typing import Optional
+
+# Never hand a socket/subprocess a timeout shorter than this
+MIN_TIMEOUT = 0.5
+
+
+class Deadline:
+    """A point in time by which the run must finish.
+
+    Deadline(None) never expires, so callers can thread one through
+    unconditionally. Code that drops work because the budget ran out calls
+    mark_cut_short(), so the caller can tell a step that finished in time
+    from one that was cut off (see scope()).
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self.cut_short = False
+
+    def scope(self) -> "Deadline":
+        """The same budget with its own cut_short flag, for one step."""
+        child = Deadline()
+        child.seconds = self.seconds
+        child.expires_at = self.expires_at
+        return child
+
+    def mark_cut_short(self):
+        """Record that work was skipped or cancelled for lack of time."""
+        self.cut_short = True
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None if unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once the budget is used up."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: float) -> float:
+        """Cap a per-call timeout to the time left."""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(MIN_TIMEOUT, min(default, remaining))
@@ -1,10 +1,63 @@
 """Near-duplicate detection for last30days skill."""
 
+import math
+import os
 import re
-from typing import List, Set, Tuple, Union
+from collections import defaultdict
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 from . import schema
 
+# Dedupe engines: 'exact' compares every pair, 'minhash' uses MinHash
+# signatures + LSH banding to find candidate pairs and verifies them with
+# exact Jaccard. 'auto' picks minhash from MINHASH_MIN_ITEMS items up.
+# benchmarks/bench_dedupe.py puts the speed crossover around 15 items, but
+# below ~100 the exact engine takes well under 100ms and is guaranteed to
+# find every pair, so auto keeps it there.
+#
+# MinHash is approximate: it never reports a false pair, but can miss a
+# true one (bench_dedupe.py reports the recall). The default is therefore
+# 'exact'; 'auto'/'minhash' are opt-in via LAST30DAYS_DEDUPE_ENGINE or the
+# engine argument.
+ENGINES = ("auto", "exact", "minhash")
+DEFAULT_ENGINE = "exact"
+MINHASH_MIN_ITEMS = 100
+
+# Items with fewer shingles than this (titles under ~10 characters) carry
+# too little signal for LSH; the minhash engine compares them exactly
+MINHASH_MIN_SHINGLES = 8
+
+# MinHash settings. One-permutation hashing: each shingle is hashed once
+# and lands in one of MINHASH_NUM_PERM bins, keeping the minimum per bin,
+# so a signature costs O(shingles) rather than O(shingles * perms). The
+# hash parameters are fixed so results are reproducible.
+MINHASH_NUM_PERM = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+_HASH_A = 0x5DEECE66D1F2A3B
+_HASH_B = 0x2545F4914F6CDD1D
+_EMPTY_BIN = _MERSENNE_PRIME
+# Bin values are below _MERSENNE_PRIME // MINHASH_NUM_PERM; a value borrowed
+# from d bins away is offset by d * _BORROW_OFFSET so it can't equal a real one
+_BORROW_OFFSET = _MERSENNE_PRIME // MINHASH_NUM_PERM + 1
+
+# Integer shingles: code points fit in 21 bits, so a trigram packs into one
+# 63-bit int with no collisions. _PAD (never a real code point) fills out
+# texts shorter than n.
+_CODE_BITS = 21
+_PAD = (1 << _CODE_BITS) - 1
+_MASK64 = (1 << 64) - 1
+_FNV_PRIME = 0x100000001B3
+
+# URL canonicalization: query parameters that only track the click
+_TRACKING_PARAMS = {
+    "ref", "ref_src", "ref_url", "ref_source", "share_id", "si",
+    "fbclid", "gclid", "mc_cid", "mc_eid", "igshid",
+}
+_REDDIT_THREAD_RE = re.compile(r'^/(?:r/[^/]+/)?comments/([a-z0-9]+)(?:/[^/]*/([a-z0-9]+))?', re.IGNORECASE)
+_X_STATUS_RE = re.compile(r'^/(?:i/web|i|[^/]+)/status(?:es)?/(\d+)', re.IGNORECASE)
+_X_HOSTS = {"x.com", "twitter.com", "mobile.twitter.com", "mobile.x.com"}
+
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison.
@@ -27,13 +80,136 @@ def get_ngrams(text: str, n: int = 3) -> Set[str]:
     return {text[i:i+n] for i in range(len(text) - n + 1)}
 
 
-def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
-    """Compute Jaccard similarity between two sets."""
+def get_shingles(text: str, n: int = 3) -> FrozenSet[int]:
+    """Get character n-grams from text as integers.
+
+    Same shingles as get_ngrams, but each is one int instead of a small
+    string. Up to n=3 the code points are packed into 21-bit fields, so
+    distinct n-grams never collide and Jaccard scores match get_ngrams
+    exactly; longer n-grams are FNV-hashed to 64 bits.
+    """
+    codes = [ord(c) for c in normalize_text(text)]
+    if len(codes) < n:
+        codes += [_PAD] * (n - len(codes))
+    if n == 3:
+        return frozenset(
+            (a << 42) | (b << 21) | c
+            for a, b, c in zip(codes, codes[1:], codes[2:])
+        )
+
+    shingles = set()
+    for i in range(len(codes) - n + 1):
+        value = 0
+        if n <= 3:
+            for code in codes[i:i + n]:
+                value = (value << _CODE_BITS) | code
+        else:
+            for code in codes[i:i + n]:
+                value = ((value ^ code) * _FNV_PRIME) & _MASK64
+        shingles.add(value)
+    return frozenset(shingles)
+
+
+def jaccard_similarity(set1: AbstractSet, set2: AbstractSet) -> float:
+    """Compute Jaccard similarity between two sets.
+
+    The union size is |A| + |B| - |A & B|, so no union set is built.
+    """
     if not set1 or not set2:
         return 0.0
     intersection = len(set1 & set2)
-    union = len(set1 | set2)
-    return intersection / union if union > 0 else 0.0
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+def canonical_url(url: str) -> str:
+    """Reduce a URL to a key shared by every form of the same page.
+
+    Reddit threads become reddit.com/comments/<id> whatever the host
+    (www/old/np/new/m), subreddit, slug or query; redd.it short links too.
+    Tweets become x.com/i/status/<id> for twitter.com, x.com and
+    /i/web/status links. Other URLs lose scheme, www., port, fragment,
+    trailing slash and tracking parameters. The result is a comparison
+    key, not a link to display.
+
+    Args:
+        url: Any URL (scheme optional)
+
+    Returns:
+        Canonical key, or "" for an empty URL
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urlparse(url)
+    host = parsed.hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path
+
+    if host == "reddit.com" or host.endswith(".reddit.com"):
+        match = _REDDIT_THREAD_RE.match(path)
+        if match:
+            thread_id, comment_id = match.group(1).lower(), match.group(2)
+            if comment_id:
+                return f"reddit.com/comments/{thread_id}/_/{comment_id.lower()}"
+            return f"reddit.com/comments/{thread_id}"
+        host = "reddit.com"
+    elif host == "redd.it" and path.strip("/"):
+        return f"reddit.com/comments/{path.strip('/').split('/')[0].lower()}"
+    elif host in _X_HOSTS:
+        match = _X_STATUS_RE.match(path)
+        if match:
+            return f"x.com/i/status/{match.group(1)}"
+        host = "x.com"
+
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ])
+    key = host + path.rstrip("/")
+    return f"{key}?{query}" if query else key
+
+
+def dedupe_by_url(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    seen: Optional[Dict[str, object]] = None,
+) -> List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+    """Drop exact duplicates by canonical URL in one O(n) pass.
+
+    Keeps the higher-scored item of each duplicate set (the first one on
+    ties), in its original position. Pass the same `seen` dict across
+    calls to dedupe across sources; an item whose URL was already claimed
+    by an earlier call is dropped.
+
+    Args:
+        items: Items with url and score attributes
+        seen: Shared canonical URL index, updated in place
+
+    Returns:
+        Items with URL duplicates removed
+    """
+    seen = {} if seen is None else seen
+    kept: Dict[str, int] = {}
+    result = []
+    for item in items:
+        key = canonical_url(item.url)
+        if not key:
+            result.append(item)
+            continue
+        if key in kept:
+            idx = kept[key]
+            if item.score > result[idx].score:
+                result[idx] = item
+                seen[key] = item
+            continue
+        if key in seen:
+            continue
+        kept[key] = len(result)
+        seen[key] = item
+        result.append(item)
+    return result
 
 
 def get_item_text(item: Union[schema.RedditItem, schema.XItem]) -> str:
@@ -44,42 +220,160 @@ def get_item_text(item: Union[schema.RedditItem, schema.XItem]) -> str:
         return item.text
 
 
+def get_dedupe_engine() -> str:
+    """Get the default engine from LAST30DAYS_DEDUPE_ENGINE (default: exact)."""
+    engine = os.environ.get("LAST30DAYS_DEDUPE_ENGINE", DEFAULT_ENGINE).lower()
+    return engine if engine in ENGINES else DEFAULT_ENGINE
+
+
+def minhash_signature(shingles: AbstractSet[int]) -> List[int]:
+    """Compute a one-permutation MinHash signature for a shingle set.
+
+    Short texts leave many bins empty, and empty bins would match across
+    unrelated items. Each empty bin therefore borrows the value of the
+    next non-empty bin to its right (rotation densification), offset by
+    the distance.
+
+    Args:
+        shingles: Integer shingles from get_shingles
+
+    Returns:
+        MINHASH_NUM_PERM per-bin minimum hash values (all _EMPTY_BIN for
+        an empty set)
+    """
+    signature = [_EMPTY_BIN] * MINHASH_NUM_PERM
+    for shingle in shingles:
+        value = (_HASH_A * shingle + _HASH_B) % _MERSENNE_PRIME
+        bin_idx = value % MINHASH_NUM_PERM
+        value //= MINHASH_NUM_PERM
+        if value < signature[bin_idx]:
+            signature[bin_idx] = value
+    if not shingles or _EMPTY_BIN not in signature:
+        return signature
+
+    filled = list(signature)
+    for i in range(MINHASH_NUM_PERM):
+        if signature[i] != _EMPTY_BIN:
+            continue
+        distance = 1
+        while signature[(i + distance) % MINHASH_NUM_PERM] == _EMPTY_BIN:
+            distance += 1
+        filled[i] = signature[(i + distance) % MINHASH_NUM_PERM] + distance * _BORROW_OFFSET
+    return filled
+
+
+def lsh_params(threshold: float, num_perm: int = MINHASH_NUM_PERM) -> Tuple[int, int]:
+    """Pick LSH banding for a similarity threshold.
+
+    Uses the most rows per band whose S-curve midpoint (1/b)^(1/r) stays
+    well below the threshold, trading extra candidates (which are verified
+    exactly anyway) for recall.
+
+    Returns:
+        Tuple of (bands, rows_per_band)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.15:
+            best = (bands, rows)
+    return best
+
+
+def _find_duplicates_exact(shingles: List[FrozenSet[int]], threshold: float) -> List[Tuple[int, int]]:
+    """Compare every pair - O(n^2) but exact."""
+    duplicates = []
+    sizes = [len(sh) for sh in shingles]
+    for i in range(len(shingles)):
+        set_i, size_i = shingles[i], sizes[i]
+        for j in range(i + 1, len(shingles)):
+            # Inlined jaccard_similarity: this is the hot loop
+            intersection = len(set_i & shingles[j])
+            if intersection / (size_i + sizes[j] - intersection) >= threshold:
+                duplicates.append((i, j))
+    return duplicates
+
+
+def _find_duplicates_minhash(shingles: List[FrozenSet[int]], threshold: float) -> List[Tuple[int, int]]:
+    """Find candidate pairs with MinHash + LSH, then verify them exactly.
+
+    Never reports a false positive; may rarely miss a pair whose
+    signatures share no band. Items with fewer than MINHASH_MIN_SHINGLES
+    shingles skip LSH and are compared with every item they could match.
+    """
+    bands, rows = lsh_params(threshold)
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    short = []
+    for idx, item_shingles in enumerate(shingles):
+        if len(item_shingles) < MINHASH_MIN_SHINGLES:
+            short.append(idx)
+            continue
+        signature = minhash_signature(item_shingles)
+        for band in range(bands):
+            buckets[(band, tuple(signature[band * rows:(band + 1) * rows]))].append(idx)
+
+    candidates = set()
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                candidates.add((i, j))
+
+    # Jaccard >= t needs |B| <= |A| / t, so a short item can only match
+    # items of at most that size
+    for i in short:
+        max_size = len(shingles[i]) / threshold
+        for j, other in enumerate(shingles):
+            if j != i and len(other) <= max_size:
+                candidates.add((min(i, j), max(i, j)))
+
+    return sorted(
+        (i, j) for i, j in candidates
+        if jaccard_similarity(shingles[i], shingles[j]) >= threshold
+    )
+
+
 def find_duplicates(
     items: List[Union[schema.RedditItem, schema.XItem]],
     threshold: float = 0.7,
+    engine: str = None,
 ) -> List[Tuple[int, int]]:
     """Find near-duplicate pairs in items.
 
     Args:
         items: List of items to check
         threshold: Similarity threshold (0-1)
+        engine: 'exact', 'minhash' or 'auto' (default: get_dedupe_engine())
 
     Returns:
         List of (i, j) index pairs where i < j and items are similar
     """
-    duplicates = []
+    engine = engine or get_dedupe_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown dedupe engine: {engine}")
+    if engine == "auto":
+        engine = "minhash" if len(items) >= MINHASH_MIN_ITEMS else "exact"
 
-    # Pre-compute n-grams
-    ngrams = [get_ngrams(get_item_text(item)) for item in items]
+    # Pre-compute shingles
+    shingles = [get_shingles(get_item_text(item)) for item in items]
 
-    for i in range(len(items)):
-        for j in range(i + 1, len(items)):
-            similarity = jaccard_similarity(ngrams[i], ngrams[j])
-            if similarity >= threshold:
-                duplicates.append((i, j))
-
-    return duplicates
+    if engine == "minhash":
+        return _find_duplicates_minhash(shingles, threshold)
+    return _find_duplicates_exact(shingles, threshold)
 
 
 def dedupe_items(
     items: List[Union[schema.RedditItem, schema.XItem]],
     threshold: float = 0.7,
+    engine: str = None,
 ) -> List[Union[schema.RedditItem, schema.XItem]]:
     """Remove near-duplicates, keeping highest-scored item.
 
     Args:
         items: List of items (should be pre-sorted by score descending)
         threshold: Similarity threshold
+        engine: Duplicate-finding engine, see find_duplicates
 
     Returns:
         Deduplicated items
@@ -88,7 +382,7 @@ def dedupe_items(
         return items
 
     # Find duplicate pairs
-    dup_pairs = find_duplicates(items, threshold)
+    dup_pairs = find_duplicates(items, threshold, engine)
 
     # Mark indices to remove (always remove the lower-scored one)
     # Since items are pre-sorted by score, the second index is always lower
@@ -104,6 +398,93 @@ def dedupe_items(
     return [item for idx, item in enumerate(items) if idx not in to_remove]
 
 
+def _prefix_order(shingle: int) -> int:
+    # Any fixed total order works for prefix filtering; a mixed hash spreads
+    # common and rare shingles evenly across prefixes
+    return (_HASH_A * shingle + _HASH_B) % _MERSENNE_PRIME
+
+
+class DedupeIndex:
+    """Incremental near-duplicate index for items that arrive one at a time.
+
+    After any sequence of add() calls, items() equals
+    dedupe_items(<all items in arrival order>, threshold): an item survives
+    only if no similar item scores higher (or the same, having arrived
+    earlier). Input doesn't need to be sorted.
+
+    Candidates come from a prefix-filter index: with shingles in a fixed
+    order, two sets with Jaccard >= t must share one of their first
+    |s| - ceil(t * |s|) + 1 shingles, so only those are indexed and probed.
+    Unlike LSH this never misses a pair, and each add() touches only items
+    that share a prefix shingle.
+    """
+
+    KEPT = "kept"
+    REPLACED = "replaced"
+    DROPPED = "dropped"
+
+    def __init__(self, threshold: float = 0.7):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        # Every item ever added stays indexed: a dropped item still knocks
+        # out lower-scored neighbors, exactly as in the batch version
+        self._items: List[Union[schema.RedditItem, schema.XItem]] = []
+        self._shingles: List[FrozenSet[int]] = []
+        self._kept: List[bool] = []
+        self._prefix_index: Dict[int, List[int]] = defaultdict(list)
+
+    def add(self, item: Union[schema.RedditItem, schema.XItem]) -> str:
+        """Add an item.
+
+        Returns:
+            KEPT if it survives, REPLACED if it survives and knocked out
+            lower-scored kept items, DROPPED if a similar item outranks it
+            (lower-scored neighbors are still knocked out)
+        """
+        shingles = get_shingles(get_item_text(item))
+        ordered = sorted(shingles, key=_prefix_order)
+        # Tiny epsilon so float error can only lengthen the prefix
+        prefix = ordered[:len(ordered) - math.ceil(self.threshold * len(ordered) - 1e-9) + 1]
+
+        candidates = set()
+        for shingle in prefix:
+            candidates.update(self._prefix_index.get(shingle, ()))
+        neighbors = [
+            m for m in candidates
+            if jaccard_similarity(self._shingles[m], shingles) >= self.threshold
+        ]
+
+        idx = len(self._items)
+        self._items.append(item)
+        self._shingles.append(shingles)
+        for shingle in prefix:
+            self._prefix_index[shingle].append(idx)
+
+        # Every pair is settled on its own, as in dedupe_items: the new item
+        # knocks out lower-scored neighbors even if something else outranks
+        # it, and earlier arrivals win ties like lower indexes do there
+        kept = True
+        replaced = False
+        for m in neighbors:
+            if self._items[m].score >= item.score:
+                kept = False
+            elif self._kept[m]:
+                self._kept[m] = False
+                replaced = True
+        self._kept.append(kept)
+        if not kept:
+            return self.DROPPED
+        return self.REPLACED if replaced else self.KEPT
+
+    def items(self) -> List[Union[schema.RedditItem, schema.XItem]]:
+        """Surviving items, in arrival order."""
+        return [item for item, kept in zip(self._items, self._kept) if kept]
+
+    def __len__(self) -> int:
+        return sum(self._kept)
+
+
 def dedupe_reddit(
     items: List[schema.RedditItem],
     threshold: float = 0.7,
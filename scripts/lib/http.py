@@ -1,13 +1,24 @@
 """HTTP utilities for last30days skill (stdlib only)."""
 
+import http.client as http_client
 import json
 import os
+import random
+import select
+import socket
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlparse
+
+from .deadline import Deadline
 
 DEFAULT_TIMEOUT = 30
 DEBUG = os.environ.get("LAST30DAYS_DEBUG", "").lower() in ("1", "true", "yes")
@@ -23,6 +34,462 @@ RETRY_DELAY = 1.0
 USER_AGENT = "last30days-skill/2.0 (Assistant Skill)"
 
 
+# Providers we talk to, matched by host suffix so www./old. variants of a
+# host share one provider (and one rate limiter).
+PROVIDER_HOSTS: Dict[str, str] = {
+    "openai": "api.openai.com",
+    "xai": "api.x.ai",
+    "reddit": "reddit.com",
+}
+
+# Per-provider rate limits as (requests per second, burst size).
+# Override with LAST30DAYS_<PROVIDER>_RPS, e.g. LAST30DAYS_REDDIT_RPS=1.5.
+PROVIDER_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "reddit": (3.0, 6),
+}
+
+
+@dataclass
+class RetryPolicy:
+    """Retry schedule: exponential backoff with full jitter.
+
+    Attempt n (0-based) sleeps uniform(0, min(max_delay, base_delay * 2**n)).
+    A server-sent Retry-After wins over the computed delay, capped at
+    max_retry_after.
+    """
+    max_retries: int = MAX_RETRIES
+    base_delay: float = RETRY_DELAY
+    max_delay: float = 20.0
+    max_retry_after: float = 60.0
+    retry_statuses: Tuple[int, ...] = (429,)  # 4xx codes worth retrying
+
+    def should_retry(self, status: int) -> bool:
+        """Check whether an HTTP status is worth another attempt."""
+        return status >= 500 or status in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the next attempt."""
+        if retry_after is not None:
+            return max(0.0, min(retry_after, self.max_retry_after))
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "default": RetryPolicy(),
+    # Web-search calls are slow and expensive; back off harder
+    "openai": RetryPolicy(base_delay=2.0, max_delay=30.0),
+    "xai": RetryPolicy(base_delay=2.0, max_delay=30.0),
+    "reddit": RetryPolicy(base_delay=1.0, max_delay=20.0),
+}
+
+
+def get_provider(host: str) -> Optional[str]:
+    """Map a hostname to a provider name, or None if unknown."""
+    host = host.lower()
+    for provider, suffix in PROVIDER_HOSTS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return provider
+    return None
+
+
+def get_retry_policy(host: str) -> RetryPolicy:
+    """Get the retry policy for a host (provider-specific or default)."""
+    return RETRY_POLICIES.get(get_provider(host) or "default", RETRY_POLICIES["default"])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available, then consume it.
+
+        Args:
+            timeout: Give up after this many seconds (None = wait forever)
+
+        Returns:
+            True if a token was taken, False if the timeout ran out first
+        """
+        give_up_at = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    wait = (1 - self.tokens) / self.rate
+            if give_up_at is not None:
+                if now + wait > give_up_at:
+                    return False
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back every caller for `seconds` (e.g. after a Retry-After).
+
+        Tokens are drained so callers resume at the steady rate instead of
+        bursting straight back into the server.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            self.tokens = 0.0
+            self.updated = self.blocked_until
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _rate_limit(provider: str) -> Optional[Tuple[float, int]]:
+    """Get (rate, burst) for a provider, honoring env overrides."""
+    limit = PROVIDER_RATE_LIMITS.get(provider)
+    raw = os.environ.get(f"LAST30DAYS_{provider.upper()}_RPS", "")
+    try:
+        rate = float(raw)
+    except ValueError:
+        return limit
+    if rate <= 0:
+        return limit
+    burst = limit[1] if limit else max(1, int(rate * 2))
+    return rate, burst
+
+
+def _get_bucket(host: str) -> Optional[TokenBucket]:
+    """Get the process-wide rate limiter for a host, or None if unlimited."""
+    provider = get_provider(host)
+    if not provider:
+        return None
+    with _buckets_lock:
+        if provider not in _buckets:
+            limit = _rate_limit(provider)
+            if not limit:
+                return None
+            _buckets[provider] = TokenBucket(*limit)
+        return _buckets[provider]
+
+
+def configure_provider(
+    provider: str,
+    rate: Optional[float] = None,
+    burst: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+):
+    """Tune a provider's rate limit and/or retry policy at runtime."""
+    if rate is not None:
+        current = PROVIDER_RATE_LIMITS.get(provider, (rate, max(1, int(rate * 2))))
+        PROVIDER_RATE_LIMITS[provider] = (rate, burst if burst is not None else current[1])
+        with _buckets_lock:
+            _buckets.pop(provider, None)
+    if retry_policy is not None:
+        RETRY_POLICIES[provider] = retry_policy
+
+
+def throttle(url: str, deadline: Optional[Deadline] = None):
+    """Wait for the per-host rate limiter (no-op for unlimited hosts).
+
+    Raises:
+        DeadlineExceededError: If no token frees up within the budget
+    """
+    host = urlparse(url).netloc.lower()
+    bucket = _get_bucket(host)
+    if bucket and not bucket.acquire(deadline.remaining() if deadline else None):
+        raise DeadlineExceededError(f"Time budget exhausted waiting for the {host} rate limiter")
+
+
+# Keep-alive connection pool settings
+POOL_MAX_PER_HOST = 8       # Max concurrent connections per host
+POOL_IDLE_TIMEOUT = 60.0    # Seconds before an idle connection is dropped
+MAX_REDIRECTS = 5
+READ_CHUNK_SIZE = 64 * 1024
+ACCEPT_ENCODING = "gzip, deflate"
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+# Safe to resend when a kept-alive connection turns out to be dead after
+# the request went out (RFC 9110 9.2.2); anything else may have been acted on
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+PoolKey = Tuple[str, str, int]
+
+
+class ConnectionPool:
+    """Thread-safe per-host pool of persistent HTTP(S) connections.
+
+    Connections are checked out for one request/response and returned
+    afterwards. At most max_per_host connections per host exist at once;
+    further callers block until one is released. Connections idle for
+    longer than idle_timeout are closed instead of reused.
+    """
+
+    def __init__(self, max_per_host: int = POOL_MAX_PER_HOST, idle_timeout: float = POOL_IDLE_TIMEOUT):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[PoolKey, List[Tuple[http_client.HTTPConnection, float]]] = {}
+        self._slots: Dict[PoolKey, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, key: PoolKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._slots[key]
+
+    def acquire(
+        self, key: PoolKey, timeout: float, deadline: Optional[Deadline] = None,
+    ) -> Tuple[http_client.HTTPConnection, bool]:
+        """Check out a connection for key.
+
+        Args:
+            key: (scheme, host, port)
+            timeout: Socket timeout for the connection
+            deadline: Run-wide budget; bounds the wait for a free slot
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a
+            kept-alive connection
+
+        Raises:
+            DeadlineExceededError: If no slot frees up within the budget
+        """
+        wait = deadline.remaining() if deadline else None
+        if not self._slot(key).acquire(timeout=wait):
+            raise DeadlineExceededError(f"Time budget exhausted waiting for a connection to {key[1]}")
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used < self.idle_timeout and not _peer_closed(candidate):
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for c in stale:
+            c.close()
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        scheme, host, port = key
+        conn_cls = http_client.HTTPSConnection if scheme == "https" else http_client.HTTPConnection
+        return conn_cls(host, port, timeout=timeout), False
+
+    def release(self, key: PoolKey, conn: http_client.HTTPConnection, reusable: bool = True):
+        """Return a connection to the pool (or close it if not reusable)."""
+        if reusable:
+            with self._lock:
+                self._idle.setdefault(key, []).append((conn, time.monotonic()))
+        else:
+            conn.close()
+        self._slot(key).release()
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+
+def _peer_closed(conn: http_client.HTTPConnection) -> bool:
+    """Check whether an idle connection was closed by the server.
+
+    An idle keep-alive socket has nothing to read; if it polls readable,
+    the server has sent EOF (or stray bytes) and it can't be reused.
+    """
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+_pool = ConnectionPool()
+
+
+def _read_body(response, content_encoding: Optional[str]) -> bytes:
+    """Read a response body, decompressing gzip/deflate as it streams in.
+
+    Args:
+        response: http.client/urllib response (anything with read(n))
+        content_encoding: Value of the Content-Encoding header
+
+    Returns:
+        Decoded body bytes
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        # Auto-detect zlib header; raw deflate streams are handled below
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+    else:
+        decompressor = None
+
+    wire = 0
+    parts = []
+    while True:
+        chunk = response.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        wire += len(chunk)
+        if decompressor is None:
+            parts.append(chunk)
+            continue
+        try:
+            parts.append(decompressor.decompress(chunk))
+        except zlib.error:
+            if encoding != "deflate" or wire != len(chunk):
+                raise
+            # Some servers send raw deflate without the zlib wrapper
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            parts.append(decompressor.decompress(chunk))
+    if decompressor is not None:
+        parts.append(decompressor.flush())
+
+    body = b"".join(parts)
+    if decompressor is not None:
+        log(f"Body: {wire} bytes on the wire, {len(body)} bytes decoded ({encoding})")
+    return body
+
+
+def _uses_proxy(parsed) -> bool:
+    """Check whether the environment routes this URL through a proxy."""
+    proxies = urllib.request.getproxies()
+    return bool(proxies.get(parsed.scheme)) and not urllib.request.proxy_bypass(parsed.hostname or "")
+
+
+def _send_pooled(
+    method: str,
+    parsed,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: float,
+    deadline: Optional[Deadline] = None,
+) -> Tuple[int, str, Dict[str, str], bytes]:
+    """Send one request over a pooled keep-alive connection.
+
+    Idle connections the server has closed are dropped before sending. If
+    a kept-alive connection still dies mid-request, idempotent methods are
+    resent on a fresh connection without counting as a failed attempt;
+    others (POST) raise, since the server may already have acted on them.
+    """
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    key = (parsed.scheme, parsed.hostname, port)
+    path = parsed.path or "/"
+    if parsed.query:
+        path += "?" + parsed.query
+
+    while True:
+        conn, reused = _pool.acquire(key, timeout, deadline)
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            body = _read_body(response, response.getheader("Content-Encoding"))
+        except (http_client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _pool.release(key, conn, reusable=False)
+            if reused and method.upper() in IDEMPOTENT_METHODS:
+                log(f"Stale pooled connection to {parsed.hostname}, reconnecting")
+                continue
+            raise
+        except BaseException:
+            _pool.release(key, conn, reusable=False)
+            raise
+        _pool.release(key, conn, reusable=not response.will_close)
+        return response.status, response.reason, dict(response.getheaders()), body
+
+
+def _send_urllib(
+    method: str,
+    url: str,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Tuple[int, str, Dict[str, str], bytes]:
+    """Send one request via urllib (used when a proxy is configured)."""
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            body = _read_body(response, response.headers.get("Content-Encoding"))
+            return response.status, response.reason, dict(response.getheaders()), body
+    except urllib.error.HTTPError as e:
+        body = b""
+        try:
+            body = _read_body(e, e.headers.get("Content-Encoding") if e.headers else None)
+        except Exception:
+            pass
+        return e.code, str(e.reason), dict(e.headers or {}), body
+
+
+def _send(
+    method: str,
+    url: str,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: float,
+    deadline: Optional[Deadline] = None,
+) -> Tuple[int, str, Dict[str, str], bytes]:
+    """Send a request, following redirects.
+
+    deadline (if given) bounds the wait for a pooled connection slot.
+
+    Returns:
+        Tuple of (status, reason, response headers, raw body)
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        if _uses_proxy(parsed):
+            return _send_urllib(method, url, data, headers, timeout)
+
+        status, reason, resp_headers, body = _send_pooled(method, parsed, data, headers, timeout, deadline)
+        location = resp_headers.get("Location") or resp_headers.get("location")
+        if status not in REDIRECT_CODES or not location:
+            return status, reason, resp_headers, body
+
+        url = urljoin(url, location)
+        log(f"Redirect {status} -> {url}")
+        if status == 303 or (status in (301, 302) and method == "POST"):
+            method, data = "GET", None
+    return status, reason, resp_headers, body
+
+
 class HTTPError(Exception):
     """HTTP request error with status code."""
     def __init__(self, message: str, status_code: Optional[int] = None, body: Optional[str] = None):
@@ -31,13 +498,130 @@ class HTTPError(Exception):
         self.body = body
 
 
+class CircuitOpenError(HTTPError):
+    """Raised without sending anything while a host's circuit is open."""
+
+
+class DeadlineExceededError(HTTPError):
+    """Raised when the run-wide time budget runs out."""
+
+
+# Circuit breaker settings: after CIRCUIT_FAILURE_THRESHOLD consecutive
+# failed attempts (connection errors, timeouts, 5xx) calls to the host fail
+# fast for CIRCUIT_COOLDOWN seconds, then one probe request is let through.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 30.0
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker (closed -> open -> half-open -> closed)."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if now - self.opened_at < self.cooldown or self._probing:
+            return "open"
+        return "half-open"
+
+    def before_request(self):
+        """Raise CircuitOpenError if the call must not go out.
+
+        In half-open state exactly one caller is let through as a probe.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == "closed":
+                return
+            if state == "half-open":
+                self._probing = True
+                return
+            if self._probing:
+                detail = "probe request in flight"
+            else:
+                detail = f"retry in {self.cooldown - (now - self.opened_at):.0f}s"
+            raise CircuitOpenError(
+                f"Circuit open for {self.name} after {self.failures} consecutive failures ({detail})"
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_cancelled(self):
+        """The attempt never reached the host: free a probe slot without
+        counting a success or a failure."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._probing:
+                    log(f"Circuit opened for {self.name} ({self.failures} consecutive failures)")
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Get the circuit breaker for a host (shared per provider)."""
+    name = get_provider(host) or host.lower()
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def get_circuit_error(name: str) -> Optional[str]:
+    """Describe a provider/host circuit if it isn't closed, else None."""
+    breaker = _breakers.get(name)
+    if breaker is None or breaker.state == "closed":
+        return None
+    return f"Circuit {breaker.state} for {name} after {breaker.failures} consecutive failures"
+
+
+def reset_circuits():
+    """Forget all breaker state."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
 def request(
     method: str,
     url: str,
     headers: Optional[Dict[str, str]] = None,
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
-    retries: int = MAX_RETRIES,
+    retries: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[Deadline] = None,
 ) -> Dict[str, Any]:
     """Make an HTTP request and return JSON response.
 
@@ -47,69 +631,129 @@ def request(
         headers: Optional headers dict
         json_data: Optional JSON body (for POST)
         timeout: Request timeout in seconds
-        retries: Number of retries on failure
+        retries: Number of attempts (default: the retry policy's max_retries)
+        retry_policy: Backoff schedule (default: the host's provider policy)
+        deadline: Run-wide budget; caps each attempt's timeout and stops
+            retrying once exhausted
 
     Returns:
         Parsed JSON response
 
     Raises:
         HTTPError: On request failure
+        CircuitOpenError: If the host's circuit breaker is open
+        DeadlineExceededError: If the budget ran out
     """
     headers = headers or {}
     headers.setdefault("User-Agent", USER_AGENT)
+    headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
 
     data = None
     if json_data is not None:
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    host = urlparse(url).netloc.lower()
+    policy = retry_policy or get_retry_policy(host)
+    if retries is None:
+        retries = policy.max_retries
 
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
 
+    breaker = get_breaker(host)
+    deadline = deadline or Deadline()
+
     last_error = None
     for attempt in range(retries):
+        if deadline.expired():
+            deadline.mark_cut_short()
+            detail = f": {last_error}" if last_error else ""
+            raise DeadlineExceededError(f"Time budget exhausted before {method} {host}{detail}")
+        breaker.before_request()
+        retry_after = None
+        attempt_timeout = deadline.timeout(timeout)
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
-            try:
-                body = e.read().decode('utf-8')
-            except:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
+            throttle(url, deadline)
+            status, reason, resp_headers, raw = _send(
+                method, url, data, headers, attempt_timeout, deadline,
+            )
+        except (OSError, TimeoutError, ConnectionResetError, http_client.HTTPException, zlib.error) as e:
+            cause = e.reason if isinstance(e, urllib.error.URLError) else e
+            if deadline.expired() or (
+                attempt_timeout < timeout and isinstance(cause, (TimeoutError, socket.timeout))
+            ):
+                # The budget's cap fired, not a host problem: leave the circuit alone
+                breaker.record_cancelled()
+                deadline.mark_cut_short()
+                raise DeadlineExceededError(f"Time budget exhausted during {method} {host}: {cause}") from e
+            if isinstance(e, urllib.error.URLError):
+                log(f"URL Error: {e.reason}")
+                last_error = HTTPError(f"URL Error: {e.reason}")
+            else:
+                # Handle socket-level errors (connection reset, timeout, etc.)
+                log(f"Connection error: {type(e).__name__}: {e}")
+                last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
+            breaker.record_failure()
+        except DeadlineExceededError:
+            # Ran out of budget before anything reached the host
+            breaker.record_cancelled()
+            deadline.mark_cut_short()
+            raise
+        except BaseException:
+            # Anything else (bad URL, interrupt) must still settle the attempt,
+            # or a half-open probe would leave the circuit open for good
+            breaker.record_failure()
+            raise
+        else:
+            # Any answer below 500 means the host is up
+            if status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            body = raw.decode('utf-8', errors='replace')
+            if status < 400:
+                log(f"Response: {status} ({len(body)} bytes)")
+                try:
+                    return json.loads(body) if body else {}
+                except json.JSONDecodeError as e:
+                    log(f"JSON decode error: {e}")
+                    raise HTTPError(f"Invalid JSON response: {e}")
+
+            log(f"HTTP Error {status}: {reason}")
             if body:
                 log(f"Error body: {body[:500]}")
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
+            last_error = HTTPError(f"HTTP {status}: {reason}", status, body or None)
 
             # Don't retry client errors (4xx) except rate limits
-            if 400 <= e.code < 500 and e.code != 429:
+            if not policy.should_retry(status):
                 raise last_error
 
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except urllib.error.URLError as e:
-            log(f"URL Error: {e.reason}")
-            last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except json.JSONDecodeError as e:
-            log(f"JSON decode error: {e}")
-            last_error = HTTPError(f"Invalid JSON response: {e}")
-            raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
-            # Handle socket-level errors (connection reset, timeout, etc.)
-            log(f"Connection error: {type(e).__name__}: {e}")
-            last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+            retry_after = parse_retry_after(
+                resp_headers.get("Retry-After") or resp_headers.get("retry-after")
+            )
+
+        if attempt < retries - 1:
+            delay = policy.backoff(attempt, retry_after)
+            remaining = deadline.remaining()
+            if remaining is not None and delay >= remaining:
+                log(f"Not retrying: {delay:.1f}s backoff exceeds remaining budget")
+                deadline.mark_cut_short()
+                break
+            if retry_after is not None:
+                # Server asked everyone to back off - hold the whole host, not
+                # just this thread, so parallel workers don't retry in lockstep
+                bucket = _get_bucket(host)
+                if bucket:
+                    bucket.pause(delay)
+            log(f"Retrying in {delay:.1f}s (attempt {attempt + 2}/{retries})")
+            time.sleep(delay)
 
     if last_error:
+        if deadline.expired():
+            deadline.mark_cut_short()  # the last attempt's timeout was the budget's
         raise last_error
     raise HTTPError("Request failed with no error details")
 
@@ -124,11 +768,18 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
-def get_reddit_json(path: str) -> Dict[str, Any]:
+def get_reddit_json(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
     """Fetch Reddit thread JSON.
 
     Args:
         path: Reddit path (e.g., /r/subreddit/comments/id/title)
+        params: Extra query parameters (e.g., sort/depth/limit to trim the
+            comment tree server-side)
+        deadline: Run-wide time budget
 
     Returns:
         Parsed JSON response
@@ -142,11 +793,14 @@ def get_reddit_json(path: str) -> Dict[str, Any]:
     if not path.endswith('.json'):
         path = path + '.json'
 
-    url = f"https://www.reddit.com{path}?raw_json=1"
+    query = {"raw_json": 1}
+    if params:
+        query.update(params)
+    url = f"https://www.reddit.com{path}?{urlencode(query)}"
 
     headers = {
         "User-Agent": USER_AGENT,
         "Accept": "application/json",
     }
 
-    return get(url, headers=headers)
+    return get(url, headers=headers, deadline=deadline)
@@ -1,6 +1,6 @@
 """Normalization of raw API data to canonical schema."""
 
-from typing import Any, Dict, List, TypeVar, Union
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
 from . import dates, schema
 
@@ -51,6 +51,7 @@ def normalize_reddit_items(
     items: List[Dict[str, Any]],
     from_date: str,
     to_date: str,
+    date_ctx: Optional[dates.DateContext] = None,
 ) -> List[schema.RedditItem]:
     """Normalize raw Reddit items to schema.
 
@@ -58,10 +59,13 @@ def normalize_reddit_items(
         items: Raw Reddit items from API
         from_date: Start of date range
         to_date: End of date range
+        date_ctx: Shared per-run DateContext (built from the range if omitted)
 
     Returns:
         List of RedditItem objects
     """
+    if date_ctx is None:
+        date_ctx = dates.DateContext(from_date, to_date)
     normalized = []
 
     for item in items:
@@ -88,7 +92,7 @@ def normalize_reddit_items(
 
         # Determine date confidence
         date_str = item.get("date")
-        date_confidence = dates.get_date_confidence(date_str, from_date, to_date)
+        date_confidence = date_ctx.confidence(date_str)
 
         normalized.append(schema.RedditItem(
             id=item.get("id", ""),
@@ -111,6 +115,7 @@ def normalize_x_items(
     items: List[Dict[str, Any]],
     from_date: str,
     to_date: str,
+    date_ctx: Optional[dates.DateContext] = None,
 ) -> List[schema.XItem]:
     """Normalize raw X items to schema.
 
@@ -118,10 +123,13 @@ def normalize_x_items(
         items: Raw X items from API
         from_date: Start of date range
         to_date: End of date range
+        date_ctx: Shared per-run DateContext (built from the range if omitted)
 
     Returns:
         List of XItem objects
     """
+    if date_ctx is None:
+        date_ctx = dates.DateContext(from_date, to_date)
     normalized = []
 
     for item in items:
@@ -138,7 +146,7 @@ def normalize_x_items(
 
         # Determine date confidence
         date_str = item.get("date")
-        date_confidence = dates.get_date_confidence(date_str, from_date, to_date)
+        date_confidence = date_ctx.confidence(date_str)
 
         normalized.append(schema.XItem(
             id=item.get("id", ""),
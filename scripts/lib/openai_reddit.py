@@ -1,15 +1,36 @@
 """OpenAI Responses API client for Reddit discovery."""
 
 import json
+import os
 import re
 import sys
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from . import http
+from . import http, reddit_enrich
+from .deadline import Deadline
 
 # Fallback models when the selected model isn't accessible (e.g., org not verified for GPT-5)
 MODEL_FALLBACK_ORDER = ["gpt-4.1", "gpt-4o", "gpt-4o-mini"]
 
+# Hedged mode (--hedge-after) starts fallback queries before the main query
+# comes back sparse. Each hedge is a paid API call, so cap them per run.
+DEFAULT_HEDGE_MAX_QUERIES = 1
+
+
+def get_hedge_max_queries() -> int:
+    """Get the per-run hedge cap from LAST30DAYS_HEDGE_MAX_QUERIES."""
+    raw = os.environ.get("LAST30DAYS_HEDGE_MAX_QUERIES", "")
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_HEDGE_MAX_QUERIES
+
+
+# Phase 2 subreddit searches in flight at once (still paced by the
+# per-host limiter in http.py)
+SUBREDDIT_SEARCH_CONCURRENCY = 5
+
 
 def _log_error(msg: str):
     """Log error to stderr."""
@@ -115,6 +136,24 @@ def _build_subreddit_query(topic: str) -> str:
     return f"r/{sub_name} site:reddit.com"
 
 
+def get_fallback_queries(topic: str) -> List[Tuple[str, int]]:
+    """Get the fallback queries tried when a Reddit search comes back sparse.
+
+    Args:
+        topic: Original search topic
+
+    Returns:
+        List of (query, min_items) in the order they're tried; each query
+        runs only while fewer than min_items results have been found
+    """
+    queries = []
+    core = _extract_core_subject(topic)
+    if core.lower() != topic.lower():
+        queries.append((core, 5))
+    queries.append((_build_subreddit_query(topic), 3))
+    return queries
+
+
 def search_reddit(
     api_key: str,
     model: str,
@@ -124,6 +163,7 @@ def search_reddit(
     depth: str = "default",
     mock_response: Optional[Dict] = None,
     _retry: bool = False,
+    deadline: Optional[Deadline] = None,
 ) -> Dict[str, Any]:
     """Search Reddit for relevant threads using OpenAI Responses API.
 
@@ -135,6 +175,7 @@ def search_reddit(
         to_date: End date (YYYY-MM-DD) - only include threads before this
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        deadline: Run-wide time budget (caps the request timeout)
 
     Returns:
         Raw API response
@@ -182,7 +223,7 @@ def search_reddit(
         }
 
         try:
-            return http.post(OPENAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+            return http.post(OPENAI_RESPONSES_URL, payload, headers=headers, timeout=timeout, deadline=deadline)
         except http.HTTPError as e:
             last_error = e
             if _is_model_access_error(e):
@@ -198,17 +239,77 @@ def search_reddit(
     raise http.HTTPError("No models available")
 
 
+def _search_subreddit(
+    sub: str,
+    core: str,
+    count_per: int,
+    deadline: Deadline,
+) -> List[Dict[str, Any]]:
+    """Search one subreddit's JSON endpoint (runs in thread).
+
+    Returns:
+        Raw item dicts without ids; search_subreddits numbers them
+    """
+    url = f"https://www.reddit.com/r/{sub}/search/.json"
+    params = f"q={_url_encode(core)}&restrict_sr=on&sort=new&limit={count_per}&raw_json=1"
+    full_url = f"{url}?{params}"
+
+    headers = {
+        "User-Agent": http.USER_AGENT,
+        "Accept": "application/json",
+    }
+
+    data = http.get(full_url, headers=headers, timeout=15, deadline=deadline)
+
+    items = []
+    # Reddit search returns {"data": {"children": [...]}}
+    children = data.get("data", {}).get("children", [])
+    for child in children:
+        if child.get("kind") != "t3":  # t3 = link/submission
+            continue
+        post = child.get("data", {})
+        permalink = post.get("permalink", "")
+        if not permalink:
+            continue
+
+        item = {
+            "title": str(post.get("title", "")).strip(),
+            "url": f"https://www.reddit.com{permalink}",
+            "subreddit": str(post.get("subreddit", sub)).strip(),
+            "date": None,
+            "why_relevant": f"Found in r/{sub} supplemental search",
+            "relevance": 0.65,  # Slightly lower default for supplemental
+        }
+
+        # Listing posts carry the same engagement/created_utc as a
+        # thread fetch - keep them so the item needs no enrichment
+        reddit_enrich.apply_submission(
+            item, reddit_enrich.parse_submission(post), source="listing",
+        )
+
+        items.append(item)
+
+    return items
+
+
 def search_subreddits(
     subreddits: List[str],
     topic: str,
     from_date: str,
     to_date: str,
     count_per: int = 5,
+    deadline: Optional[Deadline] = None,
 ) -> List[Dict[str, Any]]:
     """Search specific subreddits via Reddit's free JSON endpoint.
 
     No API key needed. Uses reddit.com/r/{sub}/search/.json endpoint.
-    Used in Phase 2 supplemental search after entity extraction.
+    Used in Phase 2 supplemental search after entity extraction. Items
+    keep the listing's engagement and are marked metadata_source='listing'
+    so enrichment doesn't refetch them.
+
+    Subreddits are searched concurrently; requests still go through the
+    shared reddit.com rate limiter in http.py. Results are merged in
+    subreddit order and numbered RS1, RS2, ... after the merge.
 
     Args:
         subreddits: List of subreddit names (without r/)
@@ -216,59 +317,39 @@ def search_subreddits(
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD)
         count_per: Results to request per subreddit
+        deadline: Run-wide time budget; remaining subreddits are skipped
+            once it runs out
 
     Returns:
         List of raw item dicts (same format as parse_reddit_response output).
     """
-    all_items = []
-    core = _extract_core_subject(topic)
-
-    for sub in subreddits:
-        sub = sub.lstrip("r/")
-        try:
-            url = f"https://www.reddit.com/r/{sub}/search/.json"
-            params = f"q={_url_encode(core)}&restrict_sr=on&sort=new&limit={count_per}&raw_json=1"
-            full_url = f"{url}?{params}"
-
-            headers = {
-                "User-Agent": http.USER_AGENT,
-                "Accept": "application/json",
-            }
-
-            data = http.get(full_url, headers=headers, timeout=15)
-
-            # Reddit search returns {"data": {"children": [...]}}
-            children = data.get("data", {}).get("children", [])
-            for i, child in enumerate(children):
-                if child.get("kind") != "t3":  # t3 = link/submission
-                    continue
-                post = child.get("data", {})
-                permalink = post.get("permalink", "")
-                if not permalink:
-                    continue
-
-                item = {
-                    "id": f"RS{len(all_items)+1}",
-                    "title": str(post.get("title", "")).strip(),
-                    "url": f"https://www.reddit.com{permalink}",
-                    "subreddit": str(post.get("subreddit", sub)).strip(),
-                    "date": None,
-                    "why_relevant": f"Found in r/{sub} supplemental search",
-                    "relevance": 0.65,  # Slightly lower default for supplemental
-                }
+    if not subreddits:
+        return []
 
-                # Parse date from created_utc
-                created_utc = post.get("created_utc")
-                if created_utc:
-                    from . import dates as dates_mod
-                    item["date"] = dates_mod.timestamp_to_date(created_utc)
+    core = _extract_core_subject(topic)
+    deadline = deadline or Deadline()
+    subs = [sub.lstrip("r/") for sub in subreddits]
 
-                all_items.append(item)
+    def run(sub):
+        if deadline.expired():
+            _log_info(f"Time budget exhausted, skipping r/{sub}")
+            deadline.mark_cut_short()
+            return []
+        return _search_subreddit(sub, core, count_per, deadline)
 
-        except http.HTTPError as e:
-            _log_info(f"Subreddit search failed for r/{sub}: {e}")
-        except Exception as e:
-            _log_info(f"Subreddit search error for r/{sub}: {e}")
+    all_items = []
+    with ThreadPoolExecutor(max_workers=min(SUBREDDIT_SEARCH_CONCURRENCY, len(subs))) as executor:
+        futures = [executor.submit(run, sub) for sub in subs]
+        for sub, future in zip(subs, futures):
+            try:
+                all_items.extend(future.result())
+            except http.HTTPError as e:
+                _log_info(f"Subreddit search failed for r/{sub}: {e}")
+            except Exception as e:
+                _log_info(f"Subreddit search error for r/{sub}: {e}")
+
+    for i, item in enumerate(all_items):
+        item["id"] = f"RS{i+1}"
 
     return all_items
 
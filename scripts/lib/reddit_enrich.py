@@ -1,10 +1,54 @@
 """Reddit thread enrichment with real engagement metrics."""
 
+import os
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from . import http, dates
+from .deadline import Deadline
+
+# Reddit's bulk lookup endpoint accepts up to 100 fullnames per call
+REDDIT_INFO_URL = "https://www.reddit.com/api/info.json"
+INFO_BATCH_SIZE = 100
+
+# Full thread fetches (for comments) per depth. Every thread still gets
+# engagement via the bulk endpoint; only these get comment insights.
+COMMENT_THREADS = {
+    "quick": 10,
+    "default": 15,
+    "deep": 25,
+}
+
+# Thread fetch parameters: only top-level comments, best first, and only
+# as many as we might keep. Reddit otherwise returns the whole tree.
+THREAD_PARAMS = {
+    "sort": "top",
+    "depth": 1,
+    "limit": 25,
+}
+TOP_COMMENTS = 10
+
+# Comment fetch budget for Phase 2 supplemental threads, which already
+# carry engagement from the subreddit search listing
+SUPPLEMENTAL_COMMENT_THREADS = {
+    "default": 3,
+    "deep": 5,
+}
+
+# Worker threads for parallel enrichment. reddit.com requests are still
+# paced by the shared per-host limiter in http.py.
+DEFAULT_ENRICH_CONCURRENCY = 8
+
+
+def get_enrich_concurrency() -> int:
+    """Get enrichment concurrency from LAST30DAYS_ENRICH_CONCURRENCY."""
+    raw = os.environ.get("LAST30DAYS_ENRICH_CONCURRENCY", "")
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return DEFAULT_ENRICH_CONCURRENCY
 
 
 def extract_reddit_path(url: str) -> Optional[str]:
@@ -25,12 +69,98 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
-def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+def extract_thread_id(url: str) -> Optional[str]:
+    """Extract the base36 thread ID from a Reddit thread URL.
+
+    Args:
+        url: Reddit URL (e.g., https://www.reddit.com/r/sub/comments/abc123/title/)
+
+    Returns:
+        Thread ID (e.g., "abc123") or None
+    """
+    path = extract_reddit_path(url)
+    if not path:
+        return None
+    match = re.search(r'/comments/([a-z0-9]+)', path, re.IGNORECASE)
+    return match.group(1).lower() if match else None
+
+
+def parse_submission(sub_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the submission fields we use from a t3 data dict.
+
+    Works for thread JSON, /api/info.json and subreddit search listings,
+    which all carry the same t3 payload.
+    """
+    return {
+        "score": sub_data.get("score"),
+        "num_comments": sub_data.get("num_comments"),
+        "upvote_ratio": sub_data.get("upvote_ratio"),
+        "created_utc": sub_data.get("created_utc"),
+        "permalink": sub_data.get("permalink"),
+        "title": sub_data.get("title"),
+        "selftext": (sub_data.get("selftext") or "")[:500],  # Truncate
+    }
+
+
+def fetch_thread_metadata(
+    urls: List[str],
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch submission metadata for many threads via /api/info.json.
+
+    Batches up to INFO_BATCH_SIZE thread IDs per request, so engagement for
+    a 100-thread run costs one request instead of 100 thread downloads.
+    A failed batch is skipped; its threads are simply missing from the result.
+
+    Args:
+        urls: Reddit thread URLs
+        deadline: Run-wide time budget
+
+    Returns:
+        Dict mapping thread ID to submission dict (same shape as
+        parse_thread_data()["submission"])
+    """
+    ids = []
+    for url in urls:
+        thread_id = extract_thread_id(url)
+        if thread_id and thread_id not in ids:
+            ids.append(thread_id)
+
+    result = {}
+    headers = {
+        "User-Agent": http.USER_AGENT,
+        "Accept": "application/json",
+    }
+    for start in range(0, len(ids), INFO_BATCH_SIZE):
+        batch = ids[start:start + INFO_BATCH_SIZE]
+        fullnames = ",".join(f"t3_{thread_id}" for thread_id in batch)
+        try:
+            data = http.get(f"{REDDIT_INFO_URL}?id={fullnames}&raw_json=1", headers=headers, deadline=deadline)
+        except http.HTTPError:
+            continue
+
+        for child in data.get("data", {}).get("children", []):
+            if child.get("kind") != "t3":
+                continue
+            sub_data = child.get("data", {})
+            thread_id = str(sub_data.get("id", "")).lower()
+            if thread_id:
+                result[thread_id] = parse_submission(sub_data)
+
+    return result
+
+
+def fetch_thread_data(
+    url: str,
+    mock_data: Optional[Dict] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[Dict[str, Any]]:
     """Fetch Reddit thread JSON data.
 
     Args:
         url: Reddit thread URL
         mock_data: Mock data for testing
+        deadline: Run-wide time budget
 
     Returns:
         Thread data dict or None on failure
@@ -43,17 +173,20 @@ def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Di
         return None
 
     try:
-        data = http.get_reddit_json(path)
+        data = http.get_reddit_json(path, params=THREAD_PARAMS, deadline=deadline)
         return data
     except http.HTTPError:
         return None
 
 
-def parse_thread_data(data: Any) -> Dict[str, Any]:
+def parse_thread_data(data: Any, max_comments: Optional[int] = None) -> Dict[str, Any]:
     """Parse Reddit thread JSON into structured data.
 
+    Only top-level comments are read; reply subtrees are never walked.
+
     Args:
         data: Raw Reddit JSON response
+        max_comments: Stop after this many usable comments (None = all)
 
     Returns:
         Dict with submission and comments data
@@ -71,16 +204,7 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
     if isinstance(submission_listing, dict):
         children = submission_listing.get("data", {}).get("children", [])
         if children:
-            sub_data = children[0].get("data", {})
-            result["submission"] = {
-                "score": sub_data.get("score"),
-                "num_comments": sub_data.get("num_comments"),
-                "upvote_ratio": sub_data.get("upvote_ratio"),
-                "created_utc": sub_data.get("created_utc"),
-                "permalink": sub_data.get("permalink"),
-                "title": sub_data.get("title"),
-                "selftext": sub_data.get("selftext", "")[:500],  # Truncate
-            }
+            result["submission"] = parse_submission(children[0].get("data", {}))
 
     # Second element is comments listing
     if len(data) >= 2:
@@ -88,6 +212,8 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
         if isinstance(comments_listing, dict):
             children = comments_listing.get("data", {}).get("children", [])
             for child in children:
+                if max_comments is not None and len(result["comments"]) >= max_comments:
+                    break
                 if child.get("kind") != "t1":  # t1 = comment
                     continue
                 c_data = child.get("data", {})
@@ -106,7 +232,7 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
     return result
 
 
-def get_top_comments(comments: List[Dict], limit: int = 10) -> List[Dict[str, Any]]:
+def get_top_comments(comments: List[Dict], limit: int = TOP_COMMENTS) -> List[Dict[str, Any]]:
     """Get top comments sorted by score.
 
     Args:
@@ -178,12 +304,14 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
 def enrich_reddit_item(
     item: Dict[str, Any],
     mock_thread_data: Optional[Dict] = None,
+    deadline: Optional[Deadline] = None,
 ) -> Dict[str, Any]:
     """Enrich a Reddit item with real engagement data.
 
     Args:
         item: Reddit item dict
         mock_thread_data: Mock data for testing
+        deadline: Run-wide time budget
 
     Returns:
         Enriched item dict
@@ -191,28 +319,54 @@ def enrich_reddit_item(
     url = item.get("url", "")
 
     # Fetch thread data
-    thread_data = fetch_thread_data(url, mock_thread_data)
+    thread_data = fetch_thread_data(url, mock_thread_data, deadline=deadline)
     if not thread_data:
         return item
 
-    parsed = parse_thread_data(thread_data)
-    submission = parsed.get("submission")
-    comments = parsed.get("comments", [])
+    parsed = parse_thread_data(thread_data, max_comments=THREAD_PARAMS["limit"])
+    apply_submission(item, parsed.get("submission"))
+    apply_comments(item, parsed.get("comments", []))
 
-    # Update engagement metrics
-    if submission:
-        item["engagement"] = {
-            "score": submission.get("score"),
-            "num_comments": submission.get("num_comments"),
-            "upvote_ratio": submission.get("upvote_ratio"),
-        }
+    return item
+
+
+def apply_submission(
+    item: Dict[str, Any],
+    submission: Optional[Dict[str, Any]],
+    source: str = "thread",
+) -> Dict[str, Any]:
+    """Update an item's engagement and date from submission data.
+
+    Args:
+        item: Reddit item dict
+        submission: Submission dict from parse_submission()
+        source: Where the data came from ('thread', 'info' or 'listing'),
+            recorded as item["metadata_source"]
 
-        # Update date from actual data
-        created_utc = submission.get("created_utc")
-        if created_utc:
-            item["date"] = dates.timestamp_to_date(created_utc)
+    Returns:
+        Updated item dict
+    """
+    if not submission:
+        return item
+
+    item["metadata_source"] = source
 
-    # Get top comments
+    item["engagement"] = {
+        "score": submission.get("score"),
+        "num_comments": submission.get("num_comments"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+    }
+
+    # Update date from actual data
+    created_utc = submission.get("created_utc")
+    if created_utc:
+        item["date"] = dates.timestamp_to_date(created_utc)
+
+    return item
+
+
+def apply_comments(item: Dict[str, Any], comments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Attach top comments and comment insights to an item."""
     top_comments = get_top_comments(comments)
     item["top_comments"] = []
     for c in top_comments:
@@ -230,3 +384,112 @@ def enrich_reddit_item(
     item["comment_insights"] = extract_comment_insights(top_comments)
 
     return item
+
+
+def _comment_priority(item: Dict[str, Any]) -> tuple:
+    """Sort key ranking which threads deserve a full comment fetch."""
+    eng = item.get("engagement") or {}
+    return (-(item.get("relevance") or 0), -(eng.get("score") or 0))
+
+
+def enrich_reddit_items(
+    items: List[Dict[str, Any]],
+    mock_thread_data: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    comment_threads: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[Dict[str, Any]]:
+    """Enrich Reddit items with engagement and comments.
+
+    Stage 1 gets engagement for every item from one bulk /api/info.json
+    lookup; items that already carry metadata (item["metadata_source"],
+    e.g. from a subreddit search listing) are skipped. Stage 2 fetches
+    full threads for comments on a bounded worker pool, limited to the top
+    `comment_threads` items plus any the bulk lookup missed. A failure on
+    one item leaves it unenriched instead of aborting the batch.
+
+    Args:
+        items: Reddit item dicts
+        mock_thread_data: Mock data for testing (used for every item,
+            skips the bulk lookup)
+        max_workers: Pool size (default: get_enrich_concurrency())
+        on_progress: Called as on_progress(done, total) as items finish
+        on_error: Called as on_error(item, exc) when an item fails
+        comment_threads: Max items to fetch comments for (None = all,
+            0 = engagement only)
+        deadline: Run-wide time budget; thread fetches still queued when
+            it runs out are cancelled, their items returned as-is and the
+            deadline marked cut short
+
+    Returns:
+        Enriched items, in the same order as the input
+    """
+    if not items:
+        return []
+
+    total = len(items)
+    results = list(items)
+    deadline = deadline or Deadline()
+
+    # Stage 1: bulk engagement lookup
+    metadata = {}
+    if mock_thread_data is None and not deadline.expired():
+        metadata = fetch_thread_metadata(
+            [item.get("url", "") for item in items if not item.get("metadata_source")],
+            deadline=deadline,
+        )
+
+    with_meta = []
+    without_meta = []
+    for i, item in enumerate(items):
+        if item.get("metadata_source"):
+            with_meta.append(i)
+            continue
+        submission = metadata.get(extract_thread_id(item.get("url", "")) or "")
+        if submission:
+            apply_submission(item, submission, source="info")
+            with_meta.append(i)
+        else:
+            without_meta.append(i)
+
+    # Stage 2: full thread fetches for comments (and bulk lookup misses)
+    if comment_threads is not None:
+        with_meta = sorted(with_meta, key=lambda i: _comment_priority(items[i]))[:comment_threads]
+    to_fetch = sorted(without_meta + with_meta)
+
+    done = total - len(to_fetch)
+    if done and on_progress:
+        on_progress(done, total)
+    if not to_fetch:
+        return results
+    if deadline.expired():
+        deadline.mark_cut_short()
+        return results
+
+    workers = min(max_workers or get_enrich_concurrency(), len(to_fetch))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {
+        executor.submit(enrich_reddit_item, items[i], mock_thread_data, deadline): i
+        for i in to_fetch
+    }
+    try:
+        for future in as_completed(futures, timeout=deadline.remaining()):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(items[i], e)
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+    except FuturesTimeoutError:
+        # Budget exhausted - unfinished items stay as they are
+        deadline.mark_cut_short()
+    finally:
+        # In-flight fetches have deadline-capped timeouts, so this is short
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return results
@@ -1,12 +1,12 @@
 """Output rendering for last30days skill."""
 
-import json
+import heapq
 import os
 import tempfile
 from pathlib import Path
 from typing import List, Optional
 
-from . import schema
+from . import schema, serialize
 
 OUTPUT_DIR = Path.home() / ".local" / "share" / "last30days" / "out"
 
@@ -89,6 +89,11 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
         lines.append(f"**⚡ CACHED RESULTS** ({age_str}) - use `--refresh` for fresh data")
         lines.append("")
 
+    # Budget indicator
+    if report.truncated:
+        lines.append(f"**⏱️ PARTIAL RESULTS** - time budget ran out: {'; '.join(report.truncated)}")
+        lines.append("")
+
     lines.append(f"**Date Range:** {report.range_from} to {report.range_to}")
     lines.append(f"**Mode:** {report.mode}")
     if report.openai_model_used:
@@ -116,9 +121,12 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
         lines.append("")
         lines.append("*No relevant Reddit threads found for this topic.*")
         lines.append("")
-    elif report.reddit:
-        lines.append("### Reddit Threads")
-        lines.append("")
+    # A degraded run (e.g. enrichment cut off by the circuit breaker) has
+    # both an error and items: show the items under the error
+    if report.reddit:
+        if not report.reddit_error:
+            lines.append("### Reddit Threads")
+            lines.append("")
         for item in report.reddit[:limit]:
             eng_str = ""
             if item.engagement:
@@ -232,8 +240,8 @@ def render_context_snippet(report: schema.Report) -> str:
     for item in report.web[:5]:
         all_items.append((item.score, "Web", item.title[:50] + "...", item.url))
 
-    all_items.sort(key=lambda x: -x[0])
-    for score, source, text, url in all_items[:7]:
+    # Only the head is shown; ties keep source order, as a stable sort would
+    for _item_score, source, text, url in heapq.nlargest(7, all_items, key=lambda x: x[0]):
         lines.append(f"- [{source}] {text}")
 
     lines.append("")
@@ -262,6 +270,8 @@ def render_full_report(report: schema.Report) -> str:
     lines.append(f"**Generated:** {report.generated_at}")
     lines.append(f"**Date Range:** {report.range_from} to {report.range_to}")
     lines.append(f"**Mode:** {report.mode}")
+    if report.truncated:
+        lines.append(f"**Partial:** time budget ran out ({'; '.join(report.truncated)})")
     lines.append("")
 
     # Models
@@ -353,6 +363,7 @@ def write_outputs(
     raw_openai: Optional[dict] = None,
     raw_xai: Optional[dict] = None,
     raw_reddit_enriched: Optional[list] = None,
+    report_dict: Optional[dict] = None,
 ):
     """Write all output files.
 
@@ -361,12 +372,12 @@ def write_outputs(
         raw_openai: Raw OpenAI API response
         raw_xai: Raw xAI API response
         raw_reddit_enriched: Raw enriched Reddit thread data
+        report_dict: report.to_dict(), if the caller already built it
     """
     ensure_output_dir()
 
-    # report.json
-    with open(OUTPUT_DIR / "report.json", 'w') as f:
-        json.dump(report.to_dict(), f, indent=2)
+    # report.json (machine output: compact)
+    serialize.dump(report_dict if report_dict is not None else report.to_dict(), OUTPUT_DIR / "report.json")
 
     # report.md
     with open(OUTPUT_DIR / "report.md", 'w') as f:
@@ -376,18 +387,15 @@ def write_outputs(
     with open(OUTPUT_DIR / "last30days.context.md", 'w') as f:
         f.write(render_context_snippet(report))
 
-    # Raw responses
+    # Raw responses (kept readable for debugging)
     if raw_openai:
-        with open(OUTPUT_DIR / "raw_openai.json", 'w') as f:
-            json.dump(raw_openai, f, indent=2)
+        serialize.dump(raw_openai, OUTPUT_DIR / "raw_openai.json", pretty=True)
 
     if raw_xai:
-        with open(OUTPUT_DIR / "raw_xai.json", 'w') as f:
-            json.dump(raw_xai, f, indent=2)
+        serialize.dump(raw_xai, OUTPUT_DIR / "raw_xai.json", pretty=True)
 
     if raw_reddit_enriched:
-        with open(OUTPUT_DIR / "raw_reddit_threads_enriched.json", 'w') as f:
-            json.dump(raw_reddit_enriched, f, indent=2)
+        serialize.dump(raw_reddit_enriched, OUTPUT_DIR / "raw_reddit_threads_enriched.json", pretty=True)
 
 
 def get_context_path() -> str:
@@ -1,11 +1,17 @@
 """Data schemas for last30days skill."""
 
+import sys
 from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
+# Per-item classes are slotted where dataclasses support it (3.10+): no
+# per-instance __dict__, which is most of an item's footprint when histories
+# hold hundreds of thousands of them. benchmarks/bench_schema.py measures it.
+_ITEM_DATACLASS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_ITEM_DATACLASS)
 class Engagement:
     """Engagement metrics."""
     # Reddit fields
@@ -38,7 +44,7 @@ class Engagement:
         return d if d else None
 
 
-@dataclass
+@dataclass(**_ITEM_DATACLASS)
 class Comment:
     """Reddit comment."""
     score: int
@@ -57,7 +63,7 @@ class Comment:
         }
 
 
-@dataclass
+@dataclass(**_ITEM_DATACLASS)
 class SubScores:
     """Component scores."""
     relevance: int = 0
@@ -72,7 +78,7 @@ class SubScores:
         }
 
 
-@dataclass
+@dataclass(**_ITEM_DATACLASS)
 class RedditItem:
     """Normalized Reddit item."""
     id: str
@@ -107,7 +113,7 @@ class RedditItem:
         }
 
 
-@dataclass
+@dataclass(**_ITEM_DATACLASS)
 class XItem:
     """Normalized X item."""
     id: str
@@ -138,7 +144,7 @@ class XItem:
         }
 
 
-@dataclass
+@dataclass(**_ITEM_DATACLASS)
 class WebSearchItem:
     """Normalized web search item (no engagement metrics)."""
     id: str
@@ -192,6 +198,8 @@ class Report:
     # Cache info
     from_cache: bool = False
     cache_age_hours: Optional[float] = None
+    # Steps cut short by --budget
+    truncated: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         d = {
@@ -221,6 +229,8 @@ class Report:
             d['from_cache'] = self.from_cache
         if self.cache_age_hours is not None:
             d['cache_age_hours'] = self.cache_age_hours
+        if self.truncated:
+            d['truncated'] = self.truncated
         return d
 
     @classmethod
@@ -313,6 +323,7 @@ class Report:
             web_error=data.get('web_error'),
             from_cache=data.get('from_cache', False),
             cache_age_hours=data.get('cache_age_hours'),
+            truncated=data.get('truncated', []),
         )
 
 
@@ -1,7 +1,15 @@
 """Popularity-aware scoring for last30days skill."""
 
+import bisect
 import math
-from typing import List, Optional, Union
+import os
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from . import dates, schema
 
@@ -23,6 +31,62 @@ WEBSEARCH_NO_DATE_PENALTY = 20  # Heavy penalty for no date signals (low confide
 DEFAULT_ENGAGEMENT = 35
 UNKNOWN_ENGAGEMENT_PENALTY = 3
 
+# Per-source weight tables for the scoring engine. confidence maps
+# date_confidence to the points added (negative = deducted).
+SOURCE_WEIGHTS: Dict[str, Dict[str, Any]] = {
+    "reddit": {
+        "relevance": WEIGHT_RELEVANCE,
+        "recency": WEIGHT_RECENCY,
+        "engagement": WEIGHT_ENGAGEMENT,
+        "source_penalty": 0,
+        "unknown_engagement_penalty": UNKNOWN_ENGAGEMENT_PENALTY,
+        "confidence": {"low": -5, "med": -2},
+    },
+    "x": {
+        "relevance": WEIGHT_RELEVANCE,
+        "recency": WEIGHT_RECENCY,
+        "engagement": WEIGHT_ENGAGEMENT,
+        "source_penalty": 0,
+        "unknown_engagement_penalty": UNKNOWN_ENGAGEMENT_PENALTY,
+        "confidence": {"low": -5, "med": -2},
+    },
+    "web": {
+        "relevance": WEBSEARCH_WEIGHT_RELEVANCE,
+        "recency": WEBSEARCH_WEIGHT_RECENCY,
+        "engagement": 0,
+        "source_penalty": WEBSEARCH_SOURCE_PENALTY,
+        "unknown_engagement_penalty": 0,
+        "confidence": {"high": WEBSEARCH_VERIFIED_BONUS, "low": -WEBSEARCH_NO_DATE_PENALTY},
+    },
+}
+
+# Raw engagement formula per source, as column terms for the NumPy engine:
+# (Engagement field, weight, transform) summed in order, plus the fields
+# that can't all be missing. 'log1p' is log1p_safe; 'ratio' is
+# (value or 0.5) * 10. Mirrors compute_reddit/x_engagement_raw.
+ENGAGEMENT_TERMS: Dict[str, Tuple[Tuple[str, float, str], ...]] = {
+    "reddit": (("score", 0.55, "log1p"), ("num_comments", 0.40, "log1p"), ("upvote_ratio", 0.05, "ratio")),
+    "x": (("likes", 0.55, "log1p"), ("reposts", 0.25, "log1p"), ("replies", 0.15, "log1p"), ("quotes", 0.05, "log1p")),
+}
+ENGAGEMENT_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    "reddit": ("score", "num_comments"),
+    "x": ("likes", "reposts"),
+}
+
+# Scoring engines: 'python' loops over columns in pure Python, 'numpy'
+# vectorizes them (bit-identical scores). 'auto' uses numpy when it's
+# installed and there are at least NUMPY_MIN_ITEMS items; below that the
+# array setup costs more than it saves.
+ENGINES = ("auto", "python", "numpy")
+NUMPY_MIN_ITEMS = 1000
+
+# Tie-break priority when scores and dates match (Reddit > X > WebSearch)
+SOURCE_PRIORITY = {
+    schema.RedditItem: 0,
+    schema.XItem: 1,
+    schema.WebSearchItem: 2,
+}
+
 
 def log1p_safe(x: Optional[int]) -> float:
     """Safe log1p that handles None and negative values."""
@@ -68,6 +132,13 @@ def compute_x_engagement_raw(engagement: Optional[schema.Engagement]) -> Optiona
     return 0.55 * likes + 0.25 * reposts + 0.15 * replies + 0.05 * quotes
 
 
+# Per-item raw engagement for the Python engine
+_ENGAGEMENT_RAW = {
+    "reddit": compute_reddit_engagement_raw,
+    "x": compute_x_engagement_raw,
+}
+
+
 def normalize_to_100(values: List[float], default: float = 50) -> List[float]:
     """Normalize a list of values to 0-100 scale.
 
@@ -101,127 +172,243 @@ def normalize_to_100(values: List[float], default: float = 50) -> List[float]:
     return result
 
 
-def score_reddit_items(items: List[schema.RedditItem]) -> List[schema.RedditItem]:
-    """Compute scores for Reddit items.
-
-    Args:
-        items: List of Reddit items
+def get_score_engine() -> str:
+    """Get the default engine from LAST30DAYS_SCORE_ENGINE (default: auto).
 
-    Returns:
-        Items with updated scores
+    Asking for numpy without NumPy installed falls back to python.
     """
-    if not items:
-        return items
-
-    # Compute raw engagement scores
-    eng_raw = [compute_reddit_engagement_raw(item.engagement) for item in items]
+    engine = os.environ.get("LAST30DAYS_SCORE_ENGINE", "auto").lower()
+    if engine == "numpy" and np is None:
+        return "python"
+    return engine if engine in ENGINES else "auto"
 
-    # Normalize engagement to 0-100
-    eng_normalized = normalize_to_100(eng_raw)
 
-    for i, item in enumerate(items):
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
+def _engagement_bounds(eng_raw: List[Optional[float]]) -> Optional[Tuple[float, float]]:
+    """(min, max) of the known raw engagement values, None if all unknown."""
+    valid = [value for value in eng_raw if value is not None]
+    if not valid:
+        return None
+    return min(valid), max(valid)
 
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
 
-        # Engagement subscore
-        if eng_normalized[i] is not None:
-            eng_score = int(eng_normalized[i])
-        else:
-            eng_score = DEFAULT_ENGAGEMENT
-
-        # Store subscores
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=eng_score,
-        )
-
-        # Compute overall score
-        overall = (
-            WEIGHT_RELEVANCE * rel_score +
-            WEIGHT_RECENCY * rec_score +
-            WEIGHT_ENGAGEMENT * eng_score
-        )
-
-        # Apply penalty for unknown engagement
-        if eng_raw[i] is None:
-            overall -= UNKNOWN_ENGAGEMENT_PENALTY
-
-        # Apply penalty for low date confidence
-        if item.date_confidence == "low":
-            overall -= 5
-        elif item.date_confidence == "med":
-            overall -= 2
+def _engagement_scores(
+    eng_raw: List[Optional[float]],
+    bounds: Optional[Tuple[float, float]],
+) -> List[int]:
+    """Engagement subscores (0-100) from raw values scaled to bounds.
 
+    Matches normalize_to_100 over a batch whose bounds these are, with
+    DEFAULT_ENGAGEMENT for unknown values.
+    """
+    if bounds is None:
+        return [50] * len(eng_raw)  # normalize_to_100's default for an all-None batch
+    min_val, max_val = bounds
+    range_val = max_val - min_val
+    if range_val == 0:
+        return [50] * len(eng_raw)
+    return [
+        int(((value - min_val) / range_val) * 100) if value is not None else DEFAULT_ENGAGEMENT
+        for value in eng_raw
+    ]
+
+
+def _score_python(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    eng_raw: List[Optional[float]],
+    eng_scores: List[int],
+    recency_score,
+    weights: Dict[str, Any],
+) -> None:
+    """Pure-Python engine: one fused pass per item, scoring in place."""
+    w_rel, w_rec, w_eng = weights["relevance"], weights["recency"], weights["engagement"]
+    source_penalty = weights["source_penalty"]
+    unknown_penalty = weights["unknown_engagement_penalty"]
+    conf_adjust = weights["confidence"]
+    SubScores = schema.SubScores
+
+    for item, raw, eng in zip(items, eng_raw, eng_scores):
+        rel = int(item.relevance * 100)
+        rec = recency_score(item.date)
+        overall = w_rel * rel + w_rec * rec + w_eng * eng
+        overall -= source_penalty
+        if raw is None:
+            overall -= unknown_penalty
+        overall += conf_adjust.get(item.date_confidence, 0)
+
+        item.subs = SubScores(relevance=rel, recency=rec, engagement=eng)
         item.score = max(0, min(100, int(overall)))
 
-    return items
-
 
-def score_x_items(items: List[schema.XItem]) -> List[schema.XItem]:
-    """Compute scores for X items.
+def _engagement_column(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    source: str,
+) -> List[Optional[float]]:
+    """Raw engagement per item; 0.0 (known, never penalized) for sources without it."""
+    if source not in ENGAGEMENT_TERMS:
+        return [0.0] * len(items)
+    raw_fn = _ENGAGEMENT_RAW[source]
+    return [raw_fn(item.engagement) for item in items]
+
+
+def _score_numpy(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    source: str,
+    recency_score,
+    weights: Dict[str, Any],
+) -> None:
+    """NumPy engine: the Python engine's float operations, in the same order,
+    on whole columns."""
+    n = len(items)
+    recency = [recency_score(item.date) for item in items]
+    rel_scores = np.trunc(np.array(list(map(attrgetter("relevance"), items)), dtype=np.float64) * 100)
+
+    if source in ENGAGEMENT_TERMS:
+        engagements = list(map(attrgetter("engagement"), items))
+        has_engagement = np.array([eng is not None for eng in engagements])
+        # An all-None stand-in lets each column be one C-level attrgetter map
+        empty = schema.Engagement()
+        engagements = [eng if eng is not None else empty for eng in engagements]
+        columns = {
+            field: np.array(list(map(attrgetter(field), engagements)), dtype=np.float64)
+            for field, _, _ in ENGAGEMENT_TERMS[source]
+        }
+
+        unknown = ~has_engagement
+        required_missing = np.ones(n, dtype=bool)
+        for field in ENGAGEMENT_REQUIRED[source]:
+            required_missing &= np.isnan(columns[field])
+        unknown |= required_missing
+
+        raw = np.zeros(n, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            for field, weight, transform in ENGAGEMENT_TERMS[source]:
+                values = columns[field]
+                if transform == "log1p":
+                    missing = np.isnan(values) | (values < 0)
+                    term = np.where(missing, 0.0, np.log1p(np.where(missing, 0.0, values)))
+                else:
+                    term = np.where(np.isnan(values) | (values == 0), 0.5, values) * 10
+                raw += weight * term
+
+        # normalize_to_100 semantics, including its 50-for-everything cases
+        if unknown.all():
+            eng_scores = np.full(n, 50.0)
+        else:
+            valid = raw[~unknown]
+            min_val, max_val = valid.min(), valid.max()
+            range_val = max_val - min_val
+            if range_val == 0:
+                eng_scores = np.full(n, 50.0)
+            else:
+                eng_scores = np.where(
+                    unknown,
+                    float(DEFAULT_ENGAGEMENT),
+                    np.trunc(((raw - min_val) / range_val) * 100),
+                )
+    else:
+        eng_scores = np.zeros(n, dtype=np.float64)
+        unknown = np.zeros(n, dtype=bool)
+
+    overall = (
+        weights["relevance"] * rel_scores +
+        weights["recency"] * np.array(recency, dtype=np.float64) +
+        weights["engagement"] * eng_scores
+    )
+    overall -= weights["source_penalty"]
+    overall = np.where(unknown, overall - weights["unknown_engagement_penalty"], overall)
+    conf_adjust = weights["confidence"]
+    overall += np.array([conf_adjust.get(item.date_confidence, 0) for item in items], dtype=np.float64)
+    scores = np.clip(np.trunc(overall), 0, 100)
+
+    SubScores = schema.SubScores
+    for item, rel, rec, eng, overall in zip(
+        items,
+        rel_scores.astype(np.int64).tolist(),
+        recency,
+        eng_scores.astype(np.int64).tolist(),
+        scores.astype(np.int64).tolist(),
+    ):
+        item.subs = SubScores(relevance=rel, recency=rec, engagement=eng)
+        item.score = overall
+
+
+def score_items(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    source: str,
+    date_ctx: Optional[dates.DateContext] = None,
+    engine: str = None,
+) -> List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+    """Score items of one source in place.
 
     Args:
-        items: List of X items
+        items: Items to score
+        source: 'reddit', 'x' or 'web' (selects SOURCE_WEIGHTS/ENGAGEMENT_TERMS)
+        date_ctx: Shared per-run DateContext (fixes "today" for recency)
+        engine: 'python', 'numpy' or 'auto' (default: get_score_engine())
 
     Returns:
-        Items with updated scores
+        Items with updated subs and score
     """
+    engine = engine or get_score_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown score engine: {engine}")
+    if engine == "numpy" and np is None:
+        raise ValueError("Score engine 'numpy' requires NumPy")
+    if engine == "auto":
+        engine = "numpy" if np is not None and len(items) >= NUMPY_MIN_ITEMS else "python"
+
     if not items:
         return items
 
-    # Compute raw engagement scores
-    eng_raw = [compute_x_engagement_raw(item.engagement) for item in items]
+    recency_score = date_ctx.recency_score if date_ctx else dates.recency_score
+    if engine == "numpy":
+        _score_numpy(items, source, recency_score, SOURCE_WEIGHTS[source])
+    else:
+        eng_raw = _engagement_column(items, source)
+        if source in ENGAGEMENT_TERMS:
+            eng_scores = _engagement_scores(eng_raw, _engagement_bounds(eng_raw))
+        else:
+            eng_scores = [0] * len(items)
+        _score_python(items, eng_raw, eng_scores, recency_score, SOURCE_WEIGHTS[source])
+    return items
+
 
-    # Normalize engagement to 0-100
-    eng_normalized = normalize_to_100(eng_raw)
+def score_reddit_items(
+    items: List[schema.RedditItem],
+    date_ctx: Optional[dates.DateContext] = None,
+) -> List[schema.RedditItem]:
+    """Compute scores for Reddit items.
 
-    for i, item in enumerate(items):
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
+    Args:
+        items: List of Reddit items
+        date_ctx: Shared per-run DateContext (fixes "today" for recency)
 
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
+    Returns:
+        Items with updated scores
+    """
+    return score_items(items, "reddit", date_ctx)
 
-        # Engagement subscore
-        if eng_normalized[i] is not None:
-            eng_score = int(eng_normalized[i])
-        else:
-            eng_score = DEFAULT_ENGAGEMENT
-
-        # Store subscores
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=eng_score,
-        )
-
-        # Compute overall score
-        overall = (
-            WEIGHT_RELEVANCE * rel_score +
-            WEIGHT_RECENCY * rec_score +
-            WEIGHT_ENGAGEMENT * eng_score
-        )
-
-        # Apply penalty for unknown engagement
-        if eng_raw[i] is None:
-            overall -= UNKNOWN_ENGAGEMENT_PENALTY
-
-        # Apply penalty for low date confidence
-        if item.date_confidence == "low":
-            overall -= 5
-        elif item.date_confidence == "med":
-            overall -= 2
 
-        item.score = max(0, min(100, int(overall)))
+def score_x_items(
+    items: List[schema.XItem],
+    date_ctx: Optional[dates.DateContext] = None,
+) -> List[schema.XItem]:
+    """Compute scores for X items.
 
-    return items
+    Args:
+        items: List of X items
+        date_ctx: Shared per-run DateContext (fixes "today" for recency)
+
+    Returns:
+        Items with updated scores
+    """
+    return score_items(items, "x", date_ctx)
 
 
-def score_websearch_items(items: List[schema.WebSearchItem]) -> List[schema.WebSearchItem]:
+def score_websearch_items(
+    items: List[schema.WebSearchItem],
+    date_ctx: Optional[dates.DateContext] = None,
+) -> List[schema.WebSearchItem]:
     """Compute scores for WebSearch items WITHOUT engagement metrics.
 
     Uses reweighted formula: 55% relevance + 45% recency - 15pt source penalty.
@@ -234,48 +421,23 @@ def score_websearch_items(items: List[schema.WebSearchItem]) -> List[schema.WebS
 
     Args:
         items: List of WebSearch items
+        date_ctx: Shared per-run DateContext (fixes "today" for recency)
 
     Returns:
         Items with updated scores
     """
-    if not items:
-        return items
+    return score_items(items, "web", date_ctx)
 
-    for item in items:
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
-
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
-
-        # Store subscores (engagement is 0 for WebSearch - no data)
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=0,  # Explicitly zero - no engagement data available
-        )
-
-        # Compute overall score using WebSearch weights
-        overall = (
-            WEBSEARCH_WEIGHT_RELEVANCE * rel_score +
-            WEBSEARCH_WEIGHT_RECENCY * rec_score
-        )
-
-        # Apply source penalty (WebSearch < Reddit/X for same relevance/recency)
-        overall -= WEBSEARCH_SOURCE_PENALTY
-
-        # Apply date confidence adjustments
-        # High confidence (URL-verified): reward with bonus
-        # Med confidence (snippet-extracted): neutral
-        # Low confidence (no date signals): heavy penalty
-        if item.date_confidence == "high":
-            overall += WEBSEARCH_VERIFIED_BONUS  # Reward verified recent dates
-        elif item.date_confidence == "low":
-            overall -= WEBSEARCH_NO_DATE_PENALTY  # Heavy penalty for unknown
 
-        item.score = max(0, min(100, int(overall)))
-
-    return items
+def sort_key(item: Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]) -> Tuple:
+    """Ranking key: score desc, then date desc, source priority, title/text."""
+    date = item.date or "0000-00-00"
+    return (
+        -item.score,
+        -int(date.replace("-", "")),
+        SOURCE_PRIORITY.get(type(item), 2),
+        getattr(item, "title", "") or getattr(item, "text", ""),
+    )
 
 
 def sort_items(items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]) -> List:
@@ -287,25 +449,83 @@ def sort_items(items: List[Union[schema.RedditItem, schema.XItem, schema.WebSear
     Returns:
         Sorted items
     """
-    def sort_key(item):
-        # Primary: score descending (negate for descending)
-        score = -item.score
-
-        # Secondary: date descending (recent first)
-        date = item.date or "0000-00-00"
-        date_key = -int(date.replace("-", ""))
+    return sorted(items, key=sort_key)
 
-        # Tertiary: source priority (Reddit > X > WebSearch)
-        if isinstance(item, schema.RedditItem):
-            source_priority = 0
-        elif isinstance(item, schema.XItem):
-            source_priority = 1
-        else:  # WebSearchItem
-            source_priority = 2
 
-        # Quaternary: title/text for stability
-        text = getattr(item, "title", "") or getattr(item, "text", "")
+class IncrementalScorer:
+    """Scores items of one source as they arrive, keeping a live ranking.
 
-        return (score, date_key, source_priority, text)
+    Engagement is normalized against the running min/max of everything
+    added so far. New items are scored against the current bounds and
+    slotted into the ranking; only when a batch moves the bounds does every
+    earlier item get rescored and re-ranked. Scores are provisional until
+    the last add(), and at every point equal score_items() over all items
+    added so far (same date_ctx), with ranked() equal to sort_items().
+    """
 
-    return sorted(items, key=sort_key)
+    def __init__(self, source: str, date_ctx: Optional[dates.DateContext] = None):
+        if source not in SOURCE_WEIGHTS:
+            raise ValueError(f"Unknown source: {source}")
+        self.source = source
+        self.weights = SOURCE_WEIGHTS[source]
+        self.recency_score = date_ctx.recency_score if date_ctx else dates.recency_score
+        self.rescores = 0  # How many add() calls had to rescore everything
+        self._items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]] = []
+        self._eng_raw: List[Optional[float]] = []
+        self._bounds: Optional[Tuple[float, float]] = None
+        self._ranked: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]] = []
+        self._keys: List[Tuple] = []
+
+    def _engagement_scores(self, eng_raw: List[Optional[float]]) -> List[int]:
+        if self.source not in ENGAGEMENT_TERMS:
+            return [0] * len(eng_raw)
+        return _engagement_scores(eng_raw, self._bounds)
+
+    def add(self, items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]) -> bool:
+        """Score a batch of newly arrived items.
+
+        Returns:
+            True if the batch moved the engagement bounds, so every earlier
+            item was rescored and the ranking rebuilt
+        """
+        if not items:
+            return False
+        eng_raw = _engagement_column(items, self.source)
+        self._items.extend(items)
+        self._eng_raw.extend(eng_raw)
+
+        bounds = self._bounds
+        new_bounds = _engagement_bounds(eng_raw)
+        if new_bounds is not None and bounds is not None:
+            new_bounds = (min(bounds[0], new_bounds[0]), max(bounds[1], new_bounds[1]))
+        elif new_bounds is None:
+            new_bounds = bounds
+
+        if new_bounds != bounds:
+            self._bounds = new_bounds
+            self.rescores += 1
+            _score_python(
+                self._items, self._eng_raw, self._engagement_scores(self._eng_raw),
+                self.recency_score, self.weights,
+            )
+            self._ranked = sort_items(self._items)
+            self._keys = [sort_key(item) for item in self._ranked]
+            return True
+
+        _score_python(items, eng_raw, self._engagement_scores(eng_raw), self.recency_score, self.weights)
+        for item in items:
+            key = sort_key(item)
+            # bisect_right keeps equal keys in arrival order, like sorted()
+            pos = bisect.bisect_right(self._keys, key)
+            self._keys.insert(pos, key)
+            self._ranked.insert(pos, item)
+        return False
+
+    def ranked(self, k: Optional[int] = None) -> List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+        """Current ranking (sort_items order), or just its first k items."""
+        if k is None:
+            return list(self._ranked)
+        return self._ranked[:k]
+
+    def __len__(self) -> int:
+        return len(self._items)
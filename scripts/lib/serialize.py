@@ -0,0 +1,102 @@
+"""JSON serialization for last30days skill, with an optional fast backend.
+
+orjson or ujson is used when importable, stdlib json otherwise. Machine
+outputs (cache files, report.json) are written compact; pretty output is
+opt-in. Files are always UTF-8. Decode errors from every backend are
+ValueErrors, so callers catch (ValueError, OSError).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+BACKENDS = ("orjson", "ujson", "json")
+
+
+def _available(backend: str) -> bool:
+    return {"orjson": orjson, "ujson": ujson, "json": json}[backend] is not None
+
+
+def get_backend() -> str:
+    """Backend in use: LAST30DAYS_JSON_BACKEND if set and importable, else
+    the fastest importable one."""
+    backend = os.environ.get("LAST30DAYS_JSON_BACKEND", "").lower()
+    if backend in BACKENDS and _available(backend):
+        return backend
+    return next(b for b in BACKENDS if _available(b))
+
+
+def dumps_bytes(obj: Any, pretty: bool = False, backend: str = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-compatible data
+        pretty: Indent by 2 (default: compact, no whitespace)
+        backend: 'orjson', 'ujson' or 'json' (default: get_backend())
+
+    Returns:
+        Encoded JSON
+    """
+    backend = backend or get_backend()
+    if backend == "orjson":
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits or non-str keys: stdlib copes
+    elif backend == "ujson":
+        try:
+            return ujson.dumps(
+                obj, indent=2 if pretty else 0, ensure_ascii=False, escape_forward_slashes=False,
+            ).encode("utf-8")
+        except (TypeError, OverflowError):
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = False, backend: str = None) -> str:
+    """Serialize obj to a JSON string (see dumps_bytes)."""
+    return dumps_bytes(obj, pretty, backend).decode("utf-8")
+
+
+def loads(data: Union[str, bytes], backend: str = None) -> Any:
+    """Parse JSON text or UTF-8 bytes.
+
+    Raises:
+        ValueError: On malformed JSON, whatever the backend
+    """
+    backend = backend or get_backend()
+    if backend == "orjson":
+        return orjson.loads(data)
+    if backend == "ujson":
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, path: Union[str, Path], pretty: bool = False):
+    """Write obj to path as JSON (compact unless pretty)."""
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(obj, pretty))
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Read JSON from path.
+
+    Raises:
+        ValueError: On malformed JSON
+        OSError: If the file can't be read
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -5,7 +5,7 @@ import sys
 import time
 import threading
 import random
-from typing import Optional
+from typing import Dict, Optional
 
 # Check if we're in a real terminal (not captured by an assistant UI)
 IS_TTY = sys.stderr.isatty()
@@ -174,6 +174,13 @@ For manual setup, see: https://github.com/steipete/bird#authentication
 SPINNER_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 DOTS_FRAMES = ['   ', '.  ', '.. ', '...']
 
+# Return to column 0 and erase the line, however long the spinner text was
+CLEAR_LINE = "\r\033[K"
+
+# Concurrent sources share one spinner line, in this order
+SOURCE_ORDER = ("reddit", "x")
+SOURCE_COLORS = {"reddit": Colors.YELLOW, "x": Colors.CYAN}
+
 
 class Spinner:
     """Animated spinner for long-running operations."""
@@ -185,12 +192,14 @@ class Spinner:
         self.thread: Optional[threading.Thread] = None
         self.frame_idx = 0
         self.shown_static = False
+        self._write_lock = threading.Lock()
 
     def _spin(self):
         while self.running:
             frame = SPINNER_FRAMES[self.frame_idx % len(SPINNER_FRAMES)]
-            sys.stderr.write(f"\r{self.color}{frame}{Colors.RESET} {self.message}  ")
-            sys.stderr.flush()
+            with self._write_lock:
+                sys.stderr.write(f"{CLEAR_LINE}{self.color}{frame}{Colors.RESET} {self.message}")
+                sys.stderr.flush()
             self.frame_idx += 1
             time.sleep(0.08)
 
@@ -214,16 +223,25 @@ class Spinner:
             sys.stderr.write(f"⏳ {message}\n")
             sys.stderr.flush()
 
+    def write_line(self, line: str):
+        """Print a line above the spinner without tearing its frame."""
+        with self._write_lock:
+            if IS_TTY:
+                sys.stderr.write(CLEAR_LINE)
+            sys.stderr.write(f"{line}\n")
+            sys.stderr.flush()
+
     def stop(self, final_message: str = ""):
         self.running = False
         if self.thread:
             self.thread.join(timeout=0.2)
-        if IS_TTY:
-            # Clear the line in real terminal
-            sys.stderr.write("\r" + " " * 80 + "\r")
-        if final_message:
-            sys.stderr.write(f"✓ {final_message}\n")
-        sys.stderr.flush()
+        with self._write_lock:
+            if IS_TTY:
+                # Clear the line in real terminal
+                sys.stderr.write(CLEAR_LINE)
+            if final_message:
+                sys.stderr.write(f"✓ {final_message}\n")
+            sys.stderr.flush()
 
 
 class ProgressDisplay:
@@ -232,6 +250,12 @@ class ProgressDisplay:
     def __init__(self, topic: str, show_banner: bool = True):
         self.topic = topic
         self.spinner: Optional[Spinner] = None
+        # Reddit and X run concurrently on separate threads. They share one
+        # spinner line showing each source's state, so neither overwrites
+        # the other; finished steps print above it.
+        self.source_spinner: Optional[Spinner] = None
+        self.source_status: Dict[str, str] = {}
+        self._source_lock = threading.Lock()
         self.start_time = time.time()
 
         if show_banner:
@@ -246,39 +270,73 @@ class ProgressDisplay:
             sys.stderr.write(f"/last30days · researching: {self.topic}\n")
         sys.stderr.flush()
 
+    def _source_line(self) -> str:
+        return f"  {Colors.DIM}|{Colors.RESET}  ".join(
+            self.source_status[source] for source in SOURCE_ORDER if source in self.source_status
+        )
+
+    def _start_source(self, source: str, message: str):
+        """Show a source's new step on the shared spinner line."""
+        with self._source_lock:
+            self.source_status[source] = message
+            if not IS_TTY:
+                sys.stderr.write(f"⏳ {message}\n")
+                sys.stderr.flush()
+                return
+            color = SOURCE_COLORS[next(s for s in SOURCE_ORDER if s in self.source_status)]
+            if self.source_spinner is None:
+                self.source_spinner = Spinner(self._source_line(), color)
+                self.source_spinner.start()
+            else:
+                self.source_spinner.color = color
+                self.source_spinner.update(self._source_line())
+
+    def _update_source(self, source: str, message: str):
+        with self._source_lock:
+            if source in self.source_status:
+                self.source_status[source] = message
+                if self.source_spinner:
+                    self.source_spinner.update(self._source_line())
+
+    def _end_source(self, source: str, final_message: str):
+        """Print a source's finished step; the spinner stops with the last one."""
+        with self._source_lock:
+            self.source_status.pop(source, None)
+            if self.source_spinner is None:
+                sys.stderr.write(f"✓ {final_message}\n")
+                sys.stderr.flush()
+            elif self.source_status:
+                self.source_spinner.write_line(f"✓ {final_message}")
+                self.source_spinner.color = SOURCE_COLORS[next(s for s in SOURCE_ORDER if s in self.source_status)]
+                self.source_spinner.update(self._source_line())
+            else:
+                self.source_spinner.stop(final_message)
+                self.source_spinner = None
+
     def start_reddit(self):
         msg = random.choice(REDDIT_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} {msg}", Colors.YELLOW)
-        self.spinner.start()
+        self._start_source("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} {msg}")
 
     def end_reddit(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Found {count} threads")
+        self._end_source("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} Found {count} threads")
 
     def start_reddit_enrich(self, current: int, total: int):
-        if self.spinner:
-            self.spinner.stop()
         msg = random.choice(ENRICHING_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}", Colors.YELLOW)
-        self.spinner.start()
+        self._start_source("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
 
     def update_reddit_enrich(self, current: int, total: int):
-        if self.spinner:
-            msg = random.choice(ENRICHING_MESSAGES)
-            self.spinner.update(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
+        msg = random.choice(ENRICHING_MESSAGES)
+        self._update_source("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
 
     def end_reddit_enrich(self):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Enriched with engagement data")
+        self._end_source("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} Enriched with engagement data")
 
     def start_x(self):
         msg = random.choice(X_MESSAGES)
-        self.spinner = Spinner(f"{Colors.CYAN}X{Colors.RESET} {msg}", Colors.CYAN)
-        self.spinner.start()
+        self._start_source("x", f"{Colors.CYAN}X{Colors.RESET} {msg}")
 
     def end_x(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.CYAN}X{Colors.RESET} Found {count} posts")
+        self._end_source("x", f"{Colors.CYAN}X{Colors.RESET} Found {count} posts")
 
     def start_processing(self):
         msg = random.choice(PROCESSING_MESSAGES)
@@ -309,7 +367,12 @@ class ProgressDisplay:
         sys.stderr.flush()
 
     def show_error(self, message: str):
-        sys.stderr.write(f"{Colors.RED}✗ Error:{Colors.RESET} {message}\n")
+        line = f"{Colors.RED}✗ Error:{Colors.RESET} {message}"
+        with self._source_lock:
+            if self.source_spinner:
+                self.source_spinner.write_line(line)
+                return
+        sys.stderr.write(f"{line}\n")
         sys.stderr.flush()
 
     def start_web_only(self):
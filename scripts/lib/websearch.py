@@ -15,7 +15,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from . import schema
+from . import dedupe, schema
 
 
 # Month name mappings for date parsing
@@ -380,7 +380,7 @@ def normalize_websearch_items(
 def dedupe_websearch(items: List[schema.WebSearchItem]) -> List[schema.WebSearchItem]:
     """Remove duplicate WebSearch items.
 
-    Deduplication is based on URL.
+    Deduplication is based on the canonical URL (see dedupe.canonical_url).
 
     Args:
         items: List of WebSearchItem objects
@@ -392,8 +392,7 @@ def dedupe_websearch(items: List[schema.WebSearchItem]) -> List[schema.WebSearch
     result = []
 
     for item in items:
-        # Normalize URL for comparison
-        url_key = item.url.lower().rstrip("/")
+        url_key = dedupe.canonical_url(item.url)
         if url_key not in seen_urls:
             seen_urls.add(url_key)
             result.append(item)
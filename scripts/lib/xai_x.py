@@ -6,6 +6,7 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from . import http
+from .deadline import Deadline
 
 
 def _log_error(msg: str):
@@ -63,6 +64,7 @@ def search_x(
     to_date: str,
     depth: str = "default",
     mock_response: Optional[Dict] = None,
+    deadline: Optional[Deadline] = None,
 ) -> Dict[str, Any]:
     """Search X for relevant posts using xAI API with live search.
 
@@ -74,6 +76,7 @@ def search_x(
         to_date: End date (YYYY-MM-DD)
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        deadline: Run-wide time budget (caps the request timeout)
 
     Returns:
         Raw API response
@@ -111,7 +114,7 @@ def search_x(
         ],
     }
 
-    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout, deadline=deadline)
 
 
 def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
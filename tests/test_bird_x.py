@@ -1,6 +1,9 @@
 """Tests for bird_x module."""
 
+import os
 import sys
+import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -8,7 +11,7 @@ from unittest import mock
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import bird_x
+from lib import bird_x, deadline
 
 
 class TestBirdSearchRetries(unittest.TestCase):
@@ -27,5 +30,95 @@ class TestBirdSearchRetries(unittest.TestCase):
         self.assertEqual(third_query, "codex since:2026-01-01")
 
 
+# Stand-in for the Bird CLI: behaviour is picked by the query's first word
+FAKE_BIRD = """#!/usr/bin/env python3
+import json, sys, time
+word = sys.argv[2].split()[0].replace("from:", "")
+if word == "slow":
+    time.sleep(30)
+if word == "late":
+    time.sleep(0.3)
+hits = word in ("codex", "late")
+print(json.dumps([{"id": word, "permanent_url": "https://x.com/a/status/" + word, "text": word}] if hits else []))
+"""
+
+
+class FakeBirdTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        bird = Path(self.tmp.name) / "bird"
+        bird.write_text(FAKE_BIRD)
+        bird.chmod(0o755)
+        path_patch = mock.patch.dict(os.environ, {"PATH": f"{self.tmp.name}{os.pathsep}{os.environ['PATH']}"})
+        path_patch.start()
+        self.addCleanup(path_patch.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+
+class TestBirdSearchRace(FakeBirdTestCase):
+    def test_most_specific_hit_wins(self):
+        # "late codex" hits but only after the other variants finish
+        winner, response = bird_x._race_bird_searches(
+            ["late codex since:2026-01-01", "none codex since:2026-01-01", "codex since:2026-01-01"], 5, 10,
+        )
+        self.assertEqual(winner, 0)
+        self.assertEqual(response[0]["id"], "late")
+
+    def test_losers_are_killed(self):
+        start = time.monotonic()
+        winner, response = bird_x._race_bird_searches(
+            ["codex since:2026-01-01", "slow since:2026-01-01"], 5, 60,
+        )
+        self.assertEqual(winner, 0)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_no_hits_returns_last_response(self):
+        winner, response = bird_x._race_bird_searches(
+            ["none a since:2026-01-01", "none since:2026-01-01"], 5, 10,
+        )
+        self.assertEqual(winner, 1)
+        self.assertEqual(response, [])
+
+    def test_search_x_races_variants(self):
+        with mock.patch.object(bird_x, "_extract_core_subject", return_value="none codex thing"):
+            response = bird_x.search_x("x", "2026-01-01", "2026-01-31", race=True)
+        self.assertEqual(response[0]["id"], "codex")
+
+
+class TestSearchHandles(FakeBirdTestCase):
+    def test_results_in_handle_order(self):
+        # "late" finishes last but its results still come first
+        items = bird_x.search_handles(["@late", "codex", "none"], "topic", "2026-01-01")
+        self.assertEqual([item["id"] for item in items], ["X1", "X1"])
+        self.assertEqual([item["text"] for item in items], ["late", "codex"])
+
+    def test_runs_concurrently(self):
+        start = time.monotonic()
+        bird_x.search_handles(["late", "late", "late"], "topic", "2026-01-01")
+        self.assertLess(time.monotonic() - start, 0.8)
+
+    def test_shared_timeout_and_error_capture(self):
+        with mock.patch.object(bird_x, "HANDLE_BATCH_TIMEOUT", 0.5), \
+             mock.patch.object(bird_x, "_log") as log_mock:
+            start = time.monotonic()
+            items = bird_x.search_handles(["slow", "codex"], "topic", "2026-01-01")
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual([item["text"] for item in items], ["codex"])
+        log_mock.assert_called_once_with("Handle search timed out for @slow")
+
+    def test_batch_timeout_is_not_a_budget_cut(self):
+        budget = deadline.Deadline()
+        with mock.patch.object(bird_x, "HANDLE_BATCH_TIMEOUT", 0.5), \
+             mock.patch.object(bird_x, "HANDLE_SEARCH_CONCURRENCY", 1), \
+             mock.patch.object(bird_x, "_log") as log_mock:
+            items = bird_x.search_handles(["slow", "codex"], "topic", "2026-01-01", deadline=budget)
+        self.assertEqual(items, [])
+        self.assertEqual(
+            [c.args[0] for c in log_mock.call_args_list],
+            ["Handle search timed out for @slow", "Handle batch timeout, skipping @codex"],
+        )
+        self.assertFalse(budget.cut_short)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -32,6 +32,13 @@ class TestGetCacheKey(unittest.TestCase):
         key = cache.get_cache_key("test", "2026-01-01", "2026-01-31", "both")
         self.assertEqual(len(key), 16)
 
+    def test_different_for_depth_and_x_source(self):
+        base = cache.get_cache_key("topic", "2026-01-01", "2026-01-31", "both")
+        deep = cache.get_cache_key("topic", "2026-01-01", "2026-01-31", "both", depth="deep")
+        bird = cache.get_cache_key("topic", "2026-01-01", "2026-01-31", "both", x_source="bird")
+        self.assertNotEqual(base, deep)
+        self.assertNotEqual(base, bird)
+
 
 class TestCachePath(unittest.TestCase):
     def test_returns_path(self):
@@ -50,6 +57,53 @@ class TestCacheValidity(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestReportCacheRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.orig_cache_dir = cache.CACHE_DIR
+        self.tmp = tempfile.TemporaryDirectory()
+        cache.CACHE_DIR = Path(self.tmp.name)
+
+    def tearDown(self):
+        cache.CACHE_DIR = self.orig_cache_dir
+        self.tmp.cleanup()
+
+    def test_save_then_load_with_age(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": self.tmp.name}):
+            cache.save_cache("abc", {"topic": "t"})
+        data, age = cache.load_cache_with_age("abc")
+        self.assertEqual(data, {"topic": "t"})
+        self.assertIsNotNone(age)
+        self.assertLess(age, 1)
+
+    def test_expired_ttl_is_miss(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": self.tmp.name}):
+            cache.save_cache("abc", {"topic": "t"})
+        data, age = cache.load_cache_with_age("abc", ttl_hours=0)
+        self.assertIsNone(data)
+        self.assertIsNone(age)
+
+
+class TestTopicYield(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.orig_file = cache.TOPIC_YIELD_FILE
+        cache.TOPIC_YIELD_FILE = Path(self.tmp.name) / "topic_yield.json"
+
+    def tearDown(self):
+        cache.TOPIC_YIELD_FILE = self.orig_file
+        self.tmp.cleanup()
+
+    def test_unknown_topic_not_sparse(self):
+        self.assertFalse(cache.is_sparse_topic("anything"))
+
+    def test_records_latest_yield(self):
+        with mock.patch.object(cache, "ensure_cache_dir"):
+            cache.save_topic_yield("Niche  Topic", 2)
+            self.assertTrue(cache.is_sparse_topic("niche topic"))
+            cache.save_topic_yield("niche topic", 12)
+        self.assertFalse(cache.is_sparse_topic("Niche Topic"))
+
+
 class TestModelCache(unittest.TestCase):
     def test_get_cached_model_returns_none_for_missing(self):
         # Clear any existing cache first
@@ -52,6 +52,25 @@ class TestParseDate(unittest.TestCase):
         result = dates.parse_date("")
         self.assertIsNone(result)
 
+    def test_parse_iso_datetime_variants(self):
+        # Naive values are taken as UTC; offsets are converted, not relabeled
+        for value, hour in (
+            ("2026-01-15T10:30:00", 10),
+            ("2026-01-15T10:30:00Z", 10),
+            ("2026-01-15T10:30:00+02:00", 8),
+            ("2026-01-15T10:30:00.123456-0500", 15),
+        ):
+            result = dates.parse_date(value)
+            self.assertEqual((result.day, result.hour, result.minute), (15, hour, 30), value)
+            self.assertEqual(result.tzinfo, timezone.utc)
+
+    def test_parse_offset_can_change_the_day(self):
+        self.assertEqual(dates.parse_date("2026-01-15T23:30:00-03:00").date().isoformat(), "2026-01-16")
+
+    def test_parse_garbage(self):
+        self.assertIsNone(dates.parse_date("2026-13-45"))
+        self.assertIsNone(dates.parse_date("yesterday"))
+
 
 class TestTimestampToDate(unittest.TestCase):
     def test_valid_timestamp(self):
@@ -110,5 +129,37 @@ class TestRecencyScore(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+class TestDateContext(unittest.TestCase):
+    SAMPLES = [
+        None, "", "garbage", "2026-1-5", "2026-02-30",
+        "2025-06-01", "2025-12-01", "2025-12-31", "2026-01-01", "2026-01-02",
+        "2026-01-15", "2026-01-31", "2026-02-01", "2026-03-15",
+    ]
+
+    def test_matches_module_functions(self):
+        today = datetime.now(timezone.utc).date()
+        from_date = (today - timedelta(days=30)).isoformat()
+        ctx = dates.DateContext(from_date, today.isoformat())
+        samples = self.SAMPLES + [(today - timedelta(days=n)).isoformat() for n in range(-3, 40)]
+        for value in samples:
+            self.assertEqual(ctx.recency_score(value), dates.recency_score(value), value)
+            self.assertEqual(
+                ctx.confidence(value),
+                dates.get_date_confidence(value, from_date, today.isoformat()),
+                value,
+            )
+
+    def test_fixed_today_is_reproducible(self):
+        ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+        self.assertEqual(ctx.recency_score("2026-01-31"), 100)
+        self.assertEqual(ctx.recency_score("2026-01-16"), 50)
+        self.assertEqual(ctx.recency_score("2026-01-01"), 0)
+        self.assertEqual(ctx.recency_score("2026-02-05"), 100)
+        self.assertEqual(ctx.confidence("2026-01-01"), "high")
+        self.assertEqual(ctx.confidence("2025-12-31"), "low")
+        self.assertEqual(ctx.confidence("2026-02-01"), "low")
+        self.assertEqual(ctx.confidence(None), "low")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for deadline module."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import deadline
+
+
+class TestDeadline(unittest.TestCase):
+    def test_unbounded_never_expires(self):
+        d = deadline.Deadline()
+        self.assertIsNone(d.remaining())
+        self.assertFalse(d.expired())
+        self.assertEqual(d.timeout(30), 30)
+
+    def test_timeout_capped_to_remaining(self):
+        with mock.patch.object(deadline.time, "monotonic", return_value=100.0):
+            d = deadline.Deadline(10)
+        with mock.patch.object(deadline.time, "monotonic", return_value=104.0):
+            self.assertEqual(d.remaining(), 6.0)
+            self.assertEqual(d.timeout(30), 6.0)
+            self.assertEqual(d.timeout(2), 2)
+
+    def test_expired_keeps_minimum_timeout(self):
+        with mock.patch.object(deadline.time, "monotonic", return_value=100.0):
+            d = deadline.Deadline(1)
+        with mock.patch.object(deadline.time, "monotonic", return_value=105.0):
+            self.assertTrue(d.expired())
+            self.assertEqual(d.remaining(), 0.0)
+            self.assertEqual(d.timeout(30), deadline.MIN_TIMEOUT)
+
+    def test_scope_shares_budget_not_flag(self):
+        with mock.patch.object(deadline.time, "monotonic", return_value=100.0):
+            d = deadline.Deadline(10)
+            step = d.scope()
+        self.assertEqual(step.expires_at, d.expires_at)
+        step.mark_cut_short()
+        self.assertTrue(step.cut_short)
+        self.assertFalse(d.cut_short)
+        self.assertFalse(d.scope().cut_short)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 """Tests for dedupe module."""
 
+import os
+import random
 import sys
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -37,6 +40,27 @@ class TestGetNgrams(unittest.TestCase):
         self.assertIn("llo", result)
 
 
+class TestGetShingles(unittest.TestCase):
+    TEXTS = ["", "a", "ab", "abc", "Hello, World!", "héllo wörld 🚀 rocket", "aaaa aaaa"]
+
+    def test_same_count_as_ngrams(self):
+        for text in self.TEXTS:
+            for n in (1, 2, 3, 4):
+                self.assertEqual(len(dedupe.get_shingles(text, n)), len(dedupe.get_ngrams(text, n)), (text, n))
+
+    def test_jaccard_matches_string_ngrams(self):
+        for a in self.TEXTS:
+            for b in self.TEXTS:
+                self.assertEqual(
+                    dedupe.jaccard_similarity(dedupe.get_shingles(a), dedupe.get_shingles(b)),
+                    dedupe.jaccard_similarity(dedupe.get_ngrams(a), dedupe.get_ngrams(b)),
+                    (a, b),
+                )
+
+    def test_short_text_distinct_from_trigrams(self):
+        self.assertFalse(dedupe.get_shingles("ab") & dedupe.get_shingles("abc"))
+
+
 class TestJaccardSimilarity(unittest.TestCase):
     def test_identical_sets(self):
         set1 = {"a", "b", "c"}
@@ -79,6 +103,143 @@ class TestFindDuplicates(unittest.TestCase):
         self.assertEqual(result[0], (0, 1))
 
 
+class TestMinHashEngine(unittest.TestCase):
+    TITLES = [
+        "Best practices for Claude Code skills",
+        "Best practices for Claude Code skills guide",
+        "Completely different topic A",
+        "Another unrelated subject B",
+        "Another unrelated subject B!",
+        "",
+        "",
+    ]
+
+    def _items(self):
+        return [
+            schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="")
+            for i, t in enumerate(self.TITLES)
+        ]
+
+    def test_matches_exact_engine(self):
+        items = self._items()
+        exact = dedupe.find_duplicates(items, engine="exact")
+        self.assertEqual(exact, [(0, 1), (3, 4), (5, 6)])
+        self.assertEqual(dedupe.find_duplicates(items, engine="minhash"), exact)
+
+    def test_signature_is_deterministic(self):
+        shingles = dedupe.get_shingles("claude code skills")
+        sig = dedupe.minhash_signature(shingles)
+        self.assertEqual(len(sig), dedupe.MINHASH_NUM_PERM)
+        self.assertEqual(sig, dedupe.minhash_signature(set(shingles)))
+
+    def test_lsh_midpoint_below_threshold(self):
+        bands, rows = dedupe.lsh_params(0.7)
+        self.assertEqual(bands * rows, dedupe.MINHASH_NUM_PERM)
+        self.assertLess((1 / bands) ** (1 / rows), 0.7)
+
+    def test_auto_switches_on_size(self):
+        items = self._items()
+        with mock.patch.object(dedupe, "_find_duplicates_minhash", return_value=[]) as minhash_mock:
+            dedupe.find_duplicates(items, engine="auto")
+            minhash_mock.assert_not_called()
+            with mock.patch.object(dedupe, "MINHASH_MIN_ITEMS", 3):
+                dedupe.find_duplicates(items, engine="auto")
+            minhash_mock.assert_called_once()
+
+    def test_engine_from_env(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_DEDUPE_ENGINE": "minhash"}):
+            self.assertEqual(dedupe.get_dedupe_engine(), "minhash")
+        with mock.patch.dict(os.environ, {"LAST30DAYS_DEDUPE_ENGINE": "bogus"}):
+            self.assertEqual(dedupe.get_dedupe_engine(), "exact")
+
+    def test_default_stays_exact_for_large_inputs(self):
+        items = [
+            schema.RedditItem(id=f"R{i}", title=f"title {i}", url="", subreddit="")
+            for i in range(dedupe.MINHASH_MIN_ITEMS + 1)
+        ]
+        with mock.patch.dict(os.environ, {}, clear=False), \
+             mock.patch.object(dedupe, "_find_duplicates_minhash", return_value=[]) as minhash_mock:
+            os.environ.pop("LAST30DAYS_DEDUPE_ENGINE", None)
+            dedupe.dedupe_reddit(items)
+        minhash_mock.assert_not_called()
+
+    def test_short_signatures_have_no_empty_bins(self):
+        sig = dedupe.minhash_signature(dedupe.get_shingles("ok"))
+        self.assertNotIn(dedupe._EMPTY_BIN, sig)
+        self.assertNotEqual(sig, dedupe.minhash_signature(dedupe.get_shingles("no")))
+        self.assertEqual(dedupe.minhash_signature(frozenset()), [dedupe._EMPTY_BIN] * dedupe.MINHASH_NUM_PERM)
+
+    def test_short_titles_match_exact_engine(self):
+        titles = ["ok", "OK!", "no", "yes", "yes.", "a", "", "", "Claude", "claude", "Claude Code"]
+        titles += [f"Some longer unrelated title number {i}" for i in range(10)]
+        items = [schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="") for i, t in enumerate(titles)]
+        self.assertEqual(
+            dedupe.find_duplicates(items, engine="minhash"),
+            dedupe.find_duplicates(items, engine="exact"),
+        )
+
+    def test_unknown_engine_rejected(self):
+        with self.assertRaises(ValueError):
+            dedupe.find_duplicates(self._items(), engine="bogus")
+
+
+class TestCanonicalUrl(unittest.TestCase):
+    def test_reddit_thread_forms(self):
+        forms = [
+            "https://www.reddit.com/r/ClaudeAI/comments/Abc123/some_title/",
+            "https://old.reddit.com/r/ClaudeAI/comments/abc123/?utm_source=share",
+            "http://np.reddit.com/comments/abc123",
+            "https://m.reddit.com/r/claudeai/comments/abc123/other_slug",
+            "https://redd.it/abc123",
+        ]
+        self.assertEqual({dedupe.canonical_url(u) for u in forms}, {"reddit.com/comments/abc123"})
+
+    def test_reddit_comment_kept_distinct(self):
+        self.assertEqual(
+            dedupe.canonical_url("https://www.reddit.com/r/x/comments/abc123/t/def456/"),
+            "reddit.com/comments/abc123/_/def456",
+        )
+
+    def test_tweet_forms(self):
+        forms = [
+            "https://twitter.com/someone/status/12345?s=20",
+            "https://x.com/someone/status/12345",
+            "https://x.com/i/web/status/12345",
+            "https://mobile.twitter.com/someone/statuses/12345",
+        ]
+        self.assertEqual({dedupe.canonical_url(u) for u in forms}, {"x.com/i/status/12345"})
+
+    def test_generic_urls(self):
+        self.assertEqual(
+            dedupe.canonical_url("https://WWW.Example.com:443/Docs/Page/?utm_medium=x&id=3#intro"),
+            "example.com/Docs/Page?id=3",
+        )
+        self.assertEqual(dedupe.canonical_url("example.com/search?s=term"), "example.com/search?s=term")
+        self.assertEqual(dedupe.canonical_url(""), "")
+
+
+class TestDedupeByUrl(unittest.TestCase):
+    def test_keeps_higher_scored_in_place(self):
+        items = [
+            schema.XItem(id="X1", text="a", url="https://twitter.com/a/status/1", author_handle="a", score=40),
+            schema.XItem(id="X2", text="b", url="https://x.com/b/status/2", author_handle="b", score=30),
+            schema.XItem(id="X3", text="a", url="https://x.com/i/web/status/1", author_handle="a", score=70),
+        ]
+        result = dedupe.dedupe_by_url(items)
+        self.assertEqual([item.id for item in result], ["X3", "X2"])
+
+    def test_shared_index_across_sources(self):
+        seen = {}
+        reddit = [schema.RedditItem(id="R1", title="t", url="https://www.reddit.com/r/a/comments/abc/t/", subreddit="a")]
+        web = [
+            schema.WebSearchItem(id="W1", title="t", url="https://old.reddit.com/comments/abc", source_domain="reddit.com", snippet=""),
+            schema.WebSearchItem(id="W2", title="u", url="https://example.com/post", source_domain="example.com", snippet=""),
+        ]
+        dedupe.dedupe_by_url(reddit, seen)
+        result = dedupe.dedupe_by_url(web, seen)
+        self.assertEqual([item.id for item in result], ["W2"])
+
+
 class TestDedupeItems(unittest.TestCase):
     def test_keeps_higher_scored(self):
         items = [
@@ -107,5 +268,62 @@ class TestDedupeItems(unittest.TestCase):
         self.assertEqual(len(result), 1)
 
 
+class TestDedupeIndex(unittest.TestCase):
+    WORDS = "claude code skills agent prompt tips guide release model update review".split()
+
+    def _random_items(self, rng, n):
+        texts = []
+        for _ in range(n):
+            if texts and rng.random() < 0.5:
+                words = rng.choice(texts).split()
+                words[rng.randrange(len(words))] = rng.choice(self.WORDS)
+                if rng.random() < 0.5:
+                    words.append(rng.choice(self.WORDS))
+                texts.append(" ".join(words))
+            else:
+                texts.append(" ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 6))))
+        return [
+            schema.XItem(id=f"X{i}", text=t, url="", author_handle="", score=rng.randint(0, 5))
+            for i, t in enumerate(texts)
+        ]
+
+    def test_matches_batch_for_any_arrival_order(self):
+        rng = random.Random(7)
+        for threshold in (0.5, 0.7, 0.9, 1.0):
+            for _ in range(40):
+                items = self._random_items(rng, rng.randint(0, 30))
+                index = dedupe.DedupeIndex(threshold)
+                for item in items:
+                    index.add(item)
+                expected = dedupe.dedupe_items(items, threshold, engine="exact")
+                self.assertEqual([i.id for i in index.items()], [i.id for i in expected])
+                self.assertEqual(len(index), len(expected))
+
+    def test_matches_batch_on_sorted_input(self):
+        rng = random.Random(11)
+        items = sorted(self._random_items(rng, 60), key=lambda i: -i.score)
+        index = dedupe.DedupeIndex()
+        for item in items:
+            index.add(item)
+        self.assertEqual(index.items(), dedupe.dedupe_items(items, engine="exact"))
+
+    def test_add_outcomes(self):
+        index = dedupe.DedupeIndex(0.7)
+        low = schema.RedditItem(id="R1", title="Best practices for Claude Code skills", url="", subreddit="", score=40)
+        high = schema.RedditItem(id="R2", title="Best practices for Claude Code skills guide", url="", subreddit="", score=80)
+        tie = schema.RedditItem(id="R3", title="Best practices for Claude Code skills!", url="", subreddit="", score=80)
+        other = schema.RedditItem(id="R4", title="Something unrelated entirely", url="", subreddit="", score=10)
+
+        self.assertEqual(index.add(low), dedupe.DedupeIndex.KEPT)
+        self.assertEqual(index.add(high), dedupe.DedupeIndex.REPLACED)
+        self.assertEqual(index.add(tie), dedupe.DedupeIndex.DROPPED)
+        self.assertEqual(index.add(other), dedupe.DedupeIndex.KEPT)
+        self.assertEqual([i.id for i in index.items()], ["R2", "R4"])
+
+    def test_rejects_bad_threshold(self):
+        with self.assertRaises(ValueError):
+            dedupe.DedupeIndex(0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,398 @@
+"""Tests for http module."""
+
+import gzip
+import io
+import json
+import sys
+import threading
+import time
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import deadline, http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    hits = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload, extra_headers=None, encode=None):
+        body = json.dumps(payload).encode()
+        if encode:
+            body = encode(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (extra_headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        if self.path == "/redirect":
+            self._reply(301, {}, {"Location": "/ok"})
+        elif self.path == "/drop":
+            # Reply as if keep-alive, then close the socket anyway
+            self._reply(200, {"path": self.path})
+            self.close_connection = True
+        elif self.path == "/gzip":
+            assert "gzip" in self.headers.get("Accept-Encoding", "")
+            self._reply(200, {"data": "x" * 5000}, {"Content-Encoding": "gzip"}, gzip.compress)
+        elif self.path == "/deflate-raw":
+            def raw_deflate(body):
+                c = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+                return c.compress(body) + c.flush()
+            self._reply(200, {"data": "y" * 5000}, {"Content-Encoding": "deflate"}, raw_deflate)
+        elif self.path == "/limited":
+            if _Handler.hits[self.path] == 1:
+                self._reply(429, {"error": "slow down"}, {"Retry-After": "7"})
+            else:
+                self._reply(200, {"ok": True})
+        elif self.path == "/down":
+            self._reply(503, {"error": "down"})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "nope"})
+        elif self.path == "/slow":
+            time.sleep(1.0)
+            self._reply(200, {"path": self.path})
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self):
+        _Handler.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(200, json.loads(self.rfile.read(length)))
+
+
+class LocalServerTestCase(unittest.TestCase):
+    def setUp(self):
+        _Handler.connections = set()
+        _Handler.hits = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.proxy_patch = mock.patch.object(http, "_uses_proxy", return_value=False)
+        self.proxy_patch.start()
+        http._pool.close_all()
+        http.reset_circuits()
+
+    def tearDown(self):
+        self.proxy_patch.stop()
+        http._pool.close_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_full_jitter_within_exponential_cap(self):
+        policy = http.RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt in range(6):
+            for _ in range(50):
+                delay = policy.backoff(attempt)
+                self.assertGreaterEqual(delay, 0)
+                self.assertLessEqual(delay, min(5.0, 2 ** attempt))
+
+    def test_retry_after_wins_and_is_capped(self):
+        policy = http.RetryPolicy(max_retry_after=10.0)
+        self.assertEqual(policy.backoff(0, retry_after=4.0), 4.0)
+        self.assertEqual(policy.backoff(0, retry_after=300.0), 10.0)
+
+    def test_should_retry(self):
+        policy = http.RetryPolicy()
+        self.assertTrue(policy.should_retry(429))
+        self.assertTrue(policy.should_retry(503))
+        self.assertFalse(policy.should_retry(404))
+
+    def test_provider_policies(self):
+        self.assertIs(http.get_retry_policy("api.openai.com"), http.RETRY_POLICIES["openai"])
+        self.assertIs(http.get_retry_policy("old.reddit.com"), http.RETRY_POLICIES["reddit"])
+        self.assertIs(http.get_retry_policy("example.com"), http.RETRY_POLICIES["default"])
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(http.parse_retry_after("12"), 12.0)
+
+    def test_http_date_in_past(self):
+        self.assertEqual(http.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_garbage(self):
+        self.assertIsNone(http.parse_retry_after("soon"))
+        self.assertIsNone(http.parse_retry_after(None))
+
+
+class TestTokenBucketPause(unittest.TestCase):
+    def test_pause_blocks_all_callers(self):
+        bucket = http.TokenBucket(rate=1000.0, burst=5)
+        bucket.pause(0.05)
+        start = http.time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(http.time.monotonic() - start, 0.04)
+
+    def test_acquire_gives_up_at_timeout(self):
+        bucket = http.TokenBucket(rate=1000.0, burst=5)
+        bucket.pause(60)
+        start = http.time.monotonic()
+        self.assertFalse(bucket.acquire(timeout=0.05))
+        self.assertLess(http.time.monotonic() - start, 1)
+
+    def test_throttle_raises_when_budget_runs_out(self):
+        bucket = http.TokenBucket(rate=1000.0, burst=5)
+        bucket.pause(60)
+        with mock.patch.object(http, "_get_bucket", return_value=bucket):
+            with self.assertRaises(http.DeadlineExceededError):
+                http.throttle("https://www.reddit.com/x.json", deadline.Deadline(0.05))
+
+
+class TestRetries(LocalServerTestCase):
+    def test_honors_retry_after(self):
+        with mock.patch.object(http.time, "sleep") as sleep_mock:
+            self.assertEqual(http.get(f"{self.base}/limited"), {"ok": True})
+        sleep_mock.assert_called_once_with(7.0)
+
+    def test_server_error_retried_then_raised(self):
+        policy = http.RetryPolicy(max_retries=3, base_delay=0.5)
+        with mock.patch.object(http.time, "sleep") as sleep_mock:
+            with self.assertRaises(http.HTTPError) as ctx:
+                http.get(f"{self.base}/down", retry_policy=policy)
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(_Handler.hits["/down"], 3)
+        self.assertEqual(sleep_mock.call_count, 2)
+        self.assertLessEqual(sleep_mock.call_args_list[1].args[0], 1.0)
+
+    def test_backoff_longer_than_budget_not_attempted(self):
+        policy = http.RetryPolicy(max_retries=3, base_delay=0.5)
+        with mock.patch.object(http.time, "sleep") as sleep_mock, \
+             mock.patch.object(policy, "backoff", return_value=30.0):
+            with self.assertRaises(http.HTTPError):
+                http.get(f"{self.base}/down", retry_policy=policy, deadline=deadline.Deadline(5))
+        self.assertEqual(_Handler.hits["/down"], 1)
+        sleep_mock.assert_not_called()
+
+    def test_expired_budget_sends_nothing(self):
+        budget = deadline.Deadline(0)
+        with self.assertRaises(http.DeadlineExceededError):
+            http.get(f"{self.base}/down", deadline=budget)
+        self.assertEqual(_Handler.hits.get("/down", 0), 0)
+        self.assertTrue(budget.cut_short)
+
+    def test_request_within_budget_not_marked(self):
+        budget = deadline.Deadline(60)
+        http.get(f"{self.base}/ok", deadline=budget)
+        self.assertFalse(budget.cut_short)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        breaker = http.CircuitBreaker("api.example.com", failure_threshold=3, cooldown=60)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(http.CircuitOpenError) as ctx:
+            breaker.before_request()
+        self.assertIsInstance(ctx.exception, http.HTTPError)
+        self.assertIn("api.example.com", str(ctx.exception))
+
+    def test_success_resets_count(self):
+        breaker = http.CircuitBreaker("h", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_half_open_allows_single_probe(self):
+        breaker = http.CircuitBreaker("h", failure_threshold=1, cooldown=0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "half-open")
+        breaker.before_request()  # the probe
+        with self.assertRaises(http.CircuitOpenError):
+            breaker.before_request()  # everyone else waits for the probe
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_failed_probe_reopens(self):
+        breaker = http.CircuitBreaker("h", failure_threshold=1, cooldown=60)
+        breaker.record_failure()
+        breaker.opened_at -= 61
+        breaker.before_request()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+    def test_shared_per_provider(self):
+        http.reset_circuits()
+        self.assertIs(http.get_breaker("www.reddit.com"), http.get_breaker("old.reddit.com"))
+        self.assertIsNone(http.get_circuit_error("reddit"))
+
+
+class TestCircuitShortCircuit(LocalServerTestCase):
+    def test_open_circuit_fails_fast(self):
+        policy = http.RetryPolicy(max_retries=http.CIRCUIT_FAILURE_THRESHOLD)
+        with mock.patch.object(http.time, "sleep"):
+            with self.assertRaises(http.HTTPError):
+                http.get(f"{self.base}/down", retry_policy=policy)
+            with self.assertRaises(http.CircuitOpenError):
+                http.get(f"{self.base}/ok")
+        self.assertEqual(_Handler.hits["/down"], http.CIRCUIT_FAILURE_THRESHOLD)
+        self.assertNotIn("/ok", _Handler.hits)
+
+    def test_probe_raising_unexpected_error_is_settled(self):
+        breaker = http.get_breaker(urlparse(self.base).netloc)
+        breaker.failures = http.CIRCUIT_FAILURE_THRESHOLD
+        breaker.opened_at = time.monotonic() - breaker.cooldown - 1
+        with mock.patch.object(http, "_send", side_effect=ValueError("bad url")):
+            with self.assertRaises(ValueError):
+                http.get(f"{self.base}/ok")
+        self.assertFalse(breaker._probing)
+        breaker.opened_at -= breaker.cooldown + 1
+        self.assertEqual(http.get(f"{self.base}/ok"), {"path": "/ok"})
+        self.assertEqual(breaker.state, "closed")
+
+    def test_budget_capped_timeouts_do_not_trip(self):
+        budget = deadline.Deadline(0.2)
+        errors = []
+
+        def fetch():
+            try:
+                http.get(f"{self.base}/slow", deadline=budget)
+            except http.HTTPError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(errors), 8)
+        self.assertTrue(all(isinstance(e, http.DeadlineExceededError) for e in errors))
+        self.assertTrue(budget.cut_short)
+        breaker = http.get_breaker(urlparse(self.base).netloc)
+        self.assertEqual((breaker.state, breaker.failures), ("closed", 0))
+
+    def test_client_errors_do_not_trip(self):
+        for _ in range(http.CIRCUIT_FAILURE_THRESHOLD + 1):
+            with self.assertRaises(http.HTTPError):
+                http.get(f"{self.base}/missing")
+        self.assertEqual(http.get(f"{self.base}/ok"), {"path": "/ok"})
+
+
+class TestCompression(LocalServerTestCase):
+    def test_gzip_response_decoded(self):
+        self.assertEqual(http.get(f"{self.base}/gzip"), {"data": "x" * 5000})
+
+    def test_raw_deflate_response_decoded(self):
+        self.assertEqual(http.get(f"{self.base}/deflate-raw"), {"data": "y" * 5000})
+
+    def test_read_body_streams_in_chunks(self):
+        payload = b"z" * (http.READ_CHUNK_SIZE * 3)
+        body = http._read_body(io.BytesIO(zlib.compress(payload)), "deflate")
+        self.assertEqual(body, payload)
+
+    def test_identity_passthrough(self):
+        self.assertEqual(http._read_body(io.BytesIO(b"plain"), None), b"plain")
+
+
+class TestConnectionPool(LocalServerTestCase):
+    def test_reuses_connection(self):
+        for i in range(5):
+            self.assertEqual(http.get(f"{self.base}/item{i}"), {"path": f"/item{i}"})
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_post_json(self):
+        self.assertEqual(http.post(f"{self.base}/echo", {"a": 1}), {"a": 1})
+
+    def test_follows_redirect(self):
+        self.assertEqual(http.get(f"{self.base}/redirect"), {"path": "/ok"})
+
+    def test_client_error_raises_http_error(self):
+        with self.assertRaises(http.HTTPError) as ctx:
+            http.get(f"{self.base}/missing")
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertIn("nope", ctx.exception.body)
+
+    def test_stale_connection_reconnects(self):
+        http.get(f"{self.base}/drop")
+        # The pooled socket is dead; the retry must be immediate, not a backoff
+        with mock.patch.object(http.time, "sleep", side_effect=AssertionError("slept")):
+            self.assertEqual(http.get(f"{self.base}/second"), {"path": "/second"})
+        self.assertEqual(len(_Handler.connections), 2)
+
+    def test_closed_idle_connection_not_used_for_post(self):
+        http.get(f"{self.base}/drop")
+        self.assertEqual(http.post(f"{self.base}/echo", {"a": 1}), {"a": 1})
+        self.assertEqual(len(_Handler.connections), 2)
+
+    def _send_over_dead_connections(self, method):
+        dead = mock.Mock()
+        dead.getresponse.side_effect = http.http_client.RemoteDisconnected("closed")
+        with mock.patch.object(http._pool, "acquire", side_effect=[(dead, True), (dead, False)]) as acquire, \
+             mock.patch.object(http._pool, "release"):
+            with self.assertRaises(http.http_client.RemoteDisconnected):
+                http._send_pooled(method, urlparse(f"{self.base}/x"), b"{}", {}, 5)
+        return acquire.call_count, dead.request.call_count
+
+    def test_post_not_resent_after_stale_connection(self):
+        self.assertEqual(self._send_over_dead_connections("POST"), (1, 1))
+
+    def test_get_resent_once_after_stale_connection(self):
+        self.assertEqual(self._send_over_dead_connections("GET"), (2, 2))
+
+    def test_idle_connections_evicted(self):
+        pool = http.ConnectionPool(max_per_host=2, idle_timeout=0)
+        key = ("http", "127.0.0.1", self.server.server_address[1])
+        conn, reused = pool.acquire(key, 5)
+        pool.release(key, conn)
+        conn2, reused2 = pool.acquire(key, 5)
+        self.assertFalse(reused2)
+        self.assertIsNot(conn, conn2)
+        pool.release(key, conn2, reusable=False)
+
+    def test_slot_wait_bounded_by_deadline(self):
+        pool = http.ConnectionPool(max_per_host=1)
+        key = ("http", "127.0.0.1", self.server.server_address[1])
+        conn, _ = pool.acquire(key, 5)
+        with self.assertRaises(http.DeadlineExceededError):
+            pool.acquire(key, 5, deadline.Deadline(0.05))
+        pool.release(key, conn, reusable=False)
+
+    def test_budget_spent_waiting_for_a_slot_is_not_a_host_failure(self):
+        breaker = http.get_breaker(urlparse(self.base).netloc)
+        with mock.patch.object(http, "_pool", http.ConnectionPool(max_per_host=0)):
+            with self.assertRaises(http.DeadlineExceededError):
+                http.get(f"{self.base}/ok", deadline=deadline.Deadline(0.05))
+        self.assertEqual(breaker.failures, 0)
+        self.assertEqual(_Handler.hits, {})
+
+    def test_concurrent_requests_capped_per_host(self):
+        results = []
+
+        def worker(i):
+            results.append(http.get(f"{self.base}/c{i}"))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(len(_Handler.connections), http.POOL_MAX_PER_HOST)
+
+
+if __name__ == "__main__":
+    unittest.main()
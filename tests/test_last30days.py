@@ -0,0 +1,408 @@
+"""Tests for the last30days orchestrator."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+
+
+class TestRunResearchPipeline(unittest.TestCase):
+    def test_x_phase2_starts_while_reddit_in_flight(self):
+        reddit_release = threading.Event()
+        x_phase2_ran = threading.Event()
+
+        def slow_reddit(*args, **kwargs):
+            # Reddit stays in flight until X has finished its Phase 2
+            self.assertTrue(reddit_release.wait(5))
+            return [], None, None
+
+        def x_phase2(*args, **kwargs):
+            x_phase2_ran.set()
+            reddit_release.set()
+            return [{"id": "X9", "url": "https://x.com/a/status/9"}]
+
+        x_items = [{"id": "X1", "url": "https://x.com/a/status/1", "author_handle": "dev"}]
+        with mock.patch.object(last30days, "_search_reddit", side_effect=slow_reddit), \
+             mock.patch.object(last30days, "_search_x", return_value=(x_items, None, None)), \
+             mock.patch.object(last30days, "_supplemental_x", side_effect=x_phase2):
+            result = last30days.run_research(
+                "topic", "both", {}, {}, "2026-01-01", "2026-01-31",
+                x_source="bird",
+            )
+
+        self.assertTrue(x_phase2_ran.is_set())
+        self.assertEqual([item["id"] for item in result[1]], ["X1", "X9"])
+        self.assertEqual(result[8], [])
+
+    def test_reddit_phase2_runs_after_enrichment(self):
+        calls = []
+        reddit_items = [{"id": "R1", "url": "https://reddit.com/r/t/comments/a/x/", "subreddit": "t"}]
+
+        def enrich(items, **kwargs):
+            calls.append("enrich")
+            return items
+
+        def phase2(topic, items, *args, **kwargs):
+            calls.append("phase2")
+            return [{"id": "R2", "url": "https://reddit.com/r/t/comments/b/y/"}]
+
+        with mock.patch.object(last30days, "_search_reddit", return_value=(reddit_items, None, None)), \
+             mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=enrich), \
+             mock.patch.object(last30days, "_supplemental_reddit", side_effect=phase2):
+            result = last30days.run_research(
+                "topic", "reddit", {}, {}, "2026-01-01", "2026-01-31",
+            )
+
+        self.assertEqual(calls, ["enrich", "phase2"])
+        self.assertEqual([item["id"] for item in result[0]], ["R1", "R2"])
+
+    def test_phase2_summary_logged_once_both_chains_finish(self):
+        reddit_items = [{"id": "R1", "url": "https://reddit.com/r/t/comments/a/x/", "subreddit": "t"}]
+        phase2 = [{"id": "R2", "url": "https://reddit.com/r/t/comments/b/y/"}]
+        stderr = io.StringIO()
+        with mock.patch.object(last30days, "_search_reddit", return_value=(reddit_items, None, None)), \
+             mock.patch.object(last30days, "_search_x", return_value=([{"id": "X1"}], None, None)), \
+             mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=lambda items, **kw: items), \
+             mock.patch.object(last30days, "_supplemental_reddit", return_value=phase2), \
+             contextlib.redirect_stderr(stderr):
+            last30days.run_research("topic", "both", {}, {}, "2026-01-01", "2026-01-31")
+
+        self.assertEqual(stderr.getvalue().splitlines()[-1], "[Phase 2] +1 Reddit, +0 X")
+
+    def test_open_reddit_circuit_marks_run_as_errored(self):
+        reddit_items = [{"id": "R1", "url": "https://reddit.com/r/t/comments/a/x/", "subreddit": "t"}]
+        circuit = "Circuit open for reddit after 5 consecutive failures"
+
+        def enrich(items, on_error=None, **kwargs):
+            on_error(items[0], last30days.http.HTTPError(circuit))
+            return items
+
+        with mock.patch.object(last30days, "_search_reddit", return_value=(reddit_items, None, None)), \
+             mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=enrich), \
+             mock.patch.object(last30days.http, "get_circuit_error", return_value=circuit):
+            result = last30days.run_research(
+                "topic", "reddit", {}, {}, "2026-01-01", "2026-01-31", depth="quick",
+            )
+
+        self.assertEqual([item["id"] for item in result[0]], ["R1"])
+        self.assertEqual(result[6], f"Reddit enrichment degraded: {circuit}")
+
+    def test_step_finishing_at_the_deadline_is_not_truncated(self):
+        budget = last30days.deadline_mod.Deadline(0.05)
+
+        def search_until_deadline(*args, **kwargs):
+            # Completes everything, but uses up the whole budget doing so
+            time.sleep(0.1)
+            return [{"id": "R1", "url": "https://reddit.com/r/t/comments/a/x/"}], None, None
+
+        with mock.patch.object(last30days, "_search_reddit", side_effect=search_until_deadline), \
+             mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=lambda items, **kw: items):
+            result = last30days.run_research(
+                "topic", "reddit", {}, {}, "2026-01-01", "2026-01-31", depth="quick", deadline=budget,
+            )
+
+        self.assertEqual(result[8], [])
+
+    def test_step_that_dropped_work_is_truncated(self):
+        def enrich(items, deadline=None, **kwargs):
+            deadline.mark_cut_short()
+            return items
+
+        reddit_items = [{"id": "R1", "url": "https://reddit.com/r/t/comments/a/x/"}]
+        with mock.patch.object(last30days, "_search_reddit", return_value=(reddit_items, None, None)), \
+             mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=enrich):
+            result = last30days.run_research(
+                "topic", "reddit", {}, {}, "2026-01-01", "2026-01-31", depth="quick",
+            )
+
+        self.assertEqual(result[8], ["Reddit enrichment"])
+
+
+class TestHedgedRedditSearch(unittest.TestCase):
+    TOPIC = "best claude code skills"
+
+    def setUp(self):
+        self.calls = []
+        self.main_release = threading.Event()
+        self.results = {
+            self.TOPIC: [_item("a"), _item("b")],
+            "claude code skills": [_item("b"), _item("c")],
+            "r/claudecodeskills site:reddit.com": [_item("d")],
+        }
+        patches = [
+            mock.patch.object(last30days.openai_reddit, "search_reddit", side_effect=self._search),
+            mock.patch.object(last30days.openai_reddit, "parse_reddit_response",
+                              side_effect=lambda raw: list(self.results.get(raw.get("query"), []))),
+            mock.patch.object(last30days.cache, "is_sparse_topic", return_value=False),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        save_patch = mock.patch.object(last30days.cache, "save_topic_yield")
+        self.save_topic_yield = save_patch.start()
+        self.addCleanup(save_patch.stop)
+
+    def _search(self, api_key, model, query, *args, **kwargs):
+        self.calls.append(query)
+        if query == self.TOPIC:
+            # Main query is slow; released once a hedge has been sent
+            self.main_release.wait(5)
+        else:
+            self.main_release.set()
+        return {"query": query}
+
+    def _run(self, hedge_after=None):
+        return last30days._search_reddit(
+            self.TOPIC, {"OPENAI_API_KEY": "k"}, {"openai": "m"},
+            "2026-01-01", "2026-01-31", "default", False, hedge_after=hedge_after,
+        )
+
+    def test_sequential_by_default(self):
+        self.main_release.set()
+        items, _, error = self._run()
+        self.assertIsNone(error)
+        self.assertEqual(self.calls, [self.TOPIC, "claude code skills"])
+        self.assertEqual([item["url"] for item in items], ["u/a", "u/b", "u/c"])
+
+    def test_hedge_launched_while_main_in_flight(self):
+        items, _, _ = self._run(hedge_after=0.01)
+        # The hedge went out before the main query returned
+        self.assertEqual(self.calls[:2], [self.TOPIC, "claude code skills"])
+        self.assertEqual(sorted(item["url"] for item in items), ["u/a", "u/b", "u/c"])
+
+    def test_hedges_capped(self):
+        with mock.patch.dict(last30days.os.environ, {"LAST30DAYS_HEDGE_MAX_QUERIES": "0"}):
+            self.main_release.set()
+            self._run(hedge_after=0)
+        # Nothing speculative: the cascade ran its usual single fallback
+        self.assertEqual(self.calls, [self.TOPIC, "claude code skills"])
+
+    def test_topic_yield_recorded_only_when_hedging(self):
+        self.main_release.set()
+        self._run()
+        self.save_topic_yield.assert_not_called()
+        self._run(hedge_after=5)
+        self.save_topic_yield.assert_called_once_with(self.TOPIC, 2)
+
+    def test_does_not_wait_for_hedges_past_the_deadline(self):
+        hedge_release = threading.Event()
+        self.addCleanup(hedge_release.set)
+
+        def search(api_key, model, query, *args, **kwargs):
+            if query != self.TOPIC:
+                hedge_release.wait(5)
+            return {"query": query}
+
+        last30days.openai_reddit.search_reddit.side_effect = search
+        start = time.monotonic()
+        items, _, error = last30days._search_reddit(
+            self.TOPIC, {"OPENAI_API_KEY": "k"}, {"openai": "m"},
+            "2026-01-01", "2026-01-31", "default", False,
+            deadline=last30days.deadline_mod.Deadline(0.1), hedge_after=0,
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertIsNone(error)
+        self.assertEqual([item["url"] for item in items], ["u/a", "u/b"])
+
+    def test_sufficient_main_result_does_not_wait_for_hedges(self):
+        hedge_release = threading.Event()
+        self.addCleanup(hedge_release.set)
+        self.results[self.TOPIC] = [_item(name) for name in "abcdef"]
+
+        def search(api_key, model, query, *args, **kwargs):
+            if query == self.TOPIC:
+                time.sleep(0.05)  # still in flight when the hedges go out
+            else:
+                hedge_release.wait(5)
+            return {"query": query}
+
+        last30days.openai_reddit.search_reddit.side_effect = search
+        deadline = last30days.deadline_mod.Deadline()
+        start = time.monotonic()
+        items, _, error = last30days._search_reddit(
+            self.TOPIC, {"OPENAI_API_KEY": "k"}, {"openai": "m"},
+            "2026-01-01", "2026-01-31", "default", False, deadline=deadline, hedge_after=0.01,
+        )
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertIsNone(error)
+        self.assertEqual(len(items), 6)
+        self.assertFalse(deadline.cut_short)
+
+
+class MainTestCase(unittest.TestCase):
+    """Runs main() with the cache and output dirs in a temp directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cache_dir = self.tmp / "cache"
+
+        # ensure_cache_dir/ensure_output_dir rebind these module globals
+        for module, names in (
+            (last30days.cache, ("CACHE_DIR", "MODEL_CACHE_FILE", "TOPIC_YIELD_FILE")),
+            (last30days.render, ("OUTPUT_DIR",)),
+        ):
+            for name in names:
+                self.addCleanup(setattr, module, name, getattr(module, name))
+
+        patches = [
+            mock.patch.dict(os.environ, {
+                "HOME": str(self.tmp),
+                "LAST30DAYS_CACHE_DIR": str(self.cache_dir),
+                "LAST30DAYS_OUTPUT_DIR": str(self.tmp / "out"),
+            }),
+            mock.patch.object(last30days.env, "get_x_source_status", return_value={"source": None}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def run_main(self, *argv):
+        """Run main() with argv; returns stdout."""
+        stdout = io.StringIO()
+        with mock.patch.object(sys, "argv", ["last30days.py", *argv]), \
+             contextlib.redirect_stdout(stdout), \
+             contextlib.redirect_stderr(io.StringIO()):
+            last30days.main()
+        return stdout.getvalue()
+
+
+class TestMainMock(MainTestCase):
+    def test_relevance_fallback_keeps_relevance_order(self):
+        # The fixture threads are all older than the window, so main() keeps
+        # the top 3 by relevance; output must stay in that order
+        output = self.run_main("claude code skills", "--mock", "--sources", "reddit")
+        positions = [output.index(f"**{rid}**") for rid in ("R1", "R2", "R3")]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_budget_cut_enrichment_is_truncation_not_error(self):
+        def slow_enrich(items, on_error=None, deadline=None, **kwargs):
+            # Every thread fetch outlives the budget
+            time.sleep(0.3)
+            for item in items:
+                on_error(item, last30days.http.DeadlineExceededError("Time budget exhausted"))
+            deadline.mark_cut_short()
+            return items
+
+        circuit = "Circuit open for reddit after 5 consecutive failures"
+        with mock.patch.object(last30days.reddit_enrich, "enrich_reddit_items", side_effect=slow_enrich), \
+             mock.patch.object(last30days.http, "get_circuit_error", return_value=circuit):
+            output = self.run_main(
+                "claude code skills", "--mock", "--sources", "reddit", "--budget", "0.2",
+            )
+        self.assertIn("PARTIAL RESULTS", output)
+        self.assertNotIn("degraded", output)
+        self.assertNotIn("Circuit open", output)
+
+
+class TestMainReportCache(MainTestCase):
+    TOPIC = "cached topic"
+
+    def setUp(self):
+        super().setUp()
+        self.from_date, self.to_date = last30days.dates.get_date_range(30)
+        self.key = last30days.cache.get_cache_key(
+            self.TOPIC, self.from_date, self.to_date, "reddit", depth="default", x_source="xai",
+        )
+        self.cache_file = self.cache_dir / f"{self.key}.json"
+        self.research = mock.Mock(return_value=self._research_result())
+        patches = [
+            mock.patch.object(last30days.env, "get_config", return_value={"OPENAI_API_KEY": "key"}),
+            mock.patch.object(last30days.models, "get_models", return_value={"openai": "gpt-5", "xai": None}),
+            mock.patch.object(last30days, "run_research", self.research),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _research_result(self, reddit_error=None, truncated=None):
+        fresh = {
+            "id": "R1", "title": "Fresh thread", "url": "https://reddit.com/r/t/comments/f/x/",
+            "subreddit": "t", "date": self.to_date, "relevance": 0.9, "why_relevant": "fresh",
+        }
+        return [fresh], [], False, None, None, [], reddit_error, None, truncated or []
+
+    def _seed_cache(self):
+        report = last30days.schema.create_report(self.TOPIC, self.from_date, self.to_date, "reddit-only")
+        report.reddit = [last30days.schema.RedditItem(
+            id="R7", title="Cached thread", url="https://reddit.com/r/t/comments/c/x/", subreddit="t",
+        )]
+        last30days.cache.save_cache(self.key, report.to_dict())
+
+    def test_cache_hit_returns_cached_report(self):
+        self._seed_cache()
+        output = self.run_main(self.TOPIC, "--sources", "reddit")
+        self.research.assert_not_called()
+        self.assertIn("Cached thread", output)
+
+    def test_refresh_bypasses_cache(self):
+        self._seed_cache()
+        output = self.run_main(self.TOPIC, "--sources", "reddit", "--refresh")
+        self.research.assert_called_once()
+        self.assertIn("Fresh thread", output)
+        self.assertNotIn("Cached thread", output)
+
+    def test_cache_ttl_zero_is_a_miss(self):
+        self._seed_cache()
+        self.run_main(self.TOPIC, "--sources", "reddit", "--cache-ttl", "0")
+        self.research.assert_called_once()
+
+    def test_clean_run_is_saved_and_reused(self):
+        self.run_main(self.TOPIC, "--sources", "reddit")
+        self.assertTrue(self.cache_file.exists())
+        output = self.run_main(self.TOPIC, "--sources", "reddit")
+        self.research.assert_called_once()
+        self.assertIn("Fresh thread", output)
+
+    def test_errored_run_not_saved(self):
+        self.research.return_value = self._research_result(reddit_error="HTTPError: boom")
+        self.run_main(self.TOPIC, "--sources", "reddit")
+        self.assertFalse(self.cache_file.exists())
+
+    def test_truncated_run_not_saved(self):
+        self.research.return_value = self._research_result(truncated=["Reddit enrichment"])
+        self.run_main(self.TOPIC, "--sources", "reddit")
+        self.assertFalse(self.cache_file.exists())
+
+    def test_mock_run_not_saved(self):
+        self.run_main(self.TOPIC, "--mock", "--sources", "reddit")
+        self.research.assert_called_once()
+        self.assertEqual(list(self.cache_dir.glob("*.json")), [])
+
+
+class TestLoadCachedReport(MainTestCase):
+    def test_hit_is_marked_as_cached(self):
+        report = last30days.schema.create_report("topic", "2026-01-01", "2026-01-31", "both")
+        last30days.cache.save_cache("k1", report.to_dict())
+        loaded = last30days.load_cached_report("k1", 24)
+        self.assertEqual(loaded.topic, "topic")
+        self.assertTrue(loaded.from_cache)
+        self.assertIsNotNone(loaded.cache_age_hours)
+
+    def test_missing_expired_and_stale_format_are_misses(self):
+        self.assertIsNone(last30days.load_cached_report("absent", 24))
+        last30days.cache.save_cache("k2", {"unexpected": "layout"})
+        self.assertIsNone(last30days.load_cached_report("k2", 24))
+        report = last30days.schema.create_report("topic", "2026-01-01", "2026-01-31", "both")
+        last30days.cache.save_cache("k3", report.to_dict())
+        self.assertIsNone(last30days.load_cached_report("k3", 0))
+
+
+def _item(key):
+    return {"id": key, "url": f"u/{key}"}
+
+
+if __name__ == "__main__":
+    unittest.main()
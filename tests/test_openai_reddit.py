@@ -1,13 +1,16 @@
 """Tests for openai_reddit module."""
 
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import http
+from lib import http, openai_reddit
 from lib.openai_reddit import _is_model_access_error, MODEL_FALLBACK_ORDER
 
 
@@ -73,5 +76,43 @@ class TestModelFallbackOrder(unittest.TestCase):
         self.assertEqual(MODEL_FALLBACK_ORDER[0], "gpt-4o")
 
 
+def _listing(sub, *post_ids):
+    return {"data": {"children": [
+        {"kind": "t3", "data": {"id": pid, "title": pid, "subreddit": sub,
+                                "permalink": f"/r/{sub}/comments/{pid}/x/"}}
+        for pid in post_ids
+    ]}}
+
+
+class TestSearchSubreddits(unittest.TestCase):
+    def test_concurrent_with_deterministic_ids(self):
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_get(url, **kwargs):
+            sub = url.split("/r/")[1].split("/")[0]
+            with lock:
+                in_flight.append(sub)
+                peak.append(len(in_flight))
+            # First subreddit answers last
+            time.sleep(0.2 if sub == "a" else 0.05)
+            with lock:
+                in_flight.remove(sub)
+            if sub == "c":
+                raise http.HTTPError("HTTP 403: Forbidden", status_code=403)
+            return _listing(sub, f"{sub}1", f"{sub}2")
+
+        with mock.patch.object(openai_reddit.http, "get", side_effect=fake_get), \
+             mock.patch.object(openai_reddit, "_log_info") as log_mock:
+            items = openai_reddit.search_subreddits(["a", "b", "c"], "topic", "2026-01-01", "2026-01-31")
+
+        self.assertGreater(max(peak), 1)
+        self.assertEqual([item["title"] for item in items], ["a1", "a2", "b1", "b2"])
+        self.assertEqual([item["id"] for item in items], ["RS1", "RS2", "RS3", "RS4"])
+        log_mock.assert_called_once()
+        self.assertIn("r/c", log_mock.call_args[0][0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,213 @@
+"""Tests for reddit_enrich module."""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import deadline, http, reddit_enrich
+
+MOCK_THREAD = [
+    {"data": {"children": [{"kind": "t3", "data": {
+        "score": 42, "num_comments": 7, "upvote_ratio": 0.9, "created_utc": 1768435200,
+    }}]}},
+    {"data": {"children": []}},
+]
+
+
+class TestEnrichConcurrency(unittest.TestCase):
+    def test_default(self):
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("LAST30DAYS_ENRICH_CONCURRENCY", None)
+            self.assertEqual(reddit_enrich.get_enrich_concurrency(), reddit_enrich.DEFAULT_ENRICH_CONCURRENCY)
+
+    def test_env_override(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_ENRICH_CONCURRENCY": "3"}):
+            self.assertEqual(reddit_enrich.get_enrich_concurrency(), 3)
+
+    def test_invalid_env_falls_back(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_ENRICH_CONCURRENCY": "lots"}):
+            self.assertEqual(reddit_enrich.get_enrich_concurrency(), reddit_enrich.DEFAULT_ENRICH_CONCURRENCY)
+
+
+class TestEnrichRedditItems(unittest.TestCase):
+    def _items(self, n):
+        return [{"id": f"R{i}", "url": f"https://www.reddit.com/r/t/comments/{i}/x/"} for i in range(n)]
+
+    def test_preserves_order_and_enriches(self):
+        items = self._items(12)
+        result = reddit_enrich.enrich_reddit_items(items, mock_thread_data=MOCK_THREAD, max_workers=4)
+        self.assertEqual([r["id"] for r in result], [f"R{i}" for i in range(12)])
+        self.assertTrue(all(r["engagement"]["score"] == 42 for r in result))
+
+    def test_progress_reports_every_item(self):
+        calls = []
+        reddit_enrich.enrich_reddit_items(
+            self._items(5), mock_thread_data=MOCK_THREAD, max_workers=2,
+            on_progress=lambda done, total: calls.append((done, total)),
+        )
+        self.assertEqual(calls, [(i, 5) for i in range(1, 6)])
+
+    def test_budget_cut_marks_deadline(self):
+        budget = deadline.Deadline(0)
+        items = self._items(2)
+        result = reddit_enrich.enrich_reddit_items(items, mock_thread_data=MOCK_THREAD, deadline=budget)
+        self.assertEqual(result, items)
+        self.assertTrue(budget.cut_short)
+
+    def test_completed_run_not_marked(self):
+        budget = deadline.Deadline(60)
+        reddit_enrich.enrich_reddit_items(self._items(2), mock_thread_data=MOCK_THREAD, deadline=budget)
+        self.assertFalse(budget.cut_short)
+
+    def test_failed_item_kept_unenriched(self):
+        items = self._items(3)
+        original = reddit_enrich.enrich_reddit_item
+        errors = []
+
+        def flaky(item, mock_data=None, deadline=None):
+            if item["id"] == "R1":
+                raise RuntimeError("boom")
+            return original(item, mock_data, deadline)
+
+        with mock.patch.object(reddit_enrich, "enrich_reddit_item", side_effect=flaky):
+            result = reddit_enrich.enrich_reddit_items(
+                items, mock_thread_data=MOCK_THREAD,
+                on_error=lambda item, e: errors.append(item["id"]),
+            )
+
+        self.assertEqual(errors, ["R1"])
+        self.assertNotIn("engagement", result[1])
+        self.assertIn("engagement", result[0])
+
+    def test_empty(self):
+        self.assertEqual(reddit_enrich.enrich_reddit_items([]), [])
+
+
+class TestExtractThreadId(unittest.TestCase):
+    def test_standard_url(self):
+        url = "https://www.reddit.com/r/ClaudeAI/comments/1AbC23/some_title/"
+        self.assertEqual(reddit_enrich.extract_thread_id(url), "1abc23")
+
+    def test_non_thread_url(self):
+        self.assertIsNone(reddit_enrich.extract_thread_id("https://www.reddit.com/r/ClaudeAI/"))
+        self.assertIsNone(reddit_enrich.extract_thread_id("https://example.com/comments/abc"))
+
+
+class TestFetchThreadMetadata(unittest.TestCase):
+    def test_batches_fullnames(self):
+        urls = [f"https://www.reddit.com/r/t/comments/id{i}/x/" for i in range(150)]
+        responses = [
+            {"data": {"children": [{"kind": "t3", "data": {"id": f"id{i}", "score": i}} for i in range(100)]}},
+            {"data": {"children": [{"kind": "t3", "data": {"id": f"id{i}", "score": i}} for i in range(100, 150)]}},
+        ]
+        with mock.patch.object(http, "get", side_effect=responses) as get_mock:
+            result = reddit_enrich.fetch_thread_metadata(urls)
+
+        self.assertEqual(get_mock.call_count, 2)
+        first_url = get_mock.call_args_list[0].args[0]
+        self.assertIn("t3_id0,t3_id1,", first_url)
+        self.assertEqual(len(result), 150)
+        self.assertEqual(result["id42"]["score"], 42)
+
+    def test_failed_batch_is_skipped(self):
+        with mock.patch.object(http, "get", side_effect=http.HTTPError("HTTP 503", 503)):
+            result = reddit_enrich.fetch_thread_metadata(["https://www.reddit.com/r/t/comments/a1/x/"])
+        self.assertEqual(result, {})
+
+
+class TestBulkEnrichment(unittest.TestCase):
+    def test_comment_fetches_limited_to_top_items(self):
+        items = [
+            {"id": f"R{i}", "url": f"https://www.reddit.com/r/t/comments/id{i}/x/", "relevance": i / 10}
+            for i in range(5)
+        ]
+        metadata = {f"id{i}": {"score": i, "num_comments": 1, "created_utc": 1768435200} for i in range(4)}
+        fetched = []
+
+        def fake_enrich(item, mock_data=None, deadline=None):
+            fetched.append(item["id"])
+            return item
+
+        with mock.patch.object(reddit_enrich, "fetch_thread_metadata", return_value=metadata), \
+             mock.patch.object(reddit_enrich, "enrich_reddit_item", side_effect=fake_enrich):
+            result = reddit_enrich.enrich_reddit_items(items, comment_threads=2)
+
+        # Top-2 by relevance among bulk hits, plus id4 which the bulk lookup missed
+        self.assertEqual(sorted(fetched), ["R2", "R3", "R4"])
+        self.assertEqual(result[0]["engagement"]["score"], 0)
+        self.assertEqual(result[0]["date"], "2026-01-15")
+
+
+class TestListingMetadata(unittest.TestCase):
+    def test_listing_items_skip_bulk_lookup_and_comments_when_budget_zero(self):
+        items = [{"id": "RS1", "url": "https://www.reddit.com/r/t/comments/a1/x/",
+                  "engagement": {"score": 5}, "metadata_source": "listing"}]
+        with mock.patch.object(reddit_enrich, "fetch_thread_metadata", return_value={}) as meta_mock, \
+             mock.patch.object(reddit_enrich, "enrich_reddit_item") as enrich_mock:
+            result = reddit_enrich.enrich_reddit_items(items, comment_threads=0)
+
+        meta_mock.assert_called_once()
+        self.assertEqual(meta_mock.call_args[0][0], [])
+        enrich_mock.assert_not_called()
+        self.assertEqual(result[0]["engagement"], {"score": 5})
+
+    def test_search_subreddits_keeps_engagement(self):
+        from lib import openai_reddit
+
+        listing = {"data": {"children": [{"kind": "t3", "data": {
+            "title": "Thread", "permalink": "/r/t/comments/a1/thread/", "subreddit": "t",
+            "score": 120, "num_comments": 33, "upvote_ratio": 0.97, "created_utc": 1768435200,
+        }}]}}
+        with mock.patch.object(http, "get", return_value=listing):
+            items = openai_reddit.search_subreddits(["t"], "topic", "2026-01-01", "2026-01-31")
+
+        self.assertEqual(items[0]["engagement"], {"score": 120, "num_comments": 33, "upvote_ratio": 0.97})
+        self.assertEqual(items[0]["date"], "2026-01-15")
+        self.assertEqual(items[0]["metadata_source"], "listing")
+
+
+class TestTrimmedThreadFetch(unittest.TestCase):
+    def test_requests_top_level_comments_only(self):
+        with mock.patch.object(http, "get", return_value=[]) as get_mock:
+            reddit_enrich.fetch_thread_data("https://www.reddit.com/r/t/comments/a1/x/")
+
+        url = get_mock.call_args.args[0]
+        self.assertTrue(url.startswith("https://www.reddit.com/r/t/comments/a1/x.json?"))
+        self.assertIn("raw_json=1", url)
+        self.assertIn("sort=top", url)
+        self.assertIn("depth=1", url)
+        self.assertIn("limit=25", url)
+
+    def test_parse_stops_at_max_comments(self):
+        comments = [{"kind": "t1", "data": {"body": f"c{i}", "author": "a"}} for i in range(50)]
+        data = [MOCK_THREAD[0], {"data": {"children": comments}}]
+        parsed = reddit_enrich.parse_thread_data(data, max_comments=5)
+        self.assertEqual([c["body"] for c in parsed["comments"]], ["c0", "c1", "c2", "c3", "c4"])
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_is_immediate(self):
+        bucket = http.TokenBucket(rate=1.0, burst=3)
+        with mock.patch.object(http.time, "sleep") as sleep_mock:
+            for _ in range(3):
+                bucket.acquire()
+        sleep_mock.assert_not_called()
+
+    def test_waits_when_empty(self):
+        bucket = http.TokenBucket(rate=1000.0, burst=1)
+        bucket.acquire()
+        bucket.acquire()  # Must wait ~1ms for a refill, not fail
+        self.assertLess(bucket.tokens, 1)
+
+    def test_reddit_hosts_share_bucket(self):
+        self.assertIs(http._get_bucket("www.reddit.com"), http._get_bucket("old.reddit.com"))
+        self.assertIsNone(http._get_bucket("api.openai.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,6 +59,43 @@ class TestRenderCompact(unittest.TestCase):
         self.assertIn("Test Thread", result)
         self.assertIn("r/test", result)
 
+    def test_keeps_report_order(self):
+        # main() can fall back to the top Reddit items by relevance; the
+        # render must not re-rank them by score
+        report = schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="reddit-only",
+            reddit=[
+                schema.RedditItem(id="R1", title="B", url="", subreddit="test", relevance=0.95, score=10),
+                schema.RedditItem(id="R2", title="A", url="", subreddit="test", relevance=0.90, score=0),
+                schema.RedditItem(id="R3", title="C", url="", subreddit="test", relevance=0.85, score=30),
+            ],
+        )
+
+        compact = render.render_compact(report, limit=2)
+
+        self.assertLess(compact.index("**R1**"), compact.index("**R2**"))
+        self.assertNotIn("**R3**", compact)
+
+    def test_reddit_error_keeps_items(self):
+        report = schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="reddit-only",
+            reddit=[schema.RedditItem(id="R1", title="Kept", url="", subreddit="test")],
+            reddit_error="Reddit enrichment degraded: Circuit open for reddit",
+        )
+
+        result = render.render_compact(report)
+
+        self.assertEqual(result.count("### Reddit Threads"), 1)
+        self.assertLess(result.index("**ERROR:** Reddit enrichment degraded"), result.index("**R1**"))
+
     def test_shows_coverage_tip_for_reddit_only(self):
         report = schema.Report(
             topic="test",
@@ -84,6 +121,21 @@ class TestRenderCompact(unittest.TestCase):
         result = render.render_compact(report)
         self.assertIn("assistant will search blogs, docs & news", result)
 
+    def test_flags_partial_results(self):
+        report = schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="both",
+            truncated=["Reddit enrichment", "supplemental search skipped"],
+        )
+
+        result = render.render_compact(report)
+        self.assertIn("PARTIAL RESULTS", result)
+        self.assertIn("Reddit enrichment; supplemental search skipped", result)
+        self.assertEqual(schema.Report.from_dict(report.to_dict()).truncated, report.truncated)
+
 
 class TestRenderContextSnippet(unittest.TestCase):
     def test_renders_snippet(self):
@@ -100,6 +152,31 @@ class TestRenderContextSnippet(unittest.TestCase):
         self.assertIn("Claude Code Skills", result)
         self.assertIn("Last 30 Days", result)
 
+    def test_key_sources_are_top_seven_by_score(self):
+        report = schema.Report(
+            topic="test",
+            range_from="2026-01-01",
+            range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z",
+            mode="both",
+            reddit=[
+                schema.RedditItem(id=f"R{i}", title=f"Reddit {i}", url="", subreddit="test", score=score)
+                for i, score in enumerate([50, 10, 70, 50, 5], 1)
+            ],
+            x=[
+                schema.XItem(id=f"X{i}", text=f"Post {i}", url="", author_handle="a", score=score)
+                for i, score in enumerate([60, 50, 1], 1)
+            ],
+        )
+
+        result = render.render_context_snippet(report)
+
+        shown = [line for line in result.splitlines() if line.startswith("- [")]
+        self.assertEqual(
+            [line.split("] ", 1)[1].split("...")[0] for line in shown],
+            ["Reddit 3", "Post 1", "Reddit 1", "Reddit 4", "Post 2", "Reddit 2", "Reddit 5"],
+        )
+
 
 class TestRenderFullReport(unittest.TestCase):
     def test_renders_full_report(self):
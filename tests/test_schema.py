@@ -0,0 +1,63 @@
+"""Tests for schema module."""
+
+import copy
+import pickle
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema
+
+
+def _report():
+    report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+    report.reddit = [schema.RedditItem(
+        id="R1",
+        title="Thread",
+        url="https://reddit.com/r/test/1",
+        subreddit="test",
+        date="2026-01-15",
+        date_confidence="high",
+        engagement=schema.Engagement(score=120, num_comments=30, upvote_ratio=0.9),
+        top_comments=[schema.Comment(score=5, date="2026-01-15", author="a", excerpt="Hi", url="")],
+        comment_insights=["Insight"],
+        relevance=0.8,
+        why_relevant="On topic",
+        subs=schema.SubScores(relevance=80, recency=50, engagement=70),
+        score=72,
+    )]
+    report.x = [schema.XItem(
+        id="X1",
+        text="Post",
+        url="https://x.com/u/status/1",
+        author_handle="u",
+        engagement=schema.Engagement(likes=10, reposts=2),
+        score=40,
+    )]
+    return report
+
+
+class TestItemClasses(unittest.TestCase):
+    @unittest.skipUnless(sys.version_info >= (3, 10), "dataclass slots need Python 3.10+")
+    def test_items_have_no_instance_dict(self):
+        report = _report()
+        for obj in (report.reddit[0], report.reddit[0].engagement, report.reddit[0].subs,
+                    report.reddit[0].top_comments[0], report.x[0]):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_round_trip(self):
+        data = _report().to_dict()
+        self.assertEqual(schema.Report.from_dict(data).to_dict(), data)
+
+    def test_copy_and_pickle(self):
+        item = _report().reddit[0]
+        for clone in (copy.deepcopy(item), pickle.loads(pickle.dumps(item))):
+            self.assertEqual(clone, item)
+            self.assertEqual(clone.to_dict(), item.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
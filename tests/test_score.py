@@ -1,5 +1,8 @@
 """Tests for score module."""
 
+import copy
+import math
+import random
 import sys
 import unittest
 from datetime import datetime, timezone
@@ -8,7 +11,7 @@ from pathlib import Path
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import schema, score
+from lib import dates, schema, score
 
 
 class TestLog1pSafe(unittest.TestCase):
@@ -115,6 +118,16 @@ class TestScoreRedditItems(unittest.TestCase):
         result = score.score_reddit_items([])
         self.assertEqual(result, [])
 
+    def test_date_context_fixes_today(self):
+        ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+        items = [
+            schema.RedditItem(id="R1", title="Test", url="", subreddit="test", date="2026-01-16", relevance=0.5),
+        ]
+
+        result = score.score_reddit_items(items, ctx)
+
+        self.assertEqual(result[0].subs.recency, 50)
+
 
 class TestScoreXItems(unittest.TestCase):
     def test_scores_items(self):
@@ -164,5 +177,127 @@ class TestSortItems(unittest.TestCase):
         self.assertEqual(len(result), 2)
 
 
+class TestScoreEngine(unittest.TestCase):
+    def _items(self, source, n, seed=0):
+        rng = random.Random(seed)
+        maybe = lambda value: None if rng.random() < 0.15 else value
+        items = []
+        for i in range(n):
+            date = rng.choice([None, "bad", "2025-11-20", f"2026-01-{rng.randint(1, 31):02d}"])
+            confidence = rng.choice(["high", "med", "low"])
+            relevance = rng.choice([0, 1, rng.random()])
+            if source == "reddit":
+                engagement = maybe(schema.Engagement(
+                    score=maybe(rng.randint(-5, 5000)),
+                    num_comments=maybe(rng.randint(0, 900)),
+                    upvote_ratio=maybe(rng.choice([0.0, rng.random()])),
+                ))
+                items.append(schema.RedditItem(id=f"R{i}", title="", url="", subreddit="", date=date,
+                                               date_confidence=confidence, engagement=engagement, relevance=relevance))
+            elif source == "x":
+                engagement = maybe(schema.Engagement(
+                    likes=maybe(rng.randint(0, 50000)),
+                    reposts=maybe(rng.randint(0, 5000)),
+                    replies=maybe(rng.randint(0, 500)),
+                    quotes=maybe(rng.randint(0, 100)),
+                ))
+                items.append(schema.XItem(id=f"X{i}", text="", url="", author_handle="", date=date,
+                                          date_confidence=confidence, engagement=engagement, relevance=relevance))
+            else:
+                items.append(schema.WebSearchItem(id=f"W{i}", title="", url="", source_domain="", snippet="",
+                                                  date=date, date_confidence=confidence, relevance=relevance))
+        return items
+
+    def _scores(self, items):
+        return [(i.score, i.subs.relevance, i.subs.recency, i.subs.engagement) for i in items]
+
+    def test_engagement_terms_match_formulas(self):
+        compute = {"reddit": score.compute_reddit_engagement_raw, "x": score.compute_x_engagement_raw}
+        for source, raw_fn in compute.items():
+            for item in self._items(source, 200):
+                eng = item.engagement
+                expected = raw_fn(eng)
+                if expected is None:
+                    continue
+                raw = 0.0
+                for field, weight, transform in score.ENGAGEMENT_TERMS[source]:
+                    value = getattr(eng, field)
+                    if transform == "log1p":
+                        raw += weight * (math.log1p(value) if value is not None and value >= 0 else 0.0)
+                    else:
+                        raw += weight * ((value or 0.5) * 10)
+                self.assertEqual(raw, expected)
+
+    def test_all_unknown_engagement_scores_50(self):
+        items = self._items("reddit", 3)
+        for item in items:
+            item.engagement = None
+        score.score_items(items, "reddit", engine="python")
+        self.assertEqual([i.subs.engagement for i in items], [50, 50, 50])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            score.score_items([], "reddit", engine="fortran")
+
+    @unittest.skipUnless(score.np is not None, "NumPy not installed")
+    def test_numpy_matches_python(self):
+        ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+        for source in ("reddit", "x", "web"):
+            for n in (1, 2, 7, 500):
+                items = self._items(source, n, seed=n)
+                python_items = score.score_items(copy.deepcopy(items), source, ctx, engine="python")
+                numpy_items = score.score_items(copy.deepcopy(items), source, ctx, engine="numpy")
+                self.assertEqual(self._scores(numpy_items), self._scores(python_items))
+
+
+class TestIncrementalScorer(unittest.TestCase):
+    _items = TestScoreEngine._items
+    _scores = TestScoreEngine._scores
+
+    def test_matches_batch_after_every_add(self):
+        ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+        rng = random.Random(3)
+        for source in ("reddit", "x", "web"):
+            items = self._items(source, 120, seed=5)
+            for item in items:
+                if item.date == "bad":
+                    item.date = None  # sort_key needs YYYY-MM-DD or None
+            scorer = score.IncrementalScorer(source, ctx)
+            added = []
+            while len(added) < len(items):
+                batch = items[len(added):len(added) + rng.randint(1, 15)]
+                scorer.add(batch)
+                added.extend(batch)
+
+                expected = score.score_items(copy.deepcopy(added), source, ctx, engine="python")
+                self.assertEqual(self._scores(added), self._scores(expected))
+                self.assertEqual(
+                    [i.id for i in scorer.ranked()],
+                    [i.id for i in score.sort_items(expected)],
+                )
+            self.assertEqual(len(scorer), len(items))
+
+    def test_rescores_only_when_bounds_move(self):
+        ctx = dates.DateContext("2026-01-01", "2026-01-31", today="2026-01-31")
+
+        def item(i, ups):
+            return schema.RedditItem(
+                id=f"R{i}", title=f"T{i}", url="", subreddit="", date="2026-01-20",
+                engagement=schema.Engagement(score=ups, num_comments=ups, upvote_ratio=0.9),
+            )
+
+        scorer = score.IncrementalScorer("reddit", ctx)
+        self.assertTrue(scorer.add([item(1, 10), item(2, 1000)]))
+        self.assertFalse(scorer.add([item(3, 100)]))
+        self.assertFalse(scorer.add([]))
+        self.assertTrue(scorer.add([item(4, 5000)]))
+        self.assertEqual(scorer.rescores, 2)
+        self.assertEqual([i.id for i in scorer.ranked(2)], ["R4", "R2"])
+
+    def test_unknown_source(self):
+        with self.assertRaises(ValueError):
+            score.IncrementalScorer("mastodon")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for serialize module."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema, serialize
+
+AVAILABLE = [b for b in serialize.BACKENDS if serialize._available(b)]
+
+SAMPLE = {
+    "topic": "café ☕",
+    "url": "https://x.com/u/status/1",
+    "items": [{"score": 72, "relevance": 0.85, "date": None, "ok": True}],
+    "empty": {},
+}
+
+
+class TestSerialize(unittest.TestCase):
+    def test_round_trip_every_backend(self):
+        for backend in AVAILABLE:
+            for pretty in (False, True):
+                text = serialize.dumps(SAMPLE, pretty=pretty, backend=backend)
+                self.assertEqual(serialize.loads(text, backend=backend), SAMPLE, backend)
+                self.assertEqual(serialize.loads(text.encode("utf-8"), backend=backend), SAMPLE, backend)
+
+    def test_compact_and_pretty_layout(self):
+        for backend in AVAILABLE:
+            compact = serialize.dumps(SAMPLE, backend=backend)
+            self.assertNotIn("\n", compact, backend)
+            self.assertNotIn('": ', compact, backend)
+            self.assertIn("café ☕", compact, backend)
+            self.assertIn("https://x.com/u/status/1", compact, backend)
+            pretty = serialize.dumps(SAMPLE, pretty=True, backend=backend)
+            self.assertIn('\n  "topic": ', pretty, backend)
+
+    def test_malformed_raises_value_error(self):
+        for backend in AVAILABLE:
+            with self.assertRaises(ValueError, msg=backend):
+                serialize.loads('{"topic": ', backend=backend)
+
+    def test_unencodable_falls_back_to_stdlib(self):
+        big = {"n": 2 ** 70}
+        for backend in AVAILABLE:
+            self.assertEqual(serialize.loads(serialize.dumps(big, backend=backend), backend="json"), big)
+
+    def test_env_selects_backend(self):
+        with mock.patch.dict(os.environ, {"LAST30DAYS_JSON_BACKEND": "json"}):
+            self.assertEqual(serialize.get_backend(), "json")
+        with mock.patch.dict(os.environ, {"LAST30DAYS_JSON_BACKEND": "nope"}):
+            self.assertEqual(serialize.get_backend(), AVAILABLE[0])
+
+    def test_dump_and_load_report(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        report.x = [schema.XItem(id="X1", text="Post ✨", url="", author_handle="u", score=40)]
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "report.json"
+            serialize.dump(report.to_dict(), path)
+            loaded = serialize.load(path)
+        self.assertEqual(schema.Report.from_dict(loaded).to_dict(), report.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
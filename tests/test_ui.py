@@ -0,0 +1,69 @@
+"""Tests for ui module."""
+
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import ui
+
+
+class TestConcurrentSourceProgress(unittest.TestCase):
+    def _display(self, tty: bool):
+        patch = mock.patch.object(ui, "IS_TTY", tty)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.stderr = io.StringIO()
+        redirect = contextlib.redirect_stderr(self.stderr)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+        return ui.ProgressDisplay("topic", show_banner=False)
+
+    def test_reddit_and_x_share_one_spinner(self):
+        progress = self._display(tty=True)
+        progress.start_reddit()
+        spinner = progress.source_spinner
+        progress.start_x()
+        self.assertIs(progress.source_spinner, spinner)
+        self.assertIn("Reddit", spinner.message)
+        self.assertIn("X", spinner.message)
+
+        progress.end_reddit(3)
+        self.assertIs(progress.source_spinner, spinner)
+        self.assertNotIn("Reddit", spinner.message)
+        self.assertIn("Found 3 threads", self.stderr.getvalue())
+
+        progress.end_x(2)
+        self.assertIsNone(progress.source_spinner)
+        self.assertFalse(spinner.running)
+        self.assertIn("Found 2 posts", self.stderr.getvalue())
+
+    def test_enrich_progress_keeps_x_state(self):
+        progress = self._display(tty=True)
+        progress.start_x()
+        progress.start_reddit_enrich(1, 10)
+        progress.update_reddit_enrich(5, 10)
+        self.assertIn("[5/10]", progress.source_spinner.message)
+        self.assertIn("X", progress.source_spinner.message)
+        progress.end_reddit_enrich()
+        progress.end_x(0)
+        self.assertIsNone(progress.source_spinner)
+
+    def test_non_tty_prints_each_step_once(self):
+        progress = self._display(tty=False)
+        progress.start_reddit()
+        progress.start_x()
+        progress.end_x(2)
+        progress.end_reddit(3)
+        lines = self.stderr.getvalue().splitlines()
+        self.assertEqual([line[0] for line in lines], ["⏳", "⏳", "✓", "✓"])
+        self.assertIsNone(progress.source_spinner)
+
+
+if __name__ == "__main__":
+    unittest.main()